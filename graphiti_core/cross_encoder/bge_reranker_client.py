@@ -15,30 +15,190 @@ limitations under the License.
 """
 
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from sentence_transformers import CrossEncoder
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+DEFAULT_MAX_WORKERS = 1
+
+_RankRequest = tuple[list[list[str]], asyncio.Future]
+
 
 class BGERerankerClient(CrossEncoderClient):
-    def __init__(self):
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        Initialize the BGERerankerClient.
+
+        Concurrent rank calls are coalesced into a single predict batch. A batch is closed once it
+        holds max_batch_size (query, passage) pairs or max_wait_ms after its first request, and
+        is scored on a dedicated pool of max_workers threads. While every worker is busy new
+        requests keep queueing, so batches grow with the load instead of the number of forward
+        passes.
+
+        Args:
+            max_batch_size (int): The number of pairs after which a batch is closed, also used as the predict batch size.
+            max_wait_ms (float): How long a batch waits for further requests after its first one.
+            max_workers (int): The number of threads running predict batches concurrently.
+        """
         self.model = CrossEncoder('BAAI/bge-reranker-v2-m3')
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='bge-reranker'
+        )
+        self._workers: asyncio.Semaphore | None = None
+        self._queue: asyncio.Queue[_RankRequest] | None = None
+        self._batch_task: asyncio.Task | None = None
+        # asyncio only keeps weak references to tasks, so in-flight batches are held here
+        self._predict_tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         if not passages:
             return []
 
         input_pairs = [[query, passage] for passage in passages]
-
-        # Run the synchronous predict method in an executor
-        loop = asyncio.get_running_loop()
-        scores = await loop.run_in_executor(None, self.model.predict, input_pairs)
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait((input_pairs, future))
+        scores = await future
 
         ranked_passages = sorted(
-            [(passage, float(score)) for passage, score in zip(passages, scores)],
+            [(passage, score) for passage, score in zip(passages, scores)],
             key=lambda x: x[1],
             reverse=True,
         )
 
         return ranked_passages
+
+    async def close(self):
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
+        self.executor.shutdown(wait=False)
+
+    def _get_queue(self) -> asyncio.Queue[_RankRequest]:
+        # The batching loop is bound to the event loop of the first rank call
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._workers = asyncio.Semaphore(self.max_workers)
+            self._batch_task = loop.create_task(self._run_batches(self._queue, self._workers))
+            self._batch_task.add_done_callback(partial(self._on_batches_done, self._queue))
+
+        return self._queue
+
+    async def _run_batches(self, queue: asyncio.Queue[_RankRequest], workers: asyncio.Semaphore):
+        loop = asyncio.get_running_loop()
+        while True:
+            # while every worker is busy, requests keep queueing for the next batch
+            await workers.acquire()
+
+            requests: list[_RankRequest] = []
+            try:
+                requests.append(await queue.get())
+                pair_count = len(requests[0][0])
+                deadline = loop.time() + self.max_wait_ms / 1000
+                while pair_count < self.max_batch_size:
+                    request = await self._get_request(queue, deadline - loop.time())
+                    if request is None:
+                        break
+                    requests.append(request)
+                    pair_count += len(request[0])
+            except BaseException as e:
+                # the collected requests are no longer queued, so they are resolved here
+                workers.release()
+                for _, future in requests:
+                    if future.done():
+                        continue
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+                raise
+
+            predict_task = loop.create_task(self._predict(requests, workers))
+            self._predict_tasks.add(predict_task)
+            predict_task.add_done_callback(self._predict_tasks.discard)
+
+    async def _get_request(
+        self, queue: asyncio.Queue[_RankRequest], timeout: float
+    ) -> _RankRequest | None:
+        """Wait up to timeout seconds for the next request, returning None if none arrives."""
+        if timeout <= 0:
+            return None
+
+        # asyncio.wait does not raise on timeout, unlike wait_for whose TimeoutError is not the
+        # builtin one before Python 3.11
+        get_task = asyncio.ensure_future(queue.get())
+        try:
+            done, _ = await asyncio.wait({get_task}, timeout=timeout)
+        except BaseException:
+            get_task.cancel()
+            raise
+        if done:
+            return get_task.result()
+
+        # a request that arrived while the wait timed out is kept for this batch
+        if not get_task.cancel():
+            return get_task.result()
+        return None
+
+    def _on_batches_done(self, queue: asyncio.Queue[_RankRequest], task: asyncio.Task):
+        # A new batching loop is started by the next rank call
+        if self._queue is queue:
+            self._queue = None
+
+        error = None
+        if not task.cancelled():
+            error = task.exception() or RuntimeError('Reranker batching loop stopped')
+            logger.error(f'Reranker batching loop failed: {error}')
+
+        # the requests still queued would otherwise wait forever
+        while not queue.empty():
+            _, future = queue.get_nowait()
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def _predict(self, requests: list[_RankRequest], workers: asyncio.Semaphore):
+        try:
+            input_pairs = [pair for request_pairs, _ in requests for pair in request_pairs]
+            scores = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                partial(self.model.predict, input_pairs, batch_size=self.max_batch_size),
+            )
+        except Exception as e:
+            logger.error(f'Error in reranker predict batch: {e}')
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            workers.release()
+
+        offset = 0
+        for request_pairs, future in requests:
+            # requests cancelled by their caller are skipped
+            if not future.done():
+                future.set_result(
+                    [float(score) for score in scores[offset : offset + len(request_pairs)]]
+                )
+            offset += len(request_pairs)
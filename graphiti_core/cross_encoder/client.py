@@ -16,6 +16,10 @@ limitations under the License.
 
 from abc import ABC, abstractmethod
 
+from graphiti_core.helpers import LRUCache
+
+DEFAULT_RERANK_SCORE_CACHE_SIZE = 4096
+
 
 class CrossEncoderClient(ABC):
     """
@@ -38,3 +42,33 @@ class CrossEncoderClient(ABC):
                                      sorted in descending order of relevance.
         """
         pass
+
+
+class RerankScoreCache:
+    """
+    Bounded LRU cache of the relevance scores of (query, passage) pairs.
+
+    Scores are only comparable within one reranker, so a cache must not be shared between
+    rerankers that score passages differently.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RERANK_SCORE_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._scores = LRUCache(max_size=max_size)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def get(self, query: str, passage: str) -> float | None:
+        score: float | None = self._scores.get((query, passage))
+        if score is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return score
+
+    def set(self, query: str, passage: str, score: float):
+        self._scores.set((query, passage), score)
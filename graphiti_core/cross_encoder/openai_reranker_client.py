@@ -15,41 +15,80 @@ limitations under the License.
 """
 
 import logging
+import math
 from typing import Any
 
 import openai
 from openai import AsyncAzureOpenAI, AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, RateLimitError
 from ..prompts import Message
-from .client import CrossEncoderClient
+from .client import CrossEncoderClient, RerankScoreCache
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = 'gpt-4o-mini'
+MAX_RELEVANCE = 10
 
 
 class BooleanClassifier(BaseModel):
     isTrue: bool
 
 
+class PassageRelevance(BaseModel):
+    passage_id: int = Field(..., description='id of the passage')
+    relevance: int = Field(
+        ...,
+        description=f'relevance of the passage to the query, from 0 (unrelated) to {MAX_RELEVANCE} '
+        '(directly answers the query)',
+    )
+
+
+class PassageRelevances(BaseModel):
+    passages: list[PassageRelevance]
+
+
+def get_relevance_probability(response: Any) -> float:
+    """Probability that the boolean classifier answered True, 0 if the response has no logprobs."""
+    logprobs = response.choices[0].logprobs
+    if logprobs is None or not logprobs.content:
+        logger.warning('Reranker response has no logprobs, scoring the passage as irrelevant')
+        return 0.0
+
+    for top_logprob in logprobs.content[0].top_logprobs:
+        token = top_logprob.token.strip().lower()
+        if token == 'true':
+            return math.exp(top_logprob.logprob)
+        if token == 'false':
+            return 1 - math.exp(top_logprob.logprob)
+
+    return 0.0
+
+
 class OpenAIRerankerClient(CrossEncoderClient):
     def __init__(
         self,
         config: LLMConfig | None = None,
         client: AsyncOpenAI | AsyncAzureOpenAI | None = None,
+        batch_size: int | None = None,
+        score_cache: RerankScoreCache | None = None,
     ):
         """
         Initialize the OpenAIRerankerClient with the provided configuration and client.
 
-        This reranker uses the OpenAI API to run a simple boolean classifier prompt concurrently
-        for each passage. Log-probabilities are used to rank the passages.
+        By default this reranker uses the OpenAI API to run a simple boolean classifier prompt
+        concurrently for each passage. The probability of a True answer, read from the
+        log-probabilities, is used to rank the passages. With a batch_size, passages are instead
+        rated together in requests of up to batch_size passages, so the number of requests no
+        longer grows with every passage.
 
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (AsyncOpenAI | AsyncAzureOpenAI | None): An optional async client instance to use. If not provided, a new AsyncOpenAI client is created.
+            batch_size (int | None): The number of passages rated per request. If not provided, each passage is classified in its own request.
+            score_cache (RerankScoreCache | None): Cache of the scores of (query, passage) pairs. If not provided, a new RerankScoreCache is created.
         """
         if config is None:
             config = LLMConfig()
@@ -59,63 +98,118 @@ class OpenAIRerankerClient(CrossEncoderClient):
             self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
         else:
             self.client = client
+        self.batch_size = batch_size
+        self.score_cache = score_cache if score_cache is not None else RerankScoreCache()
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
-        openai_messages_list: Any = [
-            [
-                Message(
-                    role='system',
-                    content='You are an expert tasked with determining whether the passage is relevant to the query',
-                ),
-                Message(
-                    role='user',
-                    content=f"""
-                           Respond with "True" if PASSAGE is relevant to QUERY and "False" otherwise.
-                           <PASSAGE>
-                           {passage}
-                           </PASSAGE>
-                           <QUERY>
-                           {query}
-                           </QUERY>
-                           """,
-                ),
-            ]
-            for passage in passages
-        ]
+        unique_passages = list(dict.fromkeys(passages))
+
+        scores: dict[str, float] = {}
+        uncached_passages: list[str] = []
+        for passage in unique_passages:
+            score = self.score_cache.get(query, passage)
+            if score is None:
+                uncached_passages.append(passage)
+            else:
+                scores[passage] = score
+
         try:
-            responses = await semaphore_gather(
-                *[
-                    self.client.chat.completions.create(
-                        model=DEFAULT_MODEL,
-                        messages=openai_messages,
-                        temperature=0,
-                        max_tokens=1,
-                        logit_bias={'6432': 1, '7983': 1},
-                        logprobs=True,
-                        top_logprobs=2,
-                    )
-                    for openai_messages in openai_messages_list
+            if self.batch_size is None:
+                new_scores = await semaphore_gather(
+                    *[self._classify_passage(query, passage) for passage in uncached_passages]
+                )
+            else:
+                batches = [
+                    uncached_passages[i : i + self.batch_size]
+                    for i in range(0, len(uncached_passages), self.batch_size)
                 ]
-            )
-
-            responses_top_logprobs = [
-                response.choices[0].logprobs.content[0].top_logprobs
-                if response.choices[0].logprobs is not None
-                and response.choices[0].logprobs.content is not None
-                else []
-                for response in responses
-            ]
-            scores: list[float] = []
-            for top_logprobs in responses_top_logprobs:
-                for logprob in top_logprobs:
-                    if bool(logprob.token):
-                        scores.append(logprob.logprob)
-
-            results = [(passage, score) for passage, score in zip(passages, scores)]
-            results.sort(reverse=True, key=lambda x: x[1])
-            return results
+                batch_scores = await semaphore_gather(
+                    *[self._rate_passages(query, batch) for batch in batches]
+                )
+                new_scores = [score for batch in batch_scores for score in batch]
         except openai.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
             raise
+
+        for passage, score in zip(uncached_passages, new_scores):
+            scores[passage] = score
+            self.score_cache.set(query, passage, score)
+
+        results = [(passage, scores[passage]) for passage in unique_passages]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+    async def _classify_passage(self, query: str, passage: str) -> float:
+        openai_messages: Any = [
+            Message(
+                role='system',
+                content='You are an expert tasked with determining whether the passage is relevant to the query',
+            ),
+            Message(
+                role='user',
+                content=f"""
+                       Respond with "True" if PASSAGE is relevant to QUERY and "False" otherwise.
+                       <PASSAGE>
+                       {passage}
+                       </PASSAGE>
+                       <QUERY>
+                       {query}
+                       </QUERY>
+                       """,
+            ),
+        ]
+        response = await self.client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            messages=openai_messages,
+            temperature=0,
+            max_tokens=1,
+            logit_bias={'6432': 1, '7983': 1},
+            logprobs=True,
+            top_logprobs=2,
+        )
+
+        return get_relevance_probability(response)
+
+    async def _rate_passages(self, query: str, passages: list[str]) -> list[float]:
+        passages_context = '\n'.join(
+            f'<PASSAGE id="{i}">\n{passage}\n</PASSAGE>' for i, passage in enumerate(passages)
+        )
+        openai_messages: Any = [
+            Message(
+                role='system',
+                content='You are an expert tasked with rating how relevant passages are to a query',
+            ),
+            Message(
+                role='user',
+                content=f"""
+                       Rate the relevance of each PASSAGE to QUERY from 0 to {MAX_RELEVANCE}.
+                       Rate every passage independently, and return one rating per passage id.
+                       {passages_context}
+                       <QUERY>
+                       {query}
+                       </QUERY>
+                       """,
+            ),
+        ]
+        response = await self.client.beta.chat.completions.parse(
+            model=DEFAULT_MODEL,
+            messages=openai_messages,
+            temperature=0,
+            response_format=PassageRelevances,
+        )
+
+        # passages the response leaves out are scored as irrelevant
+        scores = [0.0] * len(passages)
+        relevances = response.choices[0].message.parsed
+        if relevances is None:
+            logger.warning('Reranker returned no ratings, scoring the passages as irrelevant')
+            return scores
+
+        for rating in relevances.passages:
+            if 0 <= rating.passage_id < len(passages):
+                relevance = min(max(rating.relevance, 0), MAX_RELEVANCE)
+                scores[rating.passage_id] = relevance / MAX_RELEVANCE
+
+        return scores
@@ -499,3 +499,15 @@ def get_community_edge_from_record(record: Any):
         target_node_uuid=record['target_node_uuid'],
         created_at=record['created_at'].to_native(),
     )
+
+
+async def create_entity_edge_embeddings(embedder: EmbedderClient, edges: list[EntityEdge]):
+    if len(edges) == 0:
+        return
+
+    start = time()
+    fact_embeddings = await embedder.create_batch([edge.fact.replace('\n', ' ') for edge in edges])
+    for edge, fact_embedding in zip(edges, fact_embeddings, strict=True):
+        edge.fact_embedding = fact_embedding
+    end = time()
+    logger.debug(f'embedded {len(edges)} facts in {end - start} ms')
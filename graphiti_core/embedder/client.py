@@ -19,6 +19,8 @@ from collections.abc import Iterable
 
 from pydantic import BaseModel, Field
 
+from graphiti_core.helpers import semaphore_gather
+
 EMBEDDING_DIM = 1024
 
 
@@ -32,3 +34,14 @@ class EmbedderClient(ABC):
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
         pass
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """
+        Embed a list of texts, returning one embedding per input in the same order.
+
+        Clients that support batched requests should override this; the default issues one
+        create call per text.
+        """
+        return await semaphore_gather(
+            *[self.create(input_data=[input_data]) for input_data in input_data_list]
+        )
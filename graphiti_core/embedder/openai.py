@@ -20,9 +20,13 @@ from typing import Union
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types import EmbeddingModel
 
+from graphiti_core.helpers import semaphore_gather
+
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
+# OpenAI accepts at most 2048 inputs per embeddings request
+EMBEDDING_BATCH_SIZE = 2048
 
 
 class OpenAIEmbedderConfig(EmbedderConfig):
@@ -59,3 +63,25 @@ class OpenAIEmbedder(EmbedderClient):
             input=input_data, model=self.config.embedding_model
         )
         return result.data[0].embedding[: self.config.embedding_dim]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if len(input_data_list) == 0:
+            return []
+
+        batches = [
+            input_data_list[i : i + EMBEDDING_BATCH_SIZE]
+            for i in range(0, len(input_data_list), EMBEDDING_BATCH_SIZE)
+        ]
+        results = await semaphore_gather(
+            *[
+                self.client.embeddings.create(input=batch, model=self.config.embedding_model)
+                for batch in batches
+            ]
+        )
+
+        embeddings: list[list[float]] = []
+        for result in results:
+            for embedding in sorted(result.data, key=lambda e: e.index):
+                embeddings.append(embedding.embedding[: self.config.embedding_dim])
+
+        return embeddings
@@ -19,9 +19,13 @@ from collections.abc import Iterable
 import voyageai  # type: ignore
 from pydantic import Field
 
+from graphiti_core.helpers import semaphore_gather
+
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'voyage-3'
+# VoyageAI accepts at most 128 inputs per embed request
+EMBEDDING_BATCH_SIZE = 128
 
 
 class VoyageAIEmbedderConfig(EmbedderConfig):
@@ -56,3 +60,21 @@ class VoyageAIEmbedder(EmbedderClient):
 
         result = await self.client.embed(input_list, model=self.config.embedding_model)
         return result.embeddings[0][: self.config.embedding_dim]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if len(input_data_list) == 0:
+            return []
+
+        batches = [
+            input_data_list[i : i + EMBEDDING_BATCH_SIZE]
+            for i in range(0, len(input_data_list), EMBEDDING_BATCH_SIZE)
+        ]
+        results = await semaphore_gather(
+            *[self.client.embed(batch, model=self.config.embedding_model) for batch in batches]
+        )
+
+        return [
+            embedding[: self.config.embedding_dim]
+            for result in results
+            for embedding in result.embeddings
+        ]
@@ -65,3 +65,11 @@ class SearchRerankerError(GraphitiError):
     def __init__(self, text: str):
         self.message = text
         super().__init__(self.message)
+
+
+class CheckpointMismatchError(GraphitiError):
+    """Raised when a checkpointed bulk ingestion job is resumed with different episodes."""
+
+    def __init__(self, job_id: str, window: int):
+        self.message = f'episodes of window {window} do not match the checkpoint of job {job_id}'
+        super().__init__(self.message)
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import AsyncIterable, Iterable
 from datetime import datetime
 from time import time
 
@@ -25,26 +26,52 @@ from typing_extensions import LiteralString
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
-from graphiti_core.edges import EntityEdge, EpisodicEdge
+from graphiti_core.edges import EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
-from graphiti_core.helpers import DEFAULT_DATABASE, semaphore_gather
+from graphiti_core.embedder.client import EMBEDDING_DIM
+from graphiti_core.helpers import DEFAULT_DATABASE, iterate_in_windows, semaphore_gather
 from graphiti_core.llm_client import LLMClient, OpenAIClient
-from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
-from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.nodes import (
+    CommunityNode,
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    create_community_node_embeddings,
+    create_entity_node_embeddings,
+    get_episode_content_hash,
+)
+from graphiti_core.search.query_embedding_cache import QueryEmbeddingCache
+from graphiti_core.search.search import SearchConfig, search, search_batch
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     EDGE_HYBRID_SEARCH_NODE_DISTANCE,
     EDGE_HYBRID_SEARCH_RRF,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_result_cache import SearchResultCache
 from graphiti_core.search.search_utils import (
     RELEVANT_SCHEMA_LIMIT,
     get_mentioned_nodes,
     get_relevant_edges,
-    get_relevant_nodes,
+    get_relevant_edges_bulk,
+    get_relevant_nodes_bulk,
+)
+from graphiti_core.utils.bulk_checkpoint import (
+    BulkCheckpointStore,
+    BulkIngestionStage,
+    BulkWindowCheckpoint,
+    CreatedEpisodes,
+    DedupedNodes,
+    ExtractedNodesAndEdges,
+    PersistedWindow,
+    ResolvedEdges,
+    get_window_fingerprint,
+    run_checkpointed_stage,
 )
 from graphiti_core.utils.bulk_utils import (
+    BULK_EPISODE_WINDOW_SIZE,
     RawEpisode,
+    add_communities_bulk,
     add_nodes_and_edges_bulk,
     dedupe_edges_bulk,
     dedupe_nodes_bulk,
@@ -54,12 +81,14 @@ from graphiti_core.utils.bulk_utils import (
     retrieve_previous_episodes_bulk,
 )
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.episode_window_cache import EpisodeWindowCache
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
     remove_communities,
     update_community,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
+    EdgeResolutionPolicy,
     build_episodic_edges,
     dedupe_extracted_edge,
     extract_edges,
@@ -72,6 +101,8 @@ from graphiti_core.utils.maintenance.graph_data_operations import (
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
+    NodeResolutionPolicy,
+    NodeResolutionStats,
     extract_nodes,
     resolve_extracted_nodes,
 )
@@ -98,6 +129,11 @@ class Graphiti:
         embedder: EmbedderClient | None = None,
         cross_encoder: CrossEncoderClient | None = None,
         store_raw_episode_content: bool = True,
+        node_resolution_policy: NodeResolutionPolicy | None = None,
+        edge_resolution_policy: EdgeResolutionPolicy | None = None,
+        episode_window_cache: EpisodeWindowCache | None = None,
+        query_embedding_cache: QueryEmbeddingCache | None = None,
+        search_result_cache: SearchResultCache | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -116,6 +152,28 @@ class Graphiti:
         llm_client : LLMClient | None, optional
             An instance of LLMClient for natural language processing tasks.
             If not provided, a default OpenAIClient will be initialized.
+        node_resolution_policy : NodeResolutionPolicy | None, optional
+            Rules for resolving extracted entities to existing ones without an LLM dedupe call.
+            If not provided, the default NodeResolutionPolicy is used. The number of decisions
+            taken by each path is tracked in node_resolution_stats.
+        edge_resolution_policy : EdgeResolutionPolicy | None, optional
+            Controls how extracted facts are resolved against existing edges, e.g. whether all
+            facts of an episode are resolved in batched LLM calls. If not provided, the default
+            EdgeResolutionPolicy is used.
+        episode_window_cache : EpisodeWindowCache | None, optional
+            In-memory cache of the most recent episodes of each group, consulted before reading
+            previous episodes from the graph. Pass the same cache to share it between instances.
+            The cache only sees the writes of the instances sharing it, so only use it when no
+            other process writes to the same groups. Episodes are read from the graph if not
+            provided.
+        query_embedding_cache : QueryEmbeddingCache | None, optional
+            Cache of search query embeddings, so that repeated queries skip the embedding call.
+            Pass the same cache to share it between instances. Search queries are embedded on
+            every call if not provided.
+        search_result_cache : SearchResultCache | None, optional
+            Cache of search results, invalidated per group by the writes of this instance. Pass
+            the same cache to share it between instances. Search results are not cached if not
+            provided.
 
         Returns
         -------
@@ -150,6 +208,16 @@ class Graphiti:
             self.cross_encoder = cross_encoder
         else:
             self.cross_encoder = OpenAIRerankerClient()
+        self.node_resolution_policy = (
+            node_resolution_policy if node_resolution_policy is not None else NodeResolutionPolicy()
+        )
+        self.node_resolution_stats = NodeResolutionStats()
+        self.edge_resolution_policy = (
+            edge_resolution_policy if edge_resolution_policy is not None else EdgeResolutionPolicy()
+        )
+        self.episode_window_cache = episode_window_cache
+        self.query_embedding_cache = query_embedding_cache
+        self.search_result_cache = search_result_cache
 
     async def close(self):
         """
@@ -183,6 +251,16 @@ class Graphiti:
         """
         await self.driver.close()
 
+    def invalidate_search_results(self, group_ids: list[str] | None = None):
+        """
+        Invalidate cached search results of the given groups, or of every group if None.
+
+        Writes made through this instance invalidate the results they affect. Call this after
+        changing the graph in any other way, e.g. by deleting nodes or edges directly.
+        """
+        if self.search_result_cache is not None:
+            self.search_result_cache.invalidate(group_ids)
+
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
         Build indices and constraints in the Neo4j database.
@@ -213,10 +291,14 @@ class Graphiti:
         of the `build_indices_and_constraints` function. Refer to that function's
         documentation for details on the exact database schema modifications.
 
+        Vector indices are sized to the embedding dimension of the configured embedder.
+
         Caution: Running this method on a large existing database may take some time
         and could impact database performance during execution.
         """
-        await build_indices_and_constraints(self.driver, delete_existing)
+        embedder_config = getattr(self.embedder, 'config', None)
+        embedding_dim = getattr(embedder_config, 'embedding_dim', EMBEDDING_DIM)
+        await build_indices_and_constraints(self.driver, delete_existing, embedding_dim)
 
     async def retrieve_episodes(
         self,
@@ -247,8 +329,14 @@ class Graphiti:
         Notes
         -----
         The actual retrieval is performed by the `retrieve_episodes` function
-        from the `graphiti_core.utils` module.
+        from the `graphiti_core.utils` module. Queries for a single group are answered
+        from the episode window cache when it holds the requested episodes.
         """
+        if self.episode_window_cache is not None and group_ids is not None and len(group_ids) == 1:
+            return await self.episode_window_cache.retrieve_episodes(
+                self.driver, reference_time, last_n, group_ids[0]
+            )
+
         return await retrieve_episodes(self.driver, reference_time, last_n, group_ids)
 
     async def add_episode(
@@ -262,6 +350,7 @@ class Graphiti:
         uuid: str | None = None,
         update_communities: bool = False,
         entity_types: dict[str, BaseModel] | None = None,
+        skip_if_duplicate: bool = False,
     ) -> AddEpisodeResults:
         """
         Process an episode and update the graph.
@@ -287,6 +376,10 @@ class Graphiti:
             Optional uuid of the episode.
         update_communities : bool
             Optional. Whether to update communities with new node information
+        skip_if_duplicate : bool
+            Optional. If an episode with the same group, content, source and reference time was
+            already ingested, return its results instead of processing the episode again.
+            Makes retried deliveries of the same episode idempotent.
 
         Returns
         -------
@@ -299,9 +392,9 @@ class Graphiti:
         and edge invalidation.
 
         It is recommended to run this method as a background process, such as in a queue.
-        It's important that each episode is added sequentially and awaited before adding
-        the next one. For web applications, consider using FastAPI's background tasks
-        or a dedicated task queue like Celery for this purpose.
+        It's important that each episode of a group is added sequentially and awaited before
+        adding the next one. IngestionScheduler (graphiti_core.utils.ingestion_scheduler)
+        enforces this per group while ingesting different groups concurrently.
 
         Example using FastAPI background tasks:
             @app.post("/add_episode")
@@ -315,6 +408,22 @@ class Graphiti:
             entity_edges: list[EntityEdge] = []
             now = utc_now()
 
+            content_hash = get_episode_content_hash(group_id, episode_body, source, reference_time)
+            if skip_if_duplicate:
+                duplicate_episodes = await EpisodicNode.get_by_content_hash(
+                    self.driver, content_hash
+                )
+                if duplicate_episodes:
+                    existing_episode = duplicate_episodes[0]
+                    logger.debug(f'Skipping duplicate of episode {existing_episode.uuid}')
+                    mentioned_nodes, existing_edges = await semaphore_gather(
+                        get_mentioned_nodes(self.driver, [existing_episode]),
+                        EntityEdge.get_by_uuids(self.driver, existing_episode.entity_edges),
+                    )
+                    return AddEpisodeResults(
+                        episode=existing_episode, nodes=mentioned_nodes, edges=existing_edges
+                    )
+
             previous_episodes = await self.retrieve_episodes(
                 reference_time, last_n=RELEVANT_SCHEMA_LIMIT, group_ids=[group_id]
             )
@@ -333,6 +442,7 @@ class Graphiti:
                     valid_at=reference_time,
                 )
             )
+            episode.content_hash = content_hash
 
             # Extract entities as nodes
 
@@ -343,18 +453,11 @@ class Graphiti:
 
             # Calculate Embeddings
 
-            await semaphore_gather(
-                *[node.generate_name_embedding(self.embedder) for node in extracted_nodes]
-            )
+            await create_entity_node_embeddings(self.embedder, extracted_nodes)
 
             # Find relevant nodes already in the graph
-            existing_nodes_lists: list[list[EntityNode]] = list(
-                await semaphore_gather(
-                    *[
-                        get_relevant_nodes(self.driver, SearchFilters(), [node])
-                        for node in extracted_nodes
-                    ]
-                )
+            existing_nodes_lists: list[list[EntityNode]] = await get_relevant_nodes_bulk(
+                self.driver, SearchFilters(), extracted_nodes
             )
 
             # Resolve extracted nodes with nodes already in the graph and extract facts
@@ -368,6 +471,8 @@ class Graphiti:
                     episode,
                     previous_episodes,
                     entity_types,
+                    self.node_resolution_policy,
+                    self.node_resolution_stats,
                 ),
                 extract_edges(
                     self.llm_client, episode, extracted_nodes, previous_episodes, group_id
@@ -381,27 +486,13 @@ class Graphiti:
             )
 
             # calculate embeddings
-            await semaphore_gather(
-                *[
-                    edge.generate_embedding(self.embedder)
-                    for edge in extracted_edges_with_resolved_pointers
-                ]
+            await create_entity_edge_embeddings(
+                self.embedder, extracted_edges_with_resolved_pointers
             )
 
             # Resolve extracted edges with related edges already in the graph
-            related_edges_list: list[list[EntityEdge]] = list(
-                await semaphore_gather(
-                    *[
-                        get_relevant_edges(
-                            self.driver,
-                            [edge],
-                            edge.source_node_uuid,
-                            edge.target_node_uuid,
-                            RELEVANT_SCHEMA_LIMIT,
-                        )
-                        for edge in extracted_edges_with_resolved_pointers
-                    ]
-                )
+            related_edges_list, existing_edges_list = await get_relevant_edges_bulk(
+                self.driver, extracted_edges_with_resolved_pointers, RELEVANT_SCHEMA_LIMIT
             )
             logger.debug(
                 f'Related edges lists: {[(e.name, e.uuid) for edges_lst in related_edges_list for e in edges_lst]}'
@@ -410,43 +501,6 @@ class Graphiti:
                 f'Extracted edges: {[(e.name, e.uuid) for e in extracted_edges_with_resolved_pointers]}'
             )
 
-            existing_source_edges_list: list[list[EntityEdge]] = list(
-                await semaphore_gather(
-                    *[
-                        get_relevant_edges(
-                            self.driver,
-                            [edge],
-                            edge.source_node_uuid,
-                            None,
-                            RELEVANT_SCHEMA_LIMIT,
-                        )
-                        for edge in extracted_edges_with_resolved_pointers
-                    ]
-                )
-            )
-
-            existing_target_edges_list: list[list[EntityEdge]] = list(
-                await semaphore_gather(
-                    *[
-                        get_relevant_edges(
-                            self.driver,
-                            [edge],
-                            None,
-                            edge.target_node_uuid,
-                            RELEVANT_SCHEMA_LIMIT,
-                        )
-                        for edge in extracted_edges_with_resolved_pointers
-                    ]
-                )
-            )
-
-            existing_edges_list: list[list[EntityEdge]] = [
-                source_lst + target_lst
-                for source_lst, target_lst in zip(
-                    existing_source_edges_list, existing_target_edges_list
-                )
-            ]
-
             resolved_edges, invalidated_edges = await resolve_extracted_edges(
                 self.llm_client,
                 extracted_edges_with_resolved_pointers,
@@ -454,6 +508,7 @@ class Graphiti:
                 existing_edges_list,
                 episode,
                 previous_episodes,
+                self.edge_resolution_policy,
             )
 
             entity_edges.extend(resolved_edges + invalidated_edges)
@@ -472,6 +527,8 @@ class Graphiti:
             await add_nodes_and_edges_bulk(
                 self.driver, [episode], episodic_edges, nodes, entity_edges
             )
+            if self.episode_window_cache is not None:
+                self.episode_window_cache.add_episodes([episode])
 
             # Update any communities
             if update_communities:
@@ -481,6 +538,8 @@ class Graphiti:
                         for node in nodes
                     ]
                 )
+            self.invalidate_search_results([group_id])
+
             end = time()
             logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
 
@@ -490,7 +549,12 @@ class Graphiti:
             raise e
 
     #### WIP: USE AT YOUR OWN RISK ####
-    async def add_episode_bulk(self, bulk_episodes: list[RawEpisode], group_id: str = ''):
+    async def add_episode_bulk(
+        self,
+        bulk_episodes: list[RawEpisode],
+        group_id: str = '',
+        checkpoint: BulkWindowCheckpoint | None = None,
+    ):
         """
         Process multiple episodes in bulk and update the graph.
 
@@ -503,6 +567,9 @@ class Graphiti:
             A list of RawEpisode objects to be processed and added to the graph.
         group_id : str | None
             An id for the graph partition the episode is a part of.
+        checkpoint : BulkWindowCheckpoint | None, optional
+            Records the output of each completed stage. When the same episodes are added again
+            with the same checkpoint, completed stages are loaded instead of being rerun.
 
         Returns
         -------
@@ -529,73 +596,133 @@ class Graphiti:
         """
         try:
             start = time()
-            now = utc_now()
 
-            episodes = [
-                EpisodicNode(
-                    name=episode.name,
-                    labels=[],
-                    source=episode.source,
-                    content=episode.content,
-                    source_description=episode.source_description,
-                    group_id=group_id,
-                    created_at=now,
-                    valid_at=episode.reference_time,
+            if checkpoint is not None:
+                await checkpoint.start(get_window_fingerprint(bulk_episodes, group_id))
+                if await checkpoint.load(BulkIngestionStage.persisted, PersistedWindow):
+                    return
+
+            async def create_episodes() -> CreatedEpisodes:
+                now = utc_now()
+                return CreatedEpisodes(
+                    episodes=[
+                        EpisodicNode(
+                            name=episode.name,
+                            labels=[],
+                            source=episode.source,
+                            content=episode.content,
+                            source_description=episode.source_description,
+                            group_id=group_id,
+                            created_at=now,
+                            valid_at=episode.reference_time,
+                            content_hash=get_episode_content_hash(
+                                group_id, episode.content, episode.source, episode.reference_time
+                            ),
+                        )
+                        for episode in bulk_episodes
+                    ]
+                )
+
+            # Episodes are recorded before they are saved so that a resumed job reuses their uuids
+            episodes = (
+                await run_checkpointed_stage(
+                    checkpoint,
+                    BulkIngestionStage.episodes_created,
+                    CreatedEpisodes,
+                    create_episodes,
                 )
-                for episode in bulk_episodes
-            ]
+            ).episodes
 
             # Save all the episodes
-            await semaphore_gather(*[episode.save(self.driver) for episode in episodes])
+            await add_nodes_and_edges_bulk(self.driver, episodes, [], [], [])
+            if self.episode_window_cache is not None:
+                self.episode_window_cache.add_episodes(episodes)
 
             # Get previous episode context for each episode
-            episode_pairs = await retrieve_previous_episodes_bulk(self.driver, episodes)
-
-            # Extract all nodes and edges
-            (
-                extracted_nodes,
-                extracted_edges,
-                episodic_edges,
-            ) = await extract_nodes_and_edges_bulk(self.llm_client, episode_pairs)
-
-            # Generate embeddings
-            await semaphore_gather(
-                *[node.generate_name_embedding(self.embedder) for node in extracted_nodes],
-                *[edge.generate_embedding(self.embedder) for edge in extracted_edges],
+            episode_pairs = await retrieve_previous_episodes_bulk(
+                self.driver, episodes, self.episode_window_cache
             )
 
-            # Dedupe extracted nodes, compress extracted edges
-            (nodes, uuid_map), extracted_edges_timestamped = await semaphore_gather(
-                dedupe_nodes_bulk(self.driver, self.llm_client, extracted_nodes),
-                extract_edge_dates_bulk(self.llm_client, extracted_edges, episode_pairs),
+            async def extract() -> ExtractedNodesAndEdges:
+                # Extract all nodes and edges
+                (
+                    extracted_nodes,
+                    extracted_edges,
+                    episodic_edges,
+                ) = await extract_nodes_and_edges_bulk(self.llm_client, episode_pairs)
+
+                # Generate embeddings
+                await semaphore_gather(
+                    create_entity_node_embeddings(self.embedder, extracted_nodes),
+                    create_entity_edge_embeddings(self.embedder, extracted_edges),
+                )
+
+                return ExtractedNodesAndEdges(
+                    nodes=extracted_nodes, edges=extracted_edges, episodic_edges=episodic_edges
+                )
+
+            extracted = await run_checkpointed_stage(
+                checkpoint, BulkIngestionStage.extracted, ExtractedNodesAndEdges, extract
             )
 
-            # save nodes to KG
-            await semaphore_gather(*[node.save(self.driver) for node in nodes])
+            async def dedupe_nodes() -> DedupedNodes:
+                nodes, uuid_map = await dedupe_nodes_bulk(
+                    self.driver, self.llm_client, extracted.nodes
+                )
+                return DedupedNodes(nodes=nodes, uuid_map=uuid_map)
+
+            async def date_edges() -> ResolvedEdges:
+                return ResolvedEdges(
+                    edges=await extract_edge_dates_bulk(
+                        self.llm_client, extracted.edges, episode_pairs
+                    )
+                )
+
+            # Dedupe extracted nodes, compress extracted edges
+            deduped_nodes, dated_edges = await semaphore_gather(
+                run_checkpointed_stage(
+                    checkpoint, BulkIngestionStage.nodes_deduped, DedupedNodes, dedupe_nodes
+                ),
+                run_checkpointed_stage(
+                    checkpoint, BulkIngestionStage.edges_dated, ResolvedEdges, date_edges
+                ),
+            )
+            nodes, uuid_map = deduped_nodes.nodes, deduped_nodes.uuid_map
 
             # re-map edge pointers so that they don't point to discard dupe nodes
             extracted_edges_with_resolved_pointers: list[EntityEdge] = resolve_edge_pointers(
-                extracted_edges_timestamped, uuid_map
+                dated_edges.edges, uuid_map
             )
             episodic_edges_with_resolved_pointers: list[EpisodicEdge] = resolve_edge_pointers(
-                episodic_edges, uuid_map
+                extracted.episodic_edges, uuid_map
             )
 
-            # save episodic edges to KG
-            await semaphore_gather(
-                *[edge.save(self.driver) for edge in episodic_edges_with_resolved_pointers]
-            )
+            async def dedupe_edges() -> ResolvedEdges:
+                return ResolvedEdges(
+                    edges=await dedupe_edges_bulk(
+                        self.driver, self.llm_client, extracted_edges_with_resolved_pointers
+                    )
+                )
 
             # Dedupe extracted edges
-            edges = await dedupe_edges_bulk(
-                self.driver, self.llm_client, extracted_edges_with_resolved_pointers
-            )
+            edges = (
+                await run_checkpointed_stage(
+                    checkpoint, BulkIngestionStage.edges_deduped, ResolvedEdges, dedupe_edges
+                )
+            ).edges
             logger.debug(f'extracted edge length: {len(edges)}')
 
             # invalidate edges
 
-            # save edges to KG
-            await semaphore_gather(*[edge.save(self.driver) for edge in edges])
+            # save nodes, episodic edges and entity edges to KG in a single transaction
+            await add_nodes_and_edges_bulk(
+                self.driver, [], episodic_edges_with_resolved_pointers, nodes, edges
+            )
+            self.invalidate_search_results([group_id])
+            if checkpoint is not None:
+                await checkpoint.save(
+                    BulkIngestionStage.persisted, PersistedWindow(episode_count=len(episodes))
+                )
 
             end = time()
             logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
@@ -603,6 +730,70 @@ class Graphiti:
         except Exception as e:
             raise e
 
+    async def add_episode_bulk_stream(
+        self,
+        bulk_episodes: AsyncIterable[RawEpisode] | Iterable[RawEpisode],
+        group_id: str = '',
+        window_size: int = BULK_EPISODE_WINDOW_SIZE,
+        checkpoint_store: BulkCheckpointStore | None = None,
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Process a stream of episodes in bulk, one window of episodes at a time.
+
+        Parameters
+        ----------
+        bulk_episodes : AsyncIterable[RawEpisode] | Iterable[RawEpisode]
+            The episodes to add. They are only pulled from the source as each window is filled.
+        group_id : str | None
+            An id for the graph partition the episodes are a part of.
+        window_size : int, optional
+            The number of episodes processed together by add_episode_bulk.
+        checkpoint_store : BulkCheckpointStore | None, optional
+            Store recording the completed stages of every window. A job that is restarted with
+            the same job_id, episodes and window_size skips persisted windows and resumes the
+            others from their last completed stage.
+        job_id : str | None, optional
+            Identifies the job in the checkpoint store. Required with a checkpoint_store.
+
+        Returns
+        -------
+        int
+            The number of episodes added.
+
+        Notes
+        -----
+        Each window is extracted, deduplicated and persisted before the next window is read, so
+        memory use is bounded by the window size rather than the size of the stream. Nodes and
+        edges of a window are deduplicated against each other and against the graph, which
+        already holds every previous window.
+
+        If a window fails, the windows before it remain in the graph and the exception is raised.
+        """
+        if checkpoint_store is not None and job_id is None:
+            raise ValueError('job_id is required when a checkpoint_store is given')
+
+        start = time()
+        episode_count = 0
+        window_count = 0
+        async for window in iterate_in_windows(bulk_episodes, window_size):
+            checkpoint = (
+                checkpoint_store.window(job_id, window_count)
+                if checkpoint_store is not None and job_id is not None
+                else None
+            )
+            await self.add_episode_bulk(window, group_id, checkpoint)
+            episode_count += len(window)
+            window_count += 1
+            logger.info(f'Added window {window_count}, {episode_count} episodes added so far')
+
+        end = time()
+        logger.info(
+            f'Completed add_episode_bulk_stream with {episode_count} episodes in {(end - start) * 1000} ms'
+        )
+
+        return episode_count
+
     async def build_communities(self, group_ids: list[str] | None = None) -> list[CommunityNode]:
         """
         Use a community clustering algorithm to find communities of nodes. Create community nodes summarising
@@ -618,12 +809,11 @@ class Graphiti:
             self.driver, self.llm_client, group_ids
         )
 
-        await semaphore_gather(
-            *[node.generate_name_embedding(self.embedder) for node in community_nodes]
-        )
+        await create_community_node_embeddings(self.embedder, community_nodes)
 
-        await semaphore_gather(*[node.save(self.driver) for node in community_nodes])
-        await semaphore_gather(*[edge.save(self.driver) for edge in community_edges])
+        await add_communities_bulk(self.driver, community_nodes, community_edges)
+        # the existing communities of every group were removed
+        self.invalidate_search_results()
 
         return community_nodes
 
@@ -681,6 +871,8 @@ class Graphiti:
                 search_config,
                 search_filter if search_filter is not None else SearchFilters(),
                 center_node_uuid,
+                query_embedding_cache=self.query_embedding_cache,
+                search_result_cache=self.search_result_cache,
             )
         ).edges
 
@@ -705,6 +897,56 @@ class Graphiti:
             search_filter if search_filter is not None else SearchFilters(),
             center_node_uuid,
             bfs_origin_node_uuids,
+            self.query_embedding_cache,
+            self.search_result_cache,
+        )
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        config: SearchConfig,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+    ) -> list[SearchResults]:
+        """
+        Search the knowledge graph for many queries at once.
+
+        The queries are embedded in a single call and retrieved with batched database queries,
+        which is much faster than searching for them one at a time.
+
+        Parameters
+        ----------
+        queries : list[str]
+            The search query strings.
+        config : SearchConfig
+            The search configuration used for every query.
+        group_ids : list[str] | None, optional
+            The graph partitions to return data from.
+        center_node_uuid : str, optional
+            Results will be reranked based on proximity to this node.
+        bfs_origin_node_uuids : list[str] | None, optional
+            The nodes the breadth first search retrievers start from.
+        search_filter : SearchFilters | None, optional
+            Filters applied to the search results.
+
+        Returns
+        -------
+        list[SearchResults]
+            The search results of each query, in the same order as the queries.
+        """
+        return await search_batch(
+            self.driver,
+            self.embedder,
+            self.cross_encoder,
+            queries,
+            group_ids,
+            config,
+            search_filter if search_filter is not None else SearchFilters(),
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            self.query_embedding_cache,
         )
 
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
@@ -721,20 +963,22 @@ class Graphiti:
         return SearchResults(edges=edges, nodes=nodes, communities=[])
 
     async def add_triplet(self, source_node: EntityNode, edge: EntityEdge, target_node: EntityNode):
-        if source_node.name_embedding is None:
-            await source_node.generate_name_embedding(self.embedder)
-        if target_node.name_embedding is None:
-            await target_node.generate_name_embedding(self.embedder)
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(self.embedder)
+        await semaphore_gather(
+            create_entity_node_embeddings(
+                self.embedder,
+                [node for node in [source_node, target_node] if node.name_embedding is None],
+            ),
+            create_entity_edge_embeddings(
+                self.embedder, [edge] if edge.fact_embedding is None else []
+            ),
+        )
 
         resolved_nodes, uuid_map = await resolve_extracted_nodes(
             self.llm_client,
             [source_node, target_node],
-            [
-                await get_relevant_nodes(self.driver, SearchFilters(), [source_node]),
-                await get_relevant_nodes(self.driver, SearchFilters(), [target_node]),
-            ],
+            await get_relevant_nodes_bulk(self.driver, SearchFilters(), [source_node, target_node]),
+            policy=self.node_resolution_policy,
+            stats=self.node_resolution_stats,
         )
 
         updated_edge = resolve_edge_pointers([edge], uuid_map)[0]
@@ -754,6 +998,9 @@ class Graphiti:
         await add_nodes_and_edges_bulk(
             self.driver, [], [], resolved_nodes, [resolved_edge] + invalidated_edges
         )
+        self.invalidate_search_results(
+            list({node.group_id for node in resolved_nodes} | {resolved_edge.group_id})
+        )
 
     async def remove_episode(self, episode_uuid: str):
         # Find the episode to be deleted
@@ -785,3 +1032,6 @@ class Graphiti:
         await semaphore_gather(*[node.delete(self.driver) for node in nodes_to_delete])
         await semaphore_gather(*[edge.delete(self.driver) for edge in edges_to_delete])
         await episode.delete(self.driver)
+        if self.episode_window_cache is not None:
+            self.episode_window_cache.invalidate(episode.group_id)
+        self.invalidate_search_results([episode.group_id])
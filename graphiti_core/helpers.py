@@ -16,8 +16,11 @@ limitations under the License.
 
 import asyncio
 import os
-from collections.abc import Coroutine
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Coroutine, Iterable
 from datetime import datetime
+from time import monotonic
+from typing import Any, TypeVar
 
 import numpy as np
 from dotenv import load_dotenv
@@ -27,9 +30,11 @@ load_dotenv()
 
 DEFAULT_DATABASE = os.getenv('DEFAULT_DATABASE', None)
 USE_PARALLEL_RUNTIME = bool(os.getenv('USE_PARALLEL_RUNTIME', False))
+USE_EXACT_VECTOR_SEARCH = os.getenv('USE_EXACT_VECTOR_SEARCH', 'false').lower() == 'true'
 SEMAPHORE_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 20))
 MAX_REFLEXION_ITERATIONS = int(os.getenv('MAX_REFLEXION_ITERATIONS', 2))
 DEFAULT_PAGE_LIMIT = 20
+BULK_WRITE_BATCH_SIZE = int(os.getenv('BULK_WRITE_BATCH_SIZE', 1000))
 
 
 def parse_db_date(neo_date: neo4j_time.DateTime | None) -> datetime | None:
@@ -94,3 +99,82 @@ async def semaphore_gather(*coroutines: Coroutine, max_coroutines: int = SEMAPHO
             return await coroutine
 
     return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+
+
+T = TypeVar('T')
+
+
+async def iterate_in_windows(
+    items: AsyncIterable[T] | Iterable[T], window_size: int
+) -> AsyncIterator[list[T]]:
+    """Yield lists of up to window_size items, pulling items from the source only as needed."""
+    if window_size < 1:
+        raise ValueError('window_size must be at least 1')
+
+    window: list[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            window.append(item)
+            if len(window) == window_size:
+                yield window
+                window = []
+    else:
+        for item in items:
+            window.append(item)
+            if len(window) == window_size:
+                yield window
+                window = []
+
+    if window:
+        yield window
+
+
+class LRUCache:
+    """
+    A size bounded in-memory cache with least recently used eviction and an optional TTL.
+
+    Values are stored as-is, so callers that mutate returned objects should store copies.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[Any, tuple[float | None, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at is not None and expires_at <= monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any):
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Any):
+        self._items.pop(key, None)
+
+    def values(self) -> list[Any]:
+        now = monotonic()
+        return [
+            value
+            for expires_at, value in self._items.values()
+            if expires_at is None or expires_at > now
+        ]
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
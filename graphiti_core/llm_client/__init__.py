@@ -1,6 +1,18 @@
+from .cache import DiskLLMCache, InMemoryLLMCache, LLMCache, TieredLLMCache
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
 from .openai_client import OpenAIClient
+from .rate_limiter import AdaptiveRateLimiter
 
-__all__ = ['LLMClient', 'OpenAIClient', 'LLMConfig', 'RateLimitError']
+__all__ = [
+    'LLMClient',
+    'OpenAIClient',
+    'LLMConfig',
+    'RateLimitError',
+    'LLMCache',
+    'InMemoryLLMCache',
+    'DiskLLMCache',
+    'TieredLLMCache',
+    'AdaptiveRateLimiter',
+]
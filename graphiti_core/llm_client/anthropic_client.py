@@ -23,6 +23,7 @@ from anthropic import AsyncAnthropic
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from .cache import LLMCache
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
@@ -34,7 +35,7 @@ DEFAULT_MAX_TOKENS = 8192
 
 
 class AnthropicClient(LLMClient):
-    def __init__(self, config: LLMConfig | None = None, cache: bool = False):
+    def __init__(self, config: LLMConfig | None = None, cache: bool | LLMCache = False):
         if config is None:
             config = LLMConfig(max_tokens=DEFAULT_MAX_TOKENS)
         elif config.max_tokens is None:
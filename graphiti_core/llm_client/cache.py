@@ -0,0 +1,164 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import typing
+from abc import ABC, abstractmethod
+
+from diskcache import Cache
+from pydantic import BaseModel
+
+from ..helpers import LRUCache
+from ..prompts.models import Message
+
+DEFAULT_CACHE_DIR = './llm_cache'
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+DEFAULT_DISK_CACHE_SIZE_LIMIT = 2**30  # 1 GiB
+
+
+def get_cache_key(
+    model: str | None,
+    temperature: float,
+    max_tokens: int,
+    messages: list[Message],
+    response_model: type[BaseModel] | None = None,
+) -> str:
+    """
+    Build a deterministic cache key for an LLM request.
+
+    The key covers the model parameters, the prompt (type and version) that produced the messages,
+    the response schema and the cleaned message contents.
+    """
+    prompt_names = [message.prompt_name for message in messages if message.prompt_name]
+    key = {
+        'model': model,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+        'prompt': prompt_names[0] if prompt_names else None,
+        'response_schema': (
+            response_model.model_json_schema() if response_model is not None else None
+        ),
+        'messages': [{'role': m.role, 'content': m.content} for m in messages],
+    }
+    key_str = json.dumps(key, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+class LLMCache(ABC):
+    """
+    Async cache for LLM responses. Tracks hits and misses across all lookups.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> dict[str, typing.Any] | None:
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def set(self, key: str, value: dict[str, typing.Any]):
+        await self._set(key, value)
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    @abstractmethod
+    async def _get(self, key: str) -> dict[str, typing.Any] | None:
+        pass
+
+    @abstractmethod
+    async def _set(self, key: str, value: dict[str, typing.Any]):
+        pass
+
+
+class InMemoryLLMCache(LLMCache):
+    """
+    LRU cache held in process memory, with optional expiry of entries after ttl seconds.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MEMORY_CACHE_SIZE, ttl: float | None = None):
+        super().__init__()
+        self.cache = LRUCache(max_size, ttl)
+
+    async def _get(self, key: str) -> dict[str, typing.Any] | None:
+        value = self.cache.get(key)
+        # responses are handed to callers that may mutate them
+        return copy.deepcopy(value) if value is not None else None
+
+    async def _set(self, key: str, value: dict[str, typing.Any]):
+        self.cache.set(key, copy.deepcopy(value))
+
+
+class DiskLLMCache(LLMCache):
+    """
+    Persistent cache backed by diskcache. Blocking disk access is run in a worker thread so the
+    event loop is never blocked. Entries expire after ttl seconds and the least recently stored
+    entries are culled once the cache grows past size_limit bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl: float | None = None,
+        size_limit: int = DEFAULT_DISK_CACHE_SIZE_LIMIT,
+    ):
+        super().__init__()
+        self.ttl = ttl
+        self.cache = Cache(directory, size_limit=size_limit)
+
+    async def _get(self, key: str) -> dict[str, typing.Any] | None:
+        return await asyncio.to_thread(self.cache.get, key)
+
+    async def _set(self, key: str, value: dict[str, typing.Any]):
+        await asyncio.to_thread(self.cache.set, key, value, expire=self.ttl)
+
+
+class TieredLLMCache(LLMCache):
+    """
+    Looks up each tier in order (fastest first). A hit in a slower tier is written back to the
+    faster tiers in front of it, and new responses are written to every tier.
+    """
+
+    def __init__(self, tiers: list[LLMCache]):
+        super().__init__()
+        self.tiers = tiers
+
+    async def _get(self, key: str) -> dict[str, typing.Any] | None:
+        for i, tier in enumerate(self.tiers):
+            value = await tier.get(key)
+            if value is not None:
+                for faster_tier in self.tiers[:i]:
+                    await faster_tier.set(key, value)
+                return value
+
+        return None
+
+    async def _set(self, key: str, value: dict[str, typing.Any]):
+        for tier in self.tiers:
+            await tier.set(key, value)
+
+
+def create_default_cache() -> LLMCache:
+    return TieredLLMCache([InMemoryLLMCache(), DiskLLMCache()])
@@ -14,23 +14,24 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import hashlib
 import json
 import logging
 import typing
 from abc import ABC, abstractmethod
 
 import httpx
-from diskcache import Cache
 from pydantic import BaseModel
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
+from ..helpers import SEMAPHORE_LIMIT
 from ..prompts.models import Message
+from .cache import LLMCache, create_default_cache, get_cache_key
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .errors import RateLimitError
+from .rate_limiter import AdaptiveRateLimiter, get_rate_limiter_key, get_shared_rate_limiter
+from .utils import estimate_token_count
 
 DEFAULT_TEMPERATURE = 0
-DEFAULT_CACHE_DIR = './llm_cache'
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ def is_server_or_retry_error(exception):
 
 
 class LLMClient(ABC):
-    def __init__(self, config: LLMConfig | None, cache: bool = False):
+    def __init__(self, config: LLMConfig | None, cache: bool | LLMCache = False):
         if config is None:
             config = LLMConfig()
 
@@ -53,12 +54,24 @@ class LLMClient(ABC):
         self.model = config.model
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens
-        self.cache_enabled = cache
-        self.cache_dir = None
-
-        # Only create the cache directory if caching is enabled
-        if self.cache_enabled:
-            self.cache_dir = Cache(DEFAULT_CACHE_DIR)
+        self.cache_enabled = cache is not False
+        self.cache: LLMCache | None = None
+
+        # Only create the cache if caching is enabled
+        if isinstance(cache, LLMCache):
+            self.cache = cache
+        elif cache:
+            self.cache = create_default_cache()
+
+        # Clients of the same type talking to the same endpoint and model with the same API key
+        # share one limiter
+        self.rate_limiter: AdaptiveRateLimiter = get_shared_rate_limiter(
+            get_rate_limiter_key(
+                self.__class__.__name__, config.base_url, config.model, config.api_key
+            ),
+            max_concurrency=config.max_concurrency or SEMAPHORE_LIMIT,
+            tokens_per_minute=config.tokens_per_minute,
+        )
 
     def _clean_input(self, input: str) -> str:
         """Clean input string of invalid unicode and control characters.
@@ -100,10 +113,24 @@ class LLMClient(ABC):
         max_tokens: int = DEFAULT_MAX_TOKENS,
     ) -> dict[str, typing.Any]:
         try:
-            return await self._generate_response(messages, response_model, max_tokens)
+            return await self._generate_response_with_rate_limit(
+                messages, response_model, max_tokens
+            )
         except (httpx.HTTPStatusError, RateLimitError) as e:
             raise e
 
+    async def _generate_response_with_rate_limit(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+    ) -> dict[str, typing.Any]:
+        estimated_tokens = sum(estimate_token_count(m.content) for m in messages) + (
+            max_tokens or self.max_tokens
+        )
+        async with self.rate_limiter.limit(estimated_tokens):
+            return await self._generate_response(messages, response_model, max_tokens)
+
     @abstractmethod
     async def _generate_response(
         self,
@@ -113,11 +140,34 @@ class LLMClient(ABC):
     ) -> dict[str, typing.Any]:
         pass
 
-    def _get_cache_key(self, messages: list[Message]) -> str:
-        # Create a unique cache key based on the messages and model
-        message_str = json.dumps([m.model_dump() for m in messages], sort_keys=True)
-        key_str = f'{self.model}:{message_str}'
-        return hashlib.md5(key_str.encode()).hexdigest()
+    def _get_cache_key(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+    ) -> str:
+        return get_cache_key(self.model, self.temperature, max_tokens, messages, response_model)
+
+    async def _get_cached_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+    ) -> tuple[str | None, dict[str, typing.Any] | None]:
+        """Return the cache key for the (already cleaned) messages and the cached response, if any."""
+        if self.cache is None:
+            return None, None
+
+        cache_key = self._get_cache_key(messages, response_model, max_tokens)
+        cached_response = await self.cache.get(cache_key)
+        if cached_response is not None:
+            logger.debug(f'Cache hit for {cache_key}')
+
+        return cache_key, cached_response
+
+    async def _set_cached_response(self, cache_key: str | None, response: dict[str, typing.Any]):
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, response)
 
     async def generate_response(
         self,
@@ -133,21 +183,18 @@ class LLMClient(ABC):
                 f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
             )
 
-        if self.cache_enabled and self.cache_dir is not None:
-            cache_key = self._get_cache_key(messages)
-
-            cached_response = self.cache_dir.get(cache_key)
-            if cached_response is not None:
-                logger.debug(f'Cache hit for {cache_key}')
-                return cached_response
-
         for message in messages:
             message.content = self._clean_input(message.content)
 
+        # The key is computed from the cleaned messages so that lookups and stores always agree
+        cache_key, cached_response = await self._get_cached_response(
+            messages, response_model, max_tokens
+        )
+        if cached_response is not None:
+            return cached_response
+
         response = await self._generate_response_with_retry(messages, response_model, max_tokens)
 
-        if self.cache_enabled and self.cache_dir is not None:
-            cache_key = self._get_cache_key(messages)
-            self.cache_dir.set(cache_key, response)
+        await self._set_cached_response(cache_key, response)
 
         return response
@@ -34,6 +34,8 @@ class LLMConfig:
         base_url: str | None = None,
         temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        max_concurrency: int | None = None,
+        tokens_per_minute: int | None = None,
     ):
         """
         Initialize the LLMConfig with the provided parameters.
@@ -49,9 +51,16 @@ class LLMConfig:
                 base_url (str, optional): The base URL of the LLM API service.
                                                                         Defaults to "https://api.openai.com", which is OpenAI's standard API endpoint.
                                                                         This can be changed if using a different provider or a custom endpoint.
+
+                max_concurrency (int, optional): The maximum number of in-flight requests to the LLM API.
+                                                                        Defaults to SEMAPHORE_LIMIT. The actual limit adapts to rate limit errors.
+
+                tokens_per_minute (int, optional): The token budget per minute for the LLM API. Unlimited if not set.
         """
         self.base_url = base_url
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
@@ -25,6 +25,7 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from .cache import LLMCache
 from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .errors import RateLimitError, RefusalError
@@ -48,7 +49,7 @@ class OpenAIGenericClient(LLMClient):
         max_tokens (int): The maximum number of tokens to generate in a response.
 
     Methods:
-        __init__(config: LLMConfig | None = None, cache: bool = False, client: typing.Any = None):
+        __init__(config: LLMConfig | None = None, cache: bool | LLMCache = False, client: typing.Any = None):
             Initializes the OpenAIClient with the provided configuration, cache setting, and client.
 
         _generate_response(messages: list[Message]) -> dict[str, typing.Any]:
@@ -59,21 +60,20 @@ class OpenAIGenericClient(LLMClient):
     MAX_RETRIES: ClassVar[int] = 2
 
     def __init__(
-        self, config: LLMConfig | None = None, cache: bool = False, client: typing.Any = None
+        self,
+        config: LLMConfig | None = None,
+        cache: bool | LLMCache = False,
+        client: typing.Any = None,
     ):
         """
         Initialize the OpenAIClient with the provided configuration, cache setting, and client.
 
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
-            cache (bool): Whether to use caching for responses. Defaults to False.
+            cache (bool | LLMCache): Whether to cache responses, or the cache to use. Defaults to False.
             client (Any | None): An optional async client instance to use. If not provided, a new AsyncOpenAI client is created.
 
         """
-        # removed caching to simplify the `generate_response` override
-        if cache:
-            raise NotImplementedError('Caching is not implemented for OpenAI')
-
         if config is None:
             config = LLMConfig()
 
@@ -130,11 +130,21 @@ class OpenAIGenericClient(LLMClient):
                 f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
             )
 
+        for message in messages:
+            message.content = self._clean_input(message.content)
+
+        cache_key, cached_response = await self._get_cached_response(
+            messages, response_model, max_tokens
+        )
+        if cached_response is not None:
+            return cached_response
+
         while retry_count <= self.MAX_RETRIES:
             try:
-                response = await self._generate_response(
+                response = await self._generate_response_with_rate_limit(
                     messages, response_model, max_tokens=max_tokens
                 )
+                await self._set_cached_response(cache_key, response)
                 return response
             except (RateLimitError, RefusalError):
                 # These errors should not trigger retries
@@ -0,0 +1,261 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from pydantic import BaseModel
+
+from ..helpers import SEMAPHORE_LIMIT
+from .errors import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_CONCURRENCY = 1
+DECREASE_FACTOR = 0.5
+# Concurrency is not increased while the recent latency is this many times the baseline latency
+LATENCY_TOLERANCE = 2.0
+LATENCY_EWMA_ALPHA = 0.2
+# The baseline is a slowly decaying average, so that it follows changes in prompt and output sizes
+BASELINE_LATENCY_EWMA_ALPHA = 0.01
+DECREASE_COOLDOWN = 1.0
+
+
+class RateLimiterState(BaseModel):
+    concurrency_limit: int
+    in_flight: int
+    waiting: int
+    available_tokens: float | None
+    tokens_per_minute: int | None
+    latency_ewma: float | None
+    baseline_latency: float | None
+    successes: int
+    rate_limit_errors: int
+
+
+class AdaptiveRateLimiter:
+    """
+    Limits the number of in-flight LLM requests and the tokens sent per minute.
+
+    The concurrency limit adapts AIMD-style: every successful request adds 1 / limit (so roughly
+    one extra slot per round of requests) unless recent latency has degraded relative to its slowly
+    decaying baseline, and a RateLimitError
+    halves the limit. Decreases are rate limited to one per cooldown period so that a burst of
+    429s from the same round only counts once.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = SEMAPHORE_LIMIT,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        tokens_per_minute: int | None = None,
+        initial_concurrency: int | None = None,
+    ):
+        self.max_concurrency = max(max_concurrency, min_concurrency)
+        self.min_concurrency = min_concurrency
+        self.tokens_per_minute = tokens_per_minute
+
+        self._limit = float(
+            initial_concurrency if initial_concurrency is not None else self.max_concurrency
+        )
+        self._in_flight = 0
+        self._waiting = 0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._available_tokens = float(tokens_per_minute) if tokens_per_minute else 0.0
+        self._last_refill = monotonic()
+
+        self._latency_ewma: float | None = None
+        self._baseline_latency: float | None = None
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._rate_limit_errors = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self.min_concurrency, int(self._limit))
+
+    def state(self) -> RateLimiterState:
+        self._refill()
+        return RateLimiterState(
+            concurrency_limit=self.concurrency_limit,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            available_tokens=self._available_tokens if self.tokens_per_minute else None,
+            tokens_per_minute=self.tokens_per_minute,
+            latency_ewma=self._latency_ewma,
+            baseline_latency=self._baseline_latency,
+            successes=self._successes,
+            rate_limit_errors=self._rate_limit_errors,
+        )
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a request slot (and token budget) for the duration of one LLM request."""
+        await self._acquire(estimated_tokens)
+        start = monotonic()
+        try:
+            yield
+        except RateLimitError:
+            self._on_rate_limit()
+            raise
+        else:
+            self._on_success(monotonic() - start)
+        finally:
+            await self._release()
+
+    def _get_condition(self) -> asyncio.Condition:
+        # asyncio primitives are bound to one event loop, so recreate it if the limiter is shared
+        # with a new loop
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _refill(self):
+        now = monotonic()
+        if self.tokens_per_minute:
+            self._available_tokens = min(
+                float(self.tokens_per_minute),
+                self._available_tokens + (now - self._last_refill) * self.tokens_per_minute / 60,
+            )
+        self._last_refill = now
+
+    async def _acquire(self, estimated_tokens: int):
+        condition = self._get_condition()
+        async with condition:
+            self._waiting += 1
+            try:
+                await condition.wait_for(lambda: self._in_flight < self.concurrency_limit)
+                self._in_flight += 1
+            finally:
+                self._waiting -= 1
+
+        if not self.tokens_per_minute or estimated_tokens <= 0:
+            return
+
+        # A single request larger than the whole budget only has to wait for a full bucket
+        tokens = min(float(estimated_tokens), float(self.tokens_per_minute))
+        try:
+            while True:
+                self._refill()
+                if self._available_tokens >= tokens:
+                    self._available_tokens -= tokens
+                    return
+                deficit = tokens - self._available_tokens
+                await asyncio.sleep(deficit * 60 / self.tokens_per_minute)
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _release(self):
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _on_success(self, latency: float):
+        self._successes += 1
+        if self._latency_ewma is None or self._baseline_latency is None:
+            self._latency_ewma = latency
+            self._baseline_latency = latency
+        else:
+            self._latency_ewma = (
+                LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * self._latency_ewma
+            )
+            self._baseline_latency = (
+                BASELINE_LATENCY_EWMA_ALPHA * latency
+                + (1 - BASELINE_LATENCY_EWMA_ALPHA) * self._baseline_latency
+            )
+
+        if self._latency_ewma > LATENCY_TOLERANCE * self._baseline_latency:
+            return
+
+        self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+
+    def tighten(self, max_concurrency: int, tokens_per_minute: int | None = None):
+        """Lower the limits to the given ones where they are stricter than the current ones."""
+        self.max_concurrency = max(min(self.max_concurrency, max_concurrency), self.min_concurrency)
+        self._limit = min(self._limit, float(self.max_concurrency))
+
+        if tokens_per_minute and (
+            not self.tokens_per_minute or tokens_per_minute < self.tokens_per_minute
+        ):
+            self._refill()
+            self._available_tokens = (
+                min(self._available_tokens, float(tokens_per_minute))
+                if self.tokens_per_minute
+                else float(tokens_per_minute)
+            )
+            self.tokens_per_minute = tokens_per_minute
+
+    def _on_rate_limit(self):
+        self._rate_limit_errors += 1
+        now = monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+
+        self._last_decrease = now
+        self._limit = max(float(self.min_concurrency), self._limit * DECREASE_FACTOR)
+        logger.warning(f'Rate limited, reducing LLM concurrency to {self.concurrency_limit}')
+
+
+_shared_rate_limiters: dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter_key(
+    client_type: str, base_url: str | None, model: str | None, api_key: str | None
+) -> str:
+    # Different API keys can belong to different accounts with their own rate limits
+    api_key_hash = hashlib.sha256((api_key or '').encode()).hexdigest()[:16]
+    return f'{client_type}:{base_url}:{model}:{api_key_hash}'
+
+
+def get_shared_rate_limiter(
+    key: str,
+    max_concurrency: int = SEMAPHORE_LIMIT,
+    tokens_per_minute: int | None = None,
+) -> AdaptiveRateLimiter:
+    """
+    Return the process-wide limiter for key (see get_rate_limiter_key), creating it on first use.
+    Clients that talk to the same endpoint with the same credentials share one budget.
+
+    If the limiter already exists with looser limits than requested it is tightened, so that
+    the strictest limits configured for a budget apply.
+    """
+    limiter = _shared_rate_limiters.get(key)
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(
+            max_concurrency=max_concurrency, tokens_per_minute=tokens_per_minute
+        )
+        _shared_rate_limiters[key] = limiter
+        return limiter
+
+    if max_concurrency != limiter.max_concurrency or tokens_per_minute != limiter.tokens_per_minute:
+        limiter.tighten(max_concurrency, tokens_per_minute)
+        logger.warning(
+            f'LLM clients sharing a rate limit budget were configured with different limits, '
+            f'using max_concurrency={limiter.max_concurrency} and '
+            f'tokens_per_minute={limiter.tokens_per_minute}'
+        )
+
+    return limiter
@@ -32,3 +32,32 @@ async def generate_embedding(embedder: EmbedderClient, text: str):
     logger.debug(f'embedded text of length {len(text)} in {end - start} ms')
 
     return embedding
+
+
+def estimate_token_count(text: str) -> int:
+    # Rough estimate of ~4 characters per token, good enough for budgeting requests
+    return len(text) // 4 + 1
+
+
+def chunk_by_token_budget(
+    token_counts: list[int], max_tokens: int, base_tokens: int = 0
+) -> list[list[int]]:
+    """
+    Greedily group item indices so that base_tokens plus the tokens of each group stay within
+    max_tokens. An item that does not fit on its own still gets a group of its own.
+    """
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    chunk_tokens = base_tokens
+    for i, tokens in enumerate(token_counts):
+        if chunk and chunk_tokens + tokens > max_tokens:
+            chunks.append(chunk)
+            chunk = []
+            chunk_tokens = base_tokens
+        chunk.append(i)
+        chunk_tokens += tokens
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
@@ -56,3 +56,12 @@ COMMUNITY_EDGE_SAVE = """
         MERGE (community)-[r:HAS_MEMBER {uuid: $uuid}]->(node)
         SET r = {uuid: $uuid, group_id: $group_id, created_at: $created_at}
         RETURN r.uuid AS uuid"""
+
+COMMUNITY_EDGE_SAVE_BULK = """
+    UNWIND $community_edges AS edge
+    MATCH (community:Community {uuid: edge.source_node_uuid}) 
+    MATCH (node:Entity | Community {uuid: edge.target_node_uuid}) 
+    MERGE (community)-[r:HAS_MEMBER {uuid: edge.uuid}]->(node)
+    SET r = {uuid: edge.uuid, group_id: edge.group_id, created_at: edge.created_at}
+    RETURN r.uuid AS uuid
+"""
@@ -17,7 +17,7 @@ limitations under the License.
 EPISODIC_NODE_SAVE = """
         MERGE (n:Episodic {uuid: $uuid})
         SET n = {uuid: $uuid, name: $name, group_id: $group_id, source_description: $source_description, source: $source, content: $content, 
-        entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at}
+        entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at, content_hash: $content_hash}
         RETURN n.uuid AS uuid"""
 
 EPISODIC_NODE_SAVE_BULK = """
@@ -25,7 +25,8 @@ EPISODIC_NODE_SAVE_BULK = """
     MERGE (n:Episodic {uuid: episode.uuid})
     SET n = {uuid: episode.uuid, name: episode.name, group_id: episode.group_id, source_description: episode.source_description, 
         source: episode.source, content: episode.content, 
-    entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at}
+    entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at, 
+    content_hash: episode.content_hash}
     RETURN n.uuid AS uuid
 """
 
@@ -50,3 +51,12 @@ COMMUNITY_NODE_SAVE = """
         SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
         WITH n CALL db.create.setNodeVectorProperty(n, "name_embedding", $name_embedding)
         RETURN n.uuid AS uuid"""
+
+COMMUNITY_NODE_SAVE_BULK = """
+    UNWIND $communities AS community
+    MERGE (n:Community {uuid: community.uuid})
+    SET n = {uuid: community.uuid, name: community.name, group_id: community.group_id, summary: community.summary, 
+    created_at: community.created_at}
+    WITH n, community CALL db.create.setNodeVectorProperty(n, "name_embedding", community.name_embedding)
+    RETURN n.uuid AS uuid
+"""
@@ -14,12 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from time import time
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from neo4j import AsyncDriver
@@ -34,7 +36,7 @@ from graphiti_core.models.nodes.node_db_queries import (
     ENTITY_NODE_SAVE,
     EPISODIC_NODE_SAVE,
 )
-from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +140,10 @@ class EpisodicNode(Node):
         description='list of entity edges referenced in this episode',
         default_factory=list,
     )
+    content_hash: str | None = Field(
+        default=None,
+        description='hash of the group, content, source and reference time of the episode',
+    )
 
     async def save(self, driver: AsyncDriver):
         result = await driver.execute_query(
@@ -151,6 +157,7 @@ class EpisodicNode(Node):
             created_at=self.created_at,
             valid_at=self.valid_at,
             source=self.source.value,
+            content_hash=self.content_hash,
             database_=DEFAULT_DATABASE,
         )
 
@@ -171,7 +178,8 @@ class EpisodicNode(Node):
             e.group_id AS group_id,
             e.source_description AS source_description,
             e.source AS source,
-            e.entity_edges AS entity_edges
+            e.entity_edges AS entity_edges,
+            e.content_hash AS content_hash
         """,
             uuid=uuid,
             database_=DEFAULT_DATABASE,
@@ -199,7 +207,8 @@ class EpisodicNode(Node):
             e.group_id AS group_id,
             e.source_description AS source_description,
             e.source AS source,
-            e.entity_edges AS entity_edges
+            e.entity_edges AS entity_edges,
+            e.content_hash AS content_hash
         """,
             uuids=uuids,
             database_=DEFAULT_DATABASE,
@@ -210,6 +219,33 @@ class EpisodicNode(Node):
 
         return episodes
 
+    @classmethod
+    async def get_by_content_hash(cls, driver: AsyncDriver, content_hash: str):
+        records, _, _ = await driver.execute_query(
+            """
+        MATCH (e:Episodic {content_hash: $content_hash})
+            RETURN DISTINCT
+            e.content AS content,
+            e.created_at AS created_at,
+            e.valid_at AS valid_at,
+            e.uuid AS uuid,
+            e.name AS name,
+            e.group_id AS group_id,
+            e.source_description AS source_description,
+            e.source AS source,
+            e.entity_edges AS entity_edges,
+            e.content_hash AS content_hash
+        ORDER BY e.created_at
+        """,
+            content_hash=content_hash,
+            database_=DEFAULT_DATABASE,
+            routing_='r',
+        )
+
+        episodes = [get_episodic_node_from_record(record) for record in records]
+
+        return episodes
+
     @classmethod
     async def get_by_group_ids(
         cls,
@@ -236,7 +272,8 @@ class EpisodicNode(Node):
             e.group_id AS group_id,
             e.source_description AS source_description,
             e.source AS source,
-            e.entity_edges AS entity_edges
+            e.entity_edges AS entity_edges,
+            e.content_hash AS content_hash
         ORDER BY e.uuid DESC
         """
             + limit_query,
@@ -252,6 +289,23 @@ class EpisodicNode(Node):
         return episodes
 
 
+def get_episode_content_hash(
+    group_id: str, episode_body: str, source: EpisodeType, reference_time: datetime
+) -> str:
+    """Stable hash identifying repeated deliveries of the same episode."""
+    utc_reference_time = ensure_utc(reference_time)
+    content = json.dumps(
+        [
+            group_id,
+            episode_body,
+            source.value,
+            utc_reference_time.isoformat() if utc_reference_time else None,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 class EntityNode(Node):
     name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='regional summary of surrounding edges', default_factory=str)
@@ -514,6 +568,7 @@ def get_episodic_node_from_record(record: Any) -> EpisodicNode:
         name=record['name'],
         source_description=record['source_description'],
         entity_edges=record['entity_edges'],
+        content_hash=record.get('content_hash'),
     )
 
 
@@ -551,3 +606,26 @@ def get_community_node_from_record(record: Any) -> CommunityNode:
         created_at=record['created_at'].to_native(),
         summary=record['summary'],
     )
+
+
+async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[EntityNode]):
+    await create_name_embeddings(embedder, nodes)
+
+
+async def create_community_node_embeddings(embedder: EmbedderClient, nodes: list[CommunityNode]):
+    await create_name_embeddings(embedder, nodes)
+
+
+N = TypeVar('N', EntityNode, CommunityNode)
+
+
+async def create_name_embeddings(embedder: EmbedderClient, nodes: list[N]):
+    if len(nodes) == 0:
+        return
+
+    start = time()
+    name_embeddings = await embedder.create_batch([node.name.replace('\n', ' ') for node in nodes])
+    for node, name_embedding in zip(nodes, name_embeddings, strict=True):
+        node.name_embedding = name_embedding
+    end = time()
+    logger.debug(f'embedded {len(nodes)} node names in {end - start} ms')
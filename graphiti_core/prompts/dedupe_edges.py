@@ -30,6 +30,20 @@ class EdgeDuplicate(BaseModel):
     )
 
 
+class EdgeDuplicateIdx(BaseModel):
+    id: int = Field(..., description='id of the new fact')
+    duplicate_idx: int = Field(
+        ...,
+        description='idx of the existing fact that the new fact duplicates, or -1 if there is none',
+    )
+
+
+class EdgeDuplicates(BaseModel):
+    duplicate_facts: list[EdgeDuplicateIdx] = Field(
+        ..., description='List of duplicate resolutions, one per new fact'
+    )
+
+
 class UniqueFact(BaseModel):
     uuid: str = Field(..., description='unique identifier of the fact')
     fact: str = Field(..., description='fact of a unique edge')
@@ -41,11 +55,13 @@ class UniqueFacts(BaseModel):
 
 class Prompt(Protocol):
     edge: PromptVersion
+    edges: PromptVersion
     edge_list: PromptVersion
 
 
 class Versions(TypedDict):
     edge: PromptFunction
+    edges: PromptFunction
     edge_list: PromptFunction
 
 
@@ -80,6 +96,40 @@ def edge(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def edges(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that de-duplicates edges from edge lists.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Given the following context, determine for each of the NEW FACTS whether it represents any of the EXISTING FACTS.
+
+        <EXISTING FACTS>
+        {json.dumps(context['related_edges'], indent=2)}
+        </EXISTING FACTS>
+
+        Each new fact lists the idx of the EXISTING FACTS it may duplicate as candidate_idxs.
+
+        <NEW FACTS>
+        {json.dumps(context['extracted_edges'], indent=2)}
+        </NEW FACTS>
+
+        Task:
+        For each new fact, return its id and a duplicate_idx. If the new fact represents the same factual information
+        as one of its candidate EXISTING FACTS, duplicate_idx is the idx of that existing fact. Otherwise duplicate_idx
+        is -1.
+
+        Guidelines:
+        1. The facts do not need to be completely identical to be duplicates, they just need to express the same information.
+        2. Only return an idx listed in the candidate_idxs of the new fact.
+        """,
+        ),
+    ]
+
+
 def edge_list(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -108,4 +158,4 @@ def edge_list(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'edge': edge, 'edge_list': edge_list}
+versions: Versions = {'edge': edge, 'edges': edges, 'edge_list': edge_list}
@@ -34,13 +34,31 @@ class NodeDuplicate(BaseModel):
     )
 
 
+class NodeResolution(BaseModel):
+    id: int = Field(..., description='id of the new entity')
+    duplicate_idx: int = Field(
+        ...,
+        description='idx of the existing entity that the new entity duplicates, or -1 if there is none',
+    )
+    name: str = Field(
+        ...,
+        description="Updated name of the new entity (use the best name between the new entity's name, an existing duplicate name, or a combination of both)",
+    )
+
+
+class NodeResolutions(BaseModel):
+    entity_resolutions: list[NodeResolution] = Field(..., description='List of resolved entities')
+
+
 class Prompt(Protocol):
     node: PromptVersion
+    nodes: PromptVersion
     node_list: PromptVersion
 
 
 class Versions(TypedDict):
     node: PromptFunction
+    nodes: PromptFunction
     node_list: PromptFunction
 
 
@@ -91,6 +109,61 @@ def node(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def nodes(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that determines whether or not ENTITIES extracted from a conversation are duplicates'
+            ' of existing entities.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        <PREVIOUS MESSAGES>
+        {json.dumps([ep for ep in context['previous_episodes']], indent=2)}
+        </PREVIOUS MESSAGES>
+        <CURRENT MESSAGE>
+        {context['episode_content']}
+        </CURRENT MESSAGE>
+
+        Each of the following ENTITIES were extracted from the CURRENT MESSAGE.
+        Each entity in ENTITIES is represented as a JSON object with the following structure:
+        {{
+            id: integer id of the entity,
+            name: "name of the entity",
+            entity_types: ["Entity", "<optional additional label>"]
+        }}
+
+        <ENTITIES>
+        {json.dumps(context['extracted_nodes'], indent=2)}
+        </ENTITIES>
+
+        <EXISTING ENTITIES>
+        {json.dumps(context['existing_nodes'], indent=2)}
+        </EXISTING ENTITIES>
+
+        For each of the above ENTITIES, determine if the entity is a duplicate of any of the EXISTING ENTITIES.
+
+        Task:
+        Your response will be a list called entity_resolutions which contains one entry for each entity.
+
+        For each entity, return the id of the entity as id, the name of the entity as name, and the duplicate_idx
+        as an integer.
+
+        - If an entity is a duplicate of one of the EXISTING ENTITIES, return the idx of the candidate it is a
+            duplicate of.
+        - If an entity is not a duplicate of one of the EXISTING ENTITIES, return the -1 as the duplicate_idx
+        - If an entity is a duplicate, return the most complete full name for the entity as name.
+
+        Guidelines:
+        1. Use both the name and attributes of entities to determine if the entities are duplicates,
+            duplicate entities may have different names
+        2. Entities with the same name that refer to different real-world things are not duplicates
+        """,
+        ),
+    ]
+
+
 def node_list(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -128,4 +201,4 @@ def node_list(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'node': node, 'node_list': node_list}
+versions: Versions = {'node': node, 'nodes': nodes, 'node_list': node_list}
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
 from typing import Any, Protocol, TypedDict
 
 from pydantic import BaseModel, Field
@@ -32,14 +33,29 @@ class InvalidatedEdges(BaseModel):
     )
 
 
+class ContradictedFacts(BaseModel):
+    id: int = Field(..., description='id of the new fact')
+    contradicted_idxs: list[int] = Field(
+        ..., description='idx of each existing fact that the new fact contradicts'
+    )
+
+
+class ContradictedFactsList(BaseModel):
+    contradictions: list[ContradictedFacts] = Field(
+        ..., description='List of contradictions, one per new fact'
+    )
+
+
 class Prompt(Protocol):
     v1: PromptVersion
     v2: PromptVersion
+    batch: PromptVersion
 
 
 class Versions(TypedDict):
     v1: PromptFunction
     v2: PromptFunction
+    batch: PromptFunction
 
 
 def v1(context: dict[str, Any]) -> list[Message]:
@@ -95,4 +111,28 @@ def v2(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'v1': v1, 'v2': v2}
+def batch(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are an AI assistant that helps determine which relationships in a knowledge graph should be invalidated based solely on explicit contradictions in newer information.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+               Based on the provided Existing Facts and New Facts, determine which existing facts, if any, should be marked as invalidated due to contradictions with each New Fact.
+               Each new fact lists the idx of the Existing Facts it may contradict as candidate_idxs.
+
+                Existing Facts:
+                {json.dumps(context['existing_edges'], indent=2)}
+
+                New Facts:
+                {json.dumps(context['new_edges'], indent=2)}
+
+                For each new fact, return its id and the idx of every candidate existing fact it contradicts, or an empty list if it contradicts none of them.
+            """,
+        ),
+    ]
+
+
+versions: Versions = {'v1': v1, 'v2': v2, 'batch': batch}
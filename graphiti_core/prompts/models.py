@@ -22,6 +22,8 @@ from pydantic import BaseModel
 class Message(BaseModel):
     role: str
     content: str
+    # prompt type and version that produced the message, e.g. 'extract_nodes.extract_message'
+    prompt_name: str | None = None
 
 
 class PromptVersion(Protocol):
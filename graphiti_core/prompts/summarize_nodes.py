@@ -29,6 +29,10 @@ class Summary(BaseModel):
     )
 
 
+class EntitySummary(Summary):
+    id: int = Field(..., description='id of the entity')
+
+
 class SummaryDescription(BaseModel):
     description: str = Field(..., description='One sentence description of the provided summary')
 
@@ -36,12 +40,14 @@ class SummaryDescription(BaseModel):
 class Prompt(Protocol):
     summarize_pair: PromptVersion
     summarize_context: PromptVersion
+    summarize_context_batch: PromptVersion
     summary_description: PromptVersion
 
 
 class Versions(TypedDict):
     summarize_pair: PromptFunction
     summarize_context: PromptFunction
+    summarize_context_batch: PromptFunction
     summary_description: PromptFunction
 
 
@@ -106,6 +112,45 @@ def summarize_context(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def summarize_context_batch(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that extracts entity properties from the provided text.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+
+        <MESSAGES>
+        {json.dumps(context['previous_episodes'], indent=2)}
+        {json.dumps(context['episode_content'], indent=2)}
+        </MESSAGES>
+
+        Given the above MESSAGES and the following ENTITIES, create a summary for each ENTITY. Each ENTITY has an id,
+        a name and an ENTITY CONTEXT containing what is already known about it. Each summary must combine the ENTITY
+        CONTEXT with information from the provided MESSAGES and should only contain information relevant to that ENTITY.
+        Summaries must be under 500 words.
+
+        In addition, extract any values for the provided entity properties based on their descriptions.
+        If the value of the entity property cannot be found in the current context, set the value of the property to the Python value None.
+
+        Guidelines:
+        1. Do not hallucinate entity property values if they cannot be found in the current context.
+        2. Return exactly one summary for each ENTITY, with the id of the ENTITY.
+
+        <ENTITIES>
+        {json.dumps(context['nodes'], indent=2)}
+        </ENTITIES>
+
+        <ATTRIBUTES>
+        {json.dumps(context['attributes'], indent=2)}
+        </ATTRIBUTES>
+        """,
+        ),
+    ]
+
+
 def summary_description(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -128,5 +173,6 @@ def summary_description(context: dict[str, Any]) -> list[Message]:
 versions: Versions = {
     'summarize_pair': summarize_pair,
     'summarize_context': summarize_context,
+    'summarize_context_batch': summarize_context_batch,
     'summary_description': summary_description,
 }
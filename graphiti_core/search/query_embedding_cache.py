@@ -0,0 +1,120 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from pydantic import BaseModel
+
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.helpers import LRUCache
+
+DEFAULT_QUERY_EMBEDDING_CACHE_SIZE = 1024
+DEFAULT_QUERY_EMBEDDING_TTL = 3600.0
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.split())
+
+
+def get_embedder_key(embedder: EmbedderClient) -> str:
+    # Embeddings of different models, or of one model truncated to different sizes, differ
+    config = getattr(embedder, 'config', None)
+    model = getattr(config, 'embedding_model', None)
+    dim = getattr(config, 'embedding_dim', None)
+    return f'{type(embedder).__name__}:{model}:{dim}'
+
+
+class QueryEmbeddingCacheStats(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU cache of search query embeddings, keyed by embedder model and normalized query.
+
+    Entries expire ttl seconds after they were created; a ttl of None keeps them until they are
+    evicted. Pass the same cache to several Graphiti instances to share it within a process.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_QUERY_EMBEDDING_CACHE_SIZE,
+        ttl: float | None = DEFAULT_QUERY_EMBEDDING_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._embeddings = LRUCache(max_size=max_size, ttl=ttl)
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+    def get(self, embedder: EmbedderClient, query: str) -> list[float] | None:
+        embedding: list[float] | None = self._embeddings.get(
+            (get_embedder_key(embedder), normalize_query(query))
+        )
+        if embedding is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return embedding
+
+    def set(self, embedder: EmbedderClient, query: str, embedding: list[float]):
+        self._embeddings.set((get_embedder_key(embedder), normalize_query(query)), embedding)
+
+    async def create(self, embedder: EmbedderClient, query: str) -> list[float]:
+        """Return the cached embedding of the query, embedding it on a miss."""
+        embedding = self.get(embedder, query)
+        if embedding is None:
+            embedding = await embedder.create(input_data=[normalize_query(query)])
+            self.set(embedder, query, embedding)
+
+        return embedding
+
+    async def create_batch(self, embedder: EmbedderClient, queries: list[str]) -> list[list[float]]:
+        """Return the embeddings of the queries, embedding all cache misses in a single call."""
+        normalized_queries = [normalize_query(query) for query in queries]
+        embeddings: dict[str, list[float]] = {}
+        missed_queries: list[str] = []
+        for query in dict.fromkeys(normalized_queries):
+            embedding = self.get(embedder, query)
+            if embedding is None:
+                missed_queries.append(query)
+            else:
+                embeddings[query] = embedding
+
+        if missed_queries:
+            missed_embeddings = await embedder.create_batch(missed_queries)
+            for query, embedding in zip(missed_queries, missed_embeddings, strict=True):
+                self.set(embedder, query, embedding)
+                embeddings[query] = embedding
+
+        return [embeddings[query] for query in normalized_queries]
+
+    def clear(self):
+        self._embeddings.clear()
+
+    def stats(self) -> QueryEmbeddingCacheStats:
+        lookups = self.hits + self.misses
+        return QueryEmbeddingCacheStats(
+            size=len(self._embeddings),
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+        )
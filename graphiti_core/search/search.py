@@ -26,10 +26,12 @@ from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import SearchRerankerError
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.search.query_embedding_cache import QueryEmbeddingCache
 from graphiti_core.search.search_config import (
     DEFAULT_SEARCH_LIMIT,
     CommunityReranker,
     CommunitySearchConfig,
+    CommunitySearchMethod,
     EdgeReranker,
     EdgeSearchConfig,
     EdgeSearchMethod,
@@ -40,23 +42,39 @@ from graphiti_core.search.search_config import (
     SearchResults,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_planner import (
+    needs_query_vector,
+    plan_community_retrievers,
+    plan_edge_retrievers,
+    plan_node_retrievers,
+)
+from graphiti_core.search.search_result_cache import SearchResultCache, get_search_key
 from graphiti_core.search.search_utils import (
     community_fulltext_search,
+    community_fulltext_search_bulk,
     community_similarity_search,
+    community_similarity_search_bulk,
     edge_bfs_search,
     edge_fulltext_search,
+    edge_fulltext_search_bulk,
     edge_similarity_search,
+    edge_similarity_search_bulk,
     episode_mentions_reranker,
     maximal_marginal_relevance,
     node_bfs_search,
     node_distance_reranker,
     node_fulltext_search,
+    node_fulltext_search_bulk,
     node_similarity_search,
+    node_similarity_search_bulk,
     rrf,
 )
 
 logger = logging.getLogger(__name__)
 
+# Number of queries sent to the database in a single batched retrieval query
+SEARCH_BATCH_SIZE = 50
+
 
 async def search(
     driver: AsyncDriver,
@@ -68,6 +86,8 @@ async def search(
     search_filter: SearchFilters,
     center_node_uuid: str | None = None,
     bfs_origin_node_uuids: list[str] | None = None,
+    query_embedding_cache: QueryEmbeddingCache | None = None,
+    search_result_cache: SearchResultCache | None = None,
 ) -> SearchResults:
     start = time()
     if query.strip() == '':
@@ -76,10 +96,29 @@ async def search(
             nodes=[],
             communities=[],
         )
-    query_vector = await embedder.create(input_data=[query.replace('\n', ' ')])
 
     # if group_ids is empty, set it to None
     group_ids = group_ids if group_ids else None
+
+    if search_result_cache is not None:
+        cache_key = get_search_key(
+            query, group_ids, config, search_filter, center_node_uuid, bfs_origin_node_uuids
+        )
+        cached_results = search_result_cache.get(cache_key)
+        if cached_results is not None:
+            return cached_results
+        # the version is read before searching so that a concurrent write invalidates the results
+        cache_version = search_result_cache.get_version(group_ids)
+
+    # the query is only embedded if a retriever or reranker uses its embedding
+    query_vector: list[float] = []
+    if needs_query_vector(config):
+        query_vector = (
+            await query_embedding_cache.create(embedder, query)
+            if query_embedding_cache is not None
+            else await embedder.create(input_data=[query.replace('\n', ' ')])
+        )
+
     edges, nodes, communities = await semaphore_gather(
         edge_search(
             driver,
@@ -123,6 +162,9 @@ async def search(
         communities=communities,
     )
 
+    if search_result_cache is not None:
+        search_result_cache.set(cache_key, group_ids, cache_version, results)
+
     latency = (time() - start) * 1000
 
     logger.debug(f'search returned context for query {query} in {latency} ms')
@@ -130,47 +172,362 @@ async def search(
     return results
 
 
-async def edge_search(
+async def search_batch(
     driver: AsyncDriver,
+    embedder: EmbedderClient,
     cross_encoder: CrossEncoderClient,
-    query: str,
-    query_vector: list[float],
+    queries: list[str],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    query_embedding_cache: QueryEmbeddingCache | None = None,
+) -> list[SearchResults]:
+    """
+    Search for many queries at once, returning one SearchResults per query in the same order.
+
+    All queries are embedded in a single call and every retriever runs once per chunk of
+    SEARCH_BATCH_SIZE queries instead of once per query. Reranking is done per query.
+    """
+    start = time()
+
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids else None
+
+    results = [SearchResults(edges=[], nodes=[], communities=[]) for _ in queries]
+    query_indices = [i for i, query in enumerate(queries) if query.strip() != '']
+    if len(query_indices) == 0:
+        return results
+
+    search_queries = [queries[i] for i in query_indices]
+
+    query_vectors: list[list[float]] = [[] for _ in search_queries]
+    if needs_query_vector(config):
+        query_vectors = (
+            await query_embedding_cache.create_batch(embedder, search_queries)
+            if query_embedding_cache is not None
+            else await embedder.create_batch([query.replace('\n', ' ') for query in search_queries])
+        )
+
+    for chunk_start in range(0, len(search_queries), SEARCH_BATCH_SIZE):
+        chunk_end = chunk_start + SEARCH_BATCH_SIZE
+        chunk_queries = search_queries[chunk_start:chunk_end]
+        chunk_vectors = query_vectors[chunk_start:chunk_end]
+
+        edges_lists, nodes_lists, communities_lists = await semaphore_gather(
+            edge_search_batch(
+                driver,
+                cross_encoder,
+                chunk_queries,
+                chunk_vectors,
+                group_ids,
+                config.edge_config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                config.limit,
+            ),
+            node_search_batch(
+                driver,
+                cross_encoder,
+                chunk_queries,
+                chunk_vectors,
+                group_ids,
+                config.node_config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                config.limit,
+            ),
+            community_search_batch(
+                driver,
+                cross_encoder,
+                chunk_queries,
+                chunk_vectors,
+                group_ids,
+                config.community_config,
+                config.limit,
+            ),
+        )
+
+        for i, edges, nodes, communities in zip(
+            query_indices[chunk_start:chunk_end], edges_lists, nodes_lists, communities_lists
+        ):
+            results[i] = SearchResults(edges=edges, nodes=nodes, communities=communities)
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search_batch returned context for {len(search_queries)} queries in {latency} ms')
+
+    return results
+
+
+async def edge_search_batch(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    queries: list[str],
+    query_vectors: list[list[float]],
     group_ids: list[str] | None,
     config: EdgeSearchConfig | None,
     search_filter: SearchFilters,
     center_node_uuid: str | None = None,
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
-) -> list[EntityEdge]:
+) -> list[list[EntityEdge]]:
     if config is None:
-        return []
+        return [[] for _ in queries]
+
+    fetch_limits = plan_edge_retrievers(config, limit)
 
-    search_results: list[list[EntityEdge]] = list(
+    search_results: list[list[list[EntityEdge]]] = [[] for _ in queries]
+    if EdgeSearchMethod.bm25 in fetch_limits:
+        edges_lists = await edge_fulltext_search_bulk(
+            driver, queries, search_filter, group_ids, fetch_limits[EdgeSearchMethod.bm25]
+        )
+        for result, edges in zip(search_results, edges_lists):
+            result.append(edges)
+    if EdgeSearchMethod.cosine_similarity in fetch_limits:
+        edges_lists = await edge_similarity_search_bulk(
+            driver,
+            query_vectors,
+            search_filter,
+            group_ids,
+            fetch_limits[EdgeSearchMethod.cosine_similarity],
+            config.sim_min_score,
+        )
+        for result, edges in zip(search_results, edges_lists):
+            result.append(edges)
+    if EdgeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is not None:
+        # the origin nodes are shared by every query, so the traversal is only run once
+        bfs_edges = await edge_bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            config.bfs_max_depth,
+            search_filter,
+            fetch_limits[EdgeSearchMethod.bfs],
+        )
+        for result in search_results:
+            result.append(bfs_edges)
+
+    return list(
         await semaphore_gather(
             *[
-                edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-                edge_similarity_search(
+                rerank_edges(
                     driver,
+                    cross_encoder,
+                    query,
                     query_vector,
-                    None,
-                    None,
+                    result,
+                    config,
                     search_filter,
-                    group_ids,
-                    2 * limit,
-                    config.sim_min_score,
-                ),
-                edge_bfs_search(
-                    driver, bfs_origin_node_uuids, config.bfs_max_depth, search_filter, 2 * limit
-                ),
+                    center_node_uuid,
+                    bfs_origin_node_uuids,
+                    limit,
+                )
+                for query, query_vector, result in zip(queries, query_vectors, search_results)
             ]
         )
     )
 
-    if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
+
+async def node_search_batch(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    queries: list[str],
+    query_vectors: list[list[float]],
+    group_ids: list[str] | None,
+    config: NodeSearchConfig | None,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[list[EntityNode]]:
+    if config is None:
+        return [[] for _ in queries]
+
+    fetch_limits = plan_node_retrievers(config, limit)
+
+    search_results: list[list[list[EntityNode]]] = [[] for _ in queries]
+    if NodeSearchMethod.bm25 in fetch_limits:
+        nodes_lists = await node_fulltext_search_bulk(
+            driver, queries, search_filter, group_ids, fetch_limits[NodeSearchMethod.bm25]
+        )
+        for result, nodes in zip(search_results, nodes_lists):
+            result.append(nodes)
+    if NodeSearchMethod.cosine_similarity in fetch_limits:
+        nodes_lists = await node_similarity_search_bulk(
+            driver,
+            query_vectors,
+            search_filter,
+            group_ids,
+            fetch_limits[NodeSearchMethod.cosine_similarity],
+            config.sim_min_score,
+        )
+        for result, nodes in zip(search_results, nodes_lists):
+            result.append(nodes)
+    if NodeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is not None:
+        # the origin nodes are shared by every query, so the traversal is only run once
+        bfs_nodes = await node_bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            search_filter,
+            config.bfs_max_depth,
+            fetch_limits[NodeSearchMethod.bfs],
+        )
+        for result in search_results:
+            result.append(bfs_nodes)
+
+    return list(
+        await semaphore_gather(
+            *[
+                rerank_nodes(
+                    driver,
+                    cross_encoder,
+                    query,
+                    query_vector,
+                    result,
+                    config,
+                    search_filter,
+                    center_node_uuid,
+                    bfs_origin_node_uuids,
+                    limit,
+                )
+                for query, query_vector, result in zip(queries, query_vectors, search_results)
+            ]
+        )
+    )
+
+
+async def community_search_batch(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    queries: list[str],
+    query_vectors: list[list[float]],
+    group_ids: list[str] | None,
+    config: CommunitySearchConfig | None,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[list[CommunityNode]]:
+    if config is None:
+        return [[] for _ in queries]
+
+    fetch_limits = plan_community_retrievers(config, limit)
+
+    search_results: list[list[list[CommunityNode]]] = [[] for _ in queries]
+    if CommunitySearchMethod.bm25 in fetch_limits:
+        communities_lists = await community_fulltext_search_bulk(
+            driver, queries, group_ids, fetch_limits[CommunitySearchMethod.bm25]
+        )
+        for result, communities in zip(search_results, communities_lists):
+            result.append(communities)
+    if CommunitySearchMethod.cosine_similarity in fetch_limits:
+        communities_lists = await community_similarity_search_bulk(
+            driver,
+            query_vectors,
+            group_ids,
+            fetch_limits[CommunitySearchMethod.cosine_similarity],
+            config.sim_min_score,
+        )
+        for result, communities in zip(search_results, communities_lists):
+            result.append(communities)
+
+    return list(
+        await semaphore_gather(
+            *[
+                rerank_communities(cross_encoder, query, query_vector, result, config, limit)
+                for query, query_vector, result in zip(queries, query_vectors, search_results)
+            ]
+        )
+    )
+
+
+async def edge_search(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    group_ids: list[str] | None,
+    config: EdgeSearchConfig | None,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[EntityEdge]:
+    if config is None:
+        return []
+
+    fetch_limits = plan_edge_retrievers(config, limit)
+
+    retrievers = []
+    if EdgeSearchMethod.bm25 in fetch_limits:
+        retrievers.append(
+            edge_fulltext_search(
+                driver, query, search_filter, group_ids, fetch_limits[EdgeSearchMethod.bm25]
+            )
+        )
+    if EdgeSearchMethod.cosine_similarity in fetch_limits:
+        retrievers.append(
+            edge_similarity_search(
+                driver,
+                query_vector,
+                None,
+                None,
+                search_filter,
+                group_ids,
+                fetch_limits[EdgeSearchMethod.cosine_similarity],
+                config.sim_min_score,
+            )
+        )
+    if EdgeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is not None:
+        retrievers.append(
+            edge_bfs_search(
+                driver,
+                bfs_origin_node_uuids,
+                config.bfs_max_depth,
+                search_filter,
+                fetch_limits[EdgeSearchMethod.bfs],
+            )
+        )
+
+    search_results: list[list[EntityEdge]] = list(await semaphore_gather(*retrievers))
+
+    return await rerank_edges(
+        driver,
+        cross_encoder,
+        query,
+        query_vector,
+        search_results,
+        config,
+        search_filter,
+        center_node_uuid,
+        bfs_origin_node_uuids,
+        limit,
+    )
+
+
+async def rerank_edges(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    search_results: list[list[EntityEdge]],
+    config: EdgeSearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[EntityEdge]:
+    fetch_limits = plan_edge_retrievers(config, limit)
+
+    if EdgeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is None:
         source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
         search_results.append(
             await edge_bfs_search(
-                driver, source_node_uuids, config.bfs_max_depth, search_filter, 2 * limit
+                driver,
+                source_node_uuids,
+                config.bfs_max_depth,
+                search_filter,
+                fetch_limits[EdgeSearchMethod.bfs],
             )
         )
 
@@ -188,7 +545,7 @@ async def edge_search(
             for edge in result
         ]
         reranked_uuids = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda
+            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, limit
         )
     elif config.reranker == EdgeReranker.cross_encoder:
         search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
@@ -242,25 +599,76 @@ async def node_search(
     if config is None:
         return []
 
-    search_results: list[list[EntityNode]] = list(
-        await semaphore_gather(
-            *[
-                node_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-                node_similarity_search(
-                    driver, query_vector, search_filter, group_ids, 2 * limit, config.sim_min_score
-                ),
-                node_bfs_search(
-                    driver, bfs_origin_node_uuids, search_filter, config.bfs_max_depth, 2 * limit
-                ),
-            ]
+    fetch_limits = plan_node_retrievers(config, limit)
+
+    retrievers = []
+    if NodeSearchMethod.bm25 in fetch_limits:
+        retrievers.append(
+            node_fulltext_search(
+                driver, query, search_filter, group_ids, fetch_limits[NodeSearchMethod.bm25]
+            )
+        )
+    if NodeSearchMethod.cosine_similarity in fetch_limits:
+        retrievers.append(
+            node_similarity_search(
+                driver,
+                query_vector,
+                search_filter,
+                group_ids,
+                fetch_limits[NodeSearchMethod.cosine_similarity],
+                config.sim_min_score,
+            )
         )
+    if NodeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is not None:
+        retrievers.append(
+            node_bfs_search(
+                driver,
+                bfs_origin_node_uuids,
+                search_filter,
+                config.bfs_max_depth,
+                fetch_limits[NodeSearchMethod.bfs],
+            )
+        )
+
+    search_results: list[list[EntityNode]] = list(await semaphore_gather(*retrievers))
+
+    return await rerank_nodes(
+        driver,
+        cross_encoder,
+        query,
+        query_vector,
+        search_results,
+        config,
+        search_filter,
+        center_node_uuid,
+        bfs_origin_node_uuids,
+        limit,
     )
 
-    if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
+
+async def rerank_nodes(
+    driver: AsyncDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    search_results: list[list[EntityNode]],
+    config: NodeSearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[EntityNode]:
+    fetch_limits = plan_node_retrievers(config, limit)
+
+    if NodeSearchMethod.bfs in fetch_limits and bfs_origin_node_uuids is None:
         origin_node_uuids = [node.uuid for result in search_results for node in result]
         search_results.append(
             await node_bfs_search(
-                driver, origin_node_uuids, search_filter, config.bfs_max_depth, 2 * limit
+                driver,
+                origin_node_uuids,
+                search_filter,
+                config.bfs_max_depth,
+                fetch_limits[NodeSearchMethod.bfs],
             )
         )
 
@@ -277,7 +685,7 @@ async def node_search(
             for node in result
         ]
         reranked_uuids = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda
+            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, limit
         )
     elif config.reranker == NodeReranker.cross_encoder:
         # use rrf as a preliminary reranker
@@ -315,17 +723,41 @@ async def community_search(
     if config is None:
         return []
 
-    search_results: list[list[CommunityNode]] = list(
-        await semaphore_gather(
-            *[
-                community_fulltext_search(driver, query, group_ids, 2 * limit),
-                community_similarity_search(
-                    driver, query_vector, group_ids, 2 * limit, config.sim_min_score
-                ),
-            ]
+    fetch_limits = plan_community_retrievers(config, limit)
+
+    retrievers = []
+    if CommunitySearchMethod.bm25 in fetch_limits:
+        retrievers.append(
+            community_fulltext_search(
+                driver, query, group_ids, fetch_limits[CommunitySearchMethod.bm25]
+            )
         )
+    if CommunitySearchMethod.cosine_similarity in fetch_limits:
+        retrievers.append(
+            community_similarity_search(
+                driver,
+                query_vector,
+                group_ids,
+                fetch_limits[CommunitySearchMethod.cosine_similarity],
+                config.sim_min_score,
+            )
+        )
+
+    search_results: list[list[CommunityNode]] = list(await semaphore_gather(*retrievers))
+
+    return await rerank_communities(
+        cross_encoder, query, query_vector, search_results, config, limit
     )
 
+
+async def rerank_communities(
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    search_results: list[list[CommunityNode]],
+    config: CommunitySearchConfig,
+    limit=DEFAULT_SEARCH_LIMIT,
+) -> list[CommunityNode]:
     search_result_uuids = [[community.uuid for community in result] for result in search_results]
     community_uuid_map = {
         community.uuid: community for result in search_results for community in result
@@ -344,7 +776,7 @@ async def community_search(
             for community in result
         ]
         reranked_uuids = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda
+            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, limit
         )
     elif config.reranker == CommunityReranker.cross_encoder:
         summary_to_uuid_map = {
@@ -0,0 +1,91 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from enum import Enum
+from typing import TypeVar
+
+from graphiti_core.search.search_config import (
+    CommunityReranker,
+    CommunitySearchConfig,
+    CommunitySearchMethod,
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeReranker,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+
+# Candidates fetched per retriever, relative to the search limit, when the results of several
+# retrievers are fused or the reranker reorders them
+CANDIDATE_LIMIT_MULTIPLIER = 2
+
+M = TypeVar('M', bound=Enum)
+
+
+def get_fetch_limits(search_methods: list[M], reorders: bool, limit: int) -> dict[M, int]:
+    """
+    Number of results each retriever fetches.
+
+    A single retriever whose results are only truncated to the limit needs no more than limit
+    results. Fused or reordered results need extra candidates to choose from.
+    """
+    methods = list(dict.fromkeys(search_methods))
+    fetch_limit = (
+        limit if len(methods) == 1 and not reorders else CANDIDATE_LIMIT_MULTIPLIER * limit
+    )
+    return {method: fetch_limit for method in methods}
+
+
+def plan_edge_retrievers(config: EdgeSearchConfig, limit: int) -> dict[EdgeSearchMethod, int]:
+    # a cross encoder only reranks the top limit candidates of the fused results
+    reorders = config.reranker not in [EdgeReranker.rrf, EdgeReranker.cross_encoder]
+    return get_fetch_limits(config.search_methods, reorders, limit)
+
+
+def plan_node_retrievers(config: NodeSearchConfig, limit: int) -> dict[NodeSearchMethod, int]:
+    reorders = config.reranker not in [NodeReranker.rrf, NodeReranker.cross_encoder]
+    return get_fetch_limits(config.search_methods, reorders, limit)
+
+
+def plan_community_retrievers(
+    config: CommunitySearchConfig, limit: int
+) -> dict[CommunitySearchMethod, int]:
+    reorders = config.reranker != CommunityReranker.rrf
+    return get_fetch_limits(config.search_methods, reorders, limit)
+
+
+def needs_query_vector(config: SearchConfig) -> bool:
+    """Whether any retriever or reranker of the config uses the embedding of the query."""
+    uses_query_vector: list[bool] = []
+    if config.edge_config is not None:
+        uses_query_vector.append(
+            EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
+            or config.edge_config.reranker == EdgeReranker.mmr
+        )
+    if config.node_config is not None:
+        uses_query_vector.append(
+            NodeSearchMethod.cosine_similarity in config.node_config.search_methods
+            or config.node_config.reranker == NodeReranker.mmr
+        )
+    if config.community_config is not None:
+        uses_query_vector.append(
+            CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
+            or config.community_config.reranker == CommunityReranker.mmr
+        )
+
+    return any(uses_query_vector)
@@ -0,0 +1,146 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from graphiti_core.helpers import LRUCache
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+
+DEFAULT_SEARCH_RESULT_CACHE_SIZE = 256
+
+
+def get_search_key(
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+) -> str:
+    return json.dumps(
+        [
+            query,
+            sorted(group_ids) if group_ids else None,
+            config.model_dump(mode='json'),
+            search_filter.model_dump(mode='json'),
+            center_node_uuid,
+            bfs_origin_node_uuids,
+        ]
+    )
+
+
+class SearchResultCacheStats(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+@dataclass
+class _CachedSearchResults:
+    group_ids: list[str] | None
+    version: tuple[int, ...]
+    results: SearchResults
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search results, invalidated by writes to the searched groups.
+
+    Every group has a version counter that is bumped by each write to the group. Cached results
+    record the versions of the groups they were read from and are discarded once any of them
+    changes. Searches across all groups are invalidated by a write to any group.
+
+    Cached results are shared between callers and must not be modified. The cache only sees
+    writes made through the Graphiti instances sharing it; invalidate it after changing the graph
+    in any other way.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SEARCH_RESULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results = LRUCache(max_size=max_size)
+        # only groups that were written have a version, the others are at version 0
+        self._group_versions: dict[str, int] = {}
+        # bumped when the whole graph is invalidated
+        self._epoch = 0
+        # bumped by every write, so that it versions searches across all groups
+        self._write_count = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_version(self, group_ids: list[str] | None) -> tuple[int, ...]:
+        if not group_ids:
+            return (self._write_count,)
+
+        return (
+            self._epoch,
+            *[self._group_versions.get(group_id, 0) for group_id in sorted(group_ids)],
+        )
+
+    def get(self, key: str) -> SearchResults | None:
+        cached: _CachedSearchResults | None = self._results.get(key)
+        if cached is not None and cached.version != self.get_version(cached.group_ids):
+            self._results.delete(key)
+            cached = None
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return cached.results
+
+    def set(
+        self,
+        key: str,
+        group_ids: list[str] | None,
+        version: tuple[int, ...],
+        results: SearchResults,
+    ):
+        """
+        Cache the results of a search.
+
+        version is the version of the searched groups taken before the search started, so that
+        results of a search that raced with a write are discarded on their next read.
+        """
+        self._results.set(key, _CachedSearchResults(group_ids, version, results))
+
+    def invalidate(self, group_ids: list[str] | None = None):
+        """Invalidate the cached results of the given groups, or of every group if None."""
+        self._write_count += 1
+        if group_ids is None:
+            self._epoch += 1
+            self._results.clear()
+            return
+
+        for group_id in group_ids:
+            self._group_versions[group_id] = self._group_versions.get(group_id, 0) + 1
+
+    def stats(self) -> SearchResultCacheStats:
+        lookups = self.hits + self.misses
+        return SearchResultCacheStats(
+            size=len(self._results),
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+        )
@@ -26,9 +26,9 @@ from typing_extensions import LiteralString
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
 from graphiti_core.helpers import (
     DEFAULT_DATABASE,
+    USE_EXACT_VECTOR_SEARCH,
     USE_PARALLEL_RUNTIME,
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.nodes import (
@@ -51,6 +51,13 @@ DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
 MAX_SEARCH_DEPTH = 3
 MAX_QUERY_LENGTH = 32
+# Vector indexes are not group aware, so we over-fetch and filter the candidates afterwards
+VECTOR_INDEX_OVERFETCH_FACTOR = 10
+MIN_VECTOR_INDEX_CANDIDATES = 100
+
+
+def vector_index_limit(limit: int) -> int:
+    return max(limit * VECTOR_INDEX_OVERFETCH_FACTOR, MIN_VECTOR_INDEX_CANDIDATES)
 
 
 def fulltext_query(query: str, group_ids: list[str] | None = None):
@@ -159,10 +166,10 @@ async def edge_fulltext_search(
 
     cypher_query = Query(
         """
-              CALL db.index.fulltext.queryRelationships("edge_name_and_fact", $query, {limit: $limit}) 
-              YIELD relationship AS rel, score
-              MATCH (:Entity)-[r:RELATES_TO]->(:Entity)
-              WHERE r.group_id IN $group_ids"""
+              CALL db.index.fulltext.queryRelationships("edge_name_and_fact", $query, {limit: $limit})
+              YIELD relationship AS r, score
+              WITH r, score
+              WHERE type(r) = 'RELATES_TO' AND ($group_ids IS NULL OR r.group_id IN $group_ids)"""
         + filter_query
         + """\nWITH r, score, startNode(r) AS n, endNode(r) AS m
                RETURN
@@ -206,8 +213,15 @@ async def edge_similarity_search(
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
 ) -> list[EntityEdge]:
-    # vector similarity search over embedded facts
+    # Edges constrained to specific nodes are few, so scoring them directly is cheaper than the index
+    if not exact and source_node_uuid is None and target_node_uuid is None:
+        return await edge_vector_index_search(
+            driver, search_vector, search_filter, group_ids, limit, min_score
+        )
+
+    # exact vector similarity search over embedded facts
     runtime_query: LiteralString = (
         'CYPHER runtime = parallel parallelRuntimeSupport=all\n' if USE_PARALLEL_RUNTIME else ''
     )
@@ -274,6 +288,69 @@ async def edge_similarity_search(
     return edges
 
 
+async def edge_vector_index_search(
+    driver: AsyncDriver,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[EntityEdge]:
+    # approximate vector similarity search over embedded facts using the fact_embedding index
+    query_params: dict[str, Any] = {}
+
+    filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
+    query_params.update(filter_params)
+
+    group_filter_query: LiteralString = ''
+    if group_ids is not None:
+        group_filter_query += '\nAND r.group_id IN $group_ids'
+        query_params['group_ids'] = group_ids
+
+    query: LiteralString = (
+        """
+        CALL db.index.vector.queryRelationships("fact_embedding", $index_limit, $search_vector)
+        YIELD relationship AS r, score
+        WITH r, score, startNode(r) AS n, endNode(r) AS m
+        WHERE score > $min_score
+        """
+        + group_filter_query
+        + filter_query
+        + """
+        RETURN
+            r.uuid AS uuid,
+            r.group_id AS group_id,
+            n.uuid AS source_node_uuid,
+            m.uuid AS target_node_uuid,
+            r.created_at AS created_at,
+            r.name AS name,
+            r.fact AS fact,
+            r.fact_embedding AS fact_embedding,
+            r.episodes AS episodes,
+            r.expired_at AS expired_at,
+            r.valid_at AS valid_at,
+            r.invalid_at AS invalid_at
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        query_params,
+        search_vector=search_vector,
+        index_limit=vector_index_limit(limit),
+        limit=limit,
+        min_score=min_score,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
+    )
+
+    edges = [get_entity_edge_from_record(record) for record in records]
+
+    return edges
+
+
 async def edge_bfs_search(
     driver: AsyncDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -388,8 +465,14 @@ async def node_similarity_search(
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
 ) -> list[EntityNode]:
-    # vector similarity search over entity names
+    if not exact:
+        return await node_vector_index_search(
+            driver, search_vector, search_filter, group_ids, limit, min_score
+        )
+
+    # exact vector similarity search over entity names
     runtime_query: LiteralString = (
         'CYPHER runtime = parallel parallelRuntimeSupport=all\n' if USE_PARALLEL_RUNTIME else ''
     )
@@ -444,6 +527,65 @@ async def node_similarity_search(
     return nodes
 
 
+async def node_vector_index_search(
+    driver: AsyncDriver,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[EntityNode]:
+    # approximate vector similarity search over entity names using the entity_name_embedding index
+    query_params: dict[str, Any] = {}
+
+    group_filter_query: LiteralString = ''
+    if group_ids is not None:
+        group_filter_query += '\nAND n.group_id IN $group_ids'
+        query_params['group_ids'] = group_ids
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+    query_params.update(filter_params)
+
+    records, _, _ = await driver.execute_query(
+        """
+        CALL db.index.vector.queryNodes("entity_name_embedding", $index_limit, $search_vector)
+        YIELD node AS n, score
+        WITH n, score
+        WHERE score > $min_score
+        """
+        + group_filter_query
+        + filter_query
+        + """
+        RETURN
+            n.uuid As uuid,
+            n.group_id AS group_id,
+            n.name AS name,
+            n.name_embedding AS name_embedding,
+            n.created_at AS created_at,
+            n.summary AS summary,
+            labels(n) AS labels,
+            properties(n) AS attributes
+        ORDER BY score DESC
+        LIMIT $limit
+        """,
+        query_params,
+        search_vector=search_vector,
+        index_limit=vector_index_limit(limit),
+        limit=limit,
+        min_score=min_score,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
+    )
+    nodes = [get_entity_node_from_record(record) for record in records]
+
+    # Ensure all nodes have valid summaries (not None)
+    for node in nodes:
+        if node.summary is None:
+            node.summary = ""
+
+    return nodes
+
+
 async def node_bfs_search(
     driver: AsyncDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -535,8 +677,14 @@ async def community_similarity_search(
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score=DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
 ) -> list[CommunityNode]:
-    # vector similarity search over entity names
+    if not exact:
+        return await community_vector_index_search(
+            driver, search_vector, group_ids, limit, min_score
+        )
+
+    # exact vector similarity search over community names
     runtime_query: LiteralString = (
         'CYPHER runtime = parallel parallelRuntimeSupport=all\n' if USE_PARALLEL_RUNTIME else ''
     )
@@ -579,6 +727,440 @@ async def community_similarity_search(
     return communities
 
 
+async def community_vector_index_search(
+    driver: AsyncDriver,
+    search_vector: list[float],
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score=DEFAULT_MIN_SCORE,
+) -> list[CommunityNode]:
+    # approximate vector similarity search over community names using the community_name_embedding index
+    query_params: dict[str, Any] = {}
+
+    group_filter_query: LiteralString = ''
+    if group_ids is not None:
+        group_filter_query += '\nAND comm.group_id IN $group_ids'
+        query_params['group_ids'] = group_ids
+
+    records, _, _ = await driver.execute_query(
+        """
+        CALL db.index.vector.queryNodes("community_name_embedding", $index_limit, $search_vector)
+        YIELD node AS comm, score
+        WITH comm, score
+        WHERE score > $min_score
+        """
+        + group_filter_query
+        + """
+        RETURN
+            comm.uuid As uuid,
+            comm.group_id AS group_id,
+            comm.name AS name,
+            comm.name_embedding AS name_embedding,
+            comm.created_at AS created_at,
+            comm.summary AS summary
+        ORDER BY score DESC
+        LIMIT $limit
+        """,
+        query_params,
+        search_vector=search_vector,
+        index_limit=vector_index_limit(limit),
+        limit=limit,
+        min_score=min_score,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
+    )
+    communities = [get_community_node_from_record(record) for record in records]
+
+    return communities
+
+
+EDGE_SEARCH_BULK_RETURN: LiteralString = """
+        WITH search_query, r, score, startNode(r) AS n, endNode(r) AS m
+        RETURN
+            search_query.index AS search_index,
+            r.uuid AS uuid,
+            r.group_id AS group_id,
+            n.uuid AS source_node_uuid,
+            m.uuid AS target_node_uuid,
+            r.created_at AS created_at,
+            r.name AS name,
+            r.fact AS fact,
+            r.fact_embedding AS fact_embedding,
+            r.episodes AS episodes,
+            r.expired_at AS expired_at,
+            r.valid_at AS valid_at,
+            r.invalid_at AS invalid_at
+        ORDER BY search_index, score DESC
+        """
+
+NODE_SEARCH_BULK_RETURN: LiteralString = """
+        RETURN
+            search_query.index AS search_index,
+            n.uuid AS uuid,
+            n.group_id AS group_id,
+            n.name AS name,
+            n.name_embedding AS name_embedding,
+            n.created_at AS created_at,
+            n.summary AS summary,
+            labels(n) AS labels,
+            properties(n) AS attributes
+        ORDER BY search_index, score DESC
+        """
+
+COMMUNITY_SEARCH_BULK_RETURN: LiteralString = """
+        RETURN
+            search_query.index AS search_index,
+            comm.uuid AS uuid,
+            comm.group_id AS group_id,
+            comm.name AS name,
+            comm.name_embedding AS name_embedding,
+            comm.created_at AS created_at,
+            comm.summary AS summary
+        ORDER BY search_index, score DESC
+        """
+
+
+async def run_search_bulk(
+    driver: AsyncDriver,
+    query: LiteralString,
+    search_queries: list[dict[str, Any]],
+    query_params: dict[str, Any],
+    limit: int,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[Any]:
+    if len(search_queries) == 0:
+        return []
+
+    records, _, _ = await driver.execute_query(
+        query,
+        query_params,
+        search_queries=search_queries,
+        limit=limit,
+        index_limit=vector_index_limit(limit),
+        min_score=min_score,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
+    )
+
+    return records
+
+
+async def edge_fulltext_search_bulk(
+    driver: AsyncDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityEdge]]:
+    """Fulltext search over facts for every query in a single query, see edge_fulltext_search."""
+    search_queries = [
+        {'index': i, 'query': fulltext_query(query, group_ids)} for i, query in enumerate(queries)
+    ]
+    search_queries = [search_query for search_query in search_queries if search_query['query']]
+
+    filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            CALL db.index.fulltext.queryRelationships("edge_name_and_fact", search_query.query, {limit: $limit})
+            YIELD relationship AS r, score
+            WITH r, score
+            WHERE type(r) = 'RELATES_TO' AND ($group_ids IS NULL OR r.group_id IN $group_ids)
+            """
+        + filter_query
+        + """
+            RETURN r, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + EDGE_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(
+        driver, query, search_queries, {**filter_params, 'group_ids': group_ids}, limit
+    )
+
+    edges_lists: list[list[EntityEdge]] = [[] for _ in queries]
+    for record in records:
+        edges_lists[record['search_index']].append(get_entity_edge_from_record(record))
+
+    return edges_lists
+
+
+async def edge_similarity_search_bulk(
+    driver: AsyncDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
+) -> list[list[EntityEdge]]:
+    """Vector similarity search over facts for every search vector in a single query."""
+    search_queries = [
+        {'index': i, 'search_vector': search_vector}
+        for i, search_vector in enumerate(search_vectors)
+    ]
+
+    filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
+
+    if exact:
+        similarity_subquery: LiteralString = (
+            """
+            MATCH (:Entity)-[r:RELATES_TO]->(:Entity)
+            WHERE ($group_ids IS NULL OR r.group_id IN $group_ids)
+            """
+            + filter_query
+            + """
+            WITH DISTINCT r, vector.similarity.cosine(r.fact_embedding, search_query.search_vector) AS score
+            WHERE score > $min_score
+            """
+        )
+    else:
+        similarity_subquery = (
+            """
+            CALL db.index.vector.queryRelationships("fact_embedding", $index_limit, search_query.search_vector)
+            YIELD relationship AS r, score
+            WITH r, score
+            WHERE score > $min_score AND ($group_ids IS NULL OR r.group_id IN $group_ids)
+            """
+            + filter_query
+        )
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            """
+        + similarity_subquery
+        + """
+            RETURN r, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + EDGE_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(
+        driver, query, search_queries, {**filter_params, 'group_ids': group_ids}, limit, min_score
+    )
+
+    edges_lists: list[list[EntityEdge]] = [[] for _ in search_vectors]
+    for record in records:
+        edges_lists[record['search_index']].append(get_entity_edge_from_record(record))
+
+    return edges_lists
+
+
+async def node_fulltext_search_bulk(
+    driver: AsyncDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityNode]]:
+    """BM25 search over entities for every query in a single query, see node_fulltext_search."""
+    search_queries = [
+        {'index': i, 'query': fulltext_query(query, group_ids)} for i, query in enumerate(queries)
+    ]
+    search_queries = [search_query for search_query in search_queries if search_query['query']]
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            CALL db.index.fulltext.queryNodes("node_name_and_summary", search_query.query, {limit: $limit})
+            YIELD node AS n, score
+            WITH n, score
+            WHERE n:Entity
+            """
+        + filter_query
+        + """
+            RETURN n, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + NODE_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(driver, query, search_queries, filter_params, limit)
+
+    nodes_lists: list[list[EntityNode]] = [[] for _ in queries]
+    for record in records:
+        nodes_lists[record['search_index']].append(get_entity_node_from_record(record))
+
+    return nodes_lists
+
+
+async def node_similarity_search_bulk(
+    driver: AsyncDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
+) -> list[list[EntityNode]]:
+    """Vector similarity search over entity names for every search vector in a single query."""
+    search_queries = [
+        {'index': i, 'search_vector': search_vector}
+        for i, search_vector in enumerate(search_vectors)
+    ]
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+
+    if exact:
+        similarity_subquery: LiteralString = (
+            """
+            MATCH (n:Entity)
+            WHERE ($group_ids IS NULL OR n.group_id IN $group_ids)
+            """
+            + filter_query
+            + """
+            WITH n, vector.similarity.cosine(n.name_embedding, search_query.search_vector) AS score
+            WHERE score > $min_score
+            """
+        )
+    else:
+        similarity_subquery = (
+            """
+            CALL db.index.vector.queryNodes("entity_name_embedding", $index_limit, search_query.search_vector)
+            YIELD node AS n, score
+            WITH n, score
+            WHERE score > $min_score AND ($group_ids IS NULL OR n.group_id IN $group_ids)
+            """
+            + filter_query
+        )
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            """
+        + similarity_subquery
+        + """
+            RETURN n, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + NODE_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(
+        driver, query, search_queries, {**filter_params, 'group_ids': group_ids}, limit, min_score
+    )
+
+    nodes_lists: list[list[EntityNode]] = [[] for _ in search_vectors]
+    for record in records:
+        nodes_lists[record['search_index']].append(get_entity_node_from_record(record))
+
+    return nodes_lists
+
+
+async def community_fulltext_search_bulk(
+    driver: AsyncDriver,
+    queries: list[str],
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[list[CommunityNode]]:
+    """BM25 search over communities for every query in a single query."""
+    search_queries = [
+        {'index': i, 'query': fulltext_query(query, group_ids)} for i, query in enumerate(queries)
+    ]
+    search_queries = [search_query for search_query in search_queries if search_query['query']]
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            CALL db.index.fulltext.queryNodes("community_name", search_query.query, {limit: $limit})
+            YIELD node AS comm, score
+            RETURN comm, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + COMMUNITY_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(driver, query, search_queries, {}, limit)
+
+    communities_lists: list[list[CommunityNode]] = [[] for _ in queries]
+    for record in records:
+        communities_lists[record['search_index']].append(get_community_node_from_record(record))
+
+    return communities_lists
+
+
+async def community_similarity_search_bulk(
+    driver: AsyncDriver,
+    search_vectors: list[list[float]],
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
+) -> list[list[CommunityNode]]:
+    """Vector similarity search over community names for every search vector in a single query."""
+    search_queries = [
+        {'index': i, 'search_vector': search_vector}
+        for i, search_vector in enumerate(search_vectors)
+    ]
+
+    if exact:
+        similarity_subquery: LiteralString = """
+            MATCH (comm:Community)
+            WHERE ($group_ids IS NULL OR comm.group_id IN $group_ids)
+            WITH comm, vector.similarity.cosine(comm.name_embedding, search_query.search_vector) AS score
+            WHERE score > $min_score
+            """
+    else:
+        similarity_subquery = """
+            CALL db.index.vector.queryNodes("community_name_embedding", $index_limit, search_query.search_vector)
+            YIELD node AS comm, score
+            WITH comm, score
+            WHERE score > $min_score AND ($group_ids IS NULL OR comm.group_id IN $group_ids)
+            """
+
+    query: LiteralString = (
+        """
+        UNWIND $search_queries AS search_query
+        CALL {
+            WITH search_query
+            """
+        + similarity_subquery
+        + """
+            RETURN comm, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+        + COMMUNITY_SEARCH_BULK_RETURN
+    )
+
+    records = await run_search_bulk(
+        driver, query, search_queries, {'group_ids': group_ids}, limit, min_score
+    )
+
+    communities_lists: list[list[CommunityNode]] = [[] for _ in search_vectors]
+    for record in records:
+        communities_lists[record['search_index']].append(get_community_node_from_record(record))
+
+    return communities_lists
+
+
 async def hybrid_node_search(
     queries: list[str],
     embeddings: list[list[float]],
@@ -699,6 +1281,159 @@ async def get_relevant_nodes(
     return relevant_nodes
 
 
+async def get_relevant_nodes_bulk(
+    driver: AsyncDriver,
+    search_filter: SearchFilters,
+    nodes: list[EntityNode],
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    exact: bool = USE_EXACT_VECTOR_SEARCH,
+) -> list[list[EntityNode]]:
+    """
+    Retrieve the candidate duplicates for each of the provided EntityNodes.
+
+    This is the batched equivalent of calling get_relevant_nodes once per node: every node is
+    searched within its own group, but all nodes share a single fulltext query and a single
+    vector similarity query (via UNWIND), and the two rankings are combined per node with rrf.
+
+    Returns
+    -------
+    list[list[EntityNode]]
+        The relevant nodes for each input node, in the same order as the input nodes.
+    """
+    if len(nodes) == 0:
+        return []
+
+    start = time()
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+
+    fulltext_nodes = [
+        {'uuid': node.uuid, 'query': fulltext_query(node.name, [node.group_id])}
+        for node in nodes
+    ]
+    fulltext_nodes = [node for node in fulltext_nodes if node['query'] != '']
+
+    embedding_nodes = [
+        {'uuid': node.uuid, 'group_id': node.group_id, 'name_embedding': node.name_embedding}
+        for node in nodes
+        if node.name_embedding is not None
+    ]
+
+    fulltext_search_query: LiteralString = (
+        """
+        UNWIND $search_nodes AS search_node
+        CALL {
+            WITH search_node
+            CALL db.index.fulltext.queryNodes("node_name_and_summary", search_node.query, {limit: $limit})
+            YIELD node AS n, score
+            WITH n, score
+            WHERE n:Entity
+            """
+        + filter_query
+        + """
+            RETURN n, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+    )
+
+    if exact:
+        similarity_subquery: LiteralString = (
+            """
+            MATCH (n:Entity)
+            WHERE n.group_id = search_node.group_id
+            """
+            + filter_query
+            + """
+            WITH n, vector.similarity.cosine(n.name_embedding, search_node.name_embedding) AS score
+            WHERE score > $min_score
+            """
+        )
+    else:
+        similarity_subquery = (
+            """
+            CALL db.index.vector.queryNodes("entity_name_embedding", $index_limit, search_node.name_embedding)
+            YIELD node AS n, score
+            WITH search_node, n, score
+            WHERE score > $min_score AND n.group_id = search_node.group_id
+            """
+            + filter_query
+        )
+
+    similarity_search_query: LiteralString = (
+        """
+        UNWIND $search_nodes AS search_node
+        CALL {
+            WITH search_node
+            """
+        + similarity_subquery
+        + """
+            RETURN n, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        """
+    )
+
+    return_query: LiteralString = """
+        RETURN
+            search_node.uuid AS search_node_uuid,
+            n.uuid AS uuid,
+            n.group_id AS group_id,
+            n.name AS name,
+            n.name_embedding AS name_embedding,
+            n.created_at AS created_at,
+            n.summary AS summary,
+            labels(n) AS labels,
+            properties(n) AS attributes
+        ORDER BY search_node_uuid, score DESC
+        """
+
+    async def run_search(query: LiteralString, search_nodes: list[dict[str, Any]]) -> list[Any]:
+        if len(search_nodes) == 0:
+            return []
+
+        records, _, _ = await driver.execute_query(
+            query + return_query,
+            filter_params,
+            search_nodes=search_nodes,
+            limit=2 * limit,
+            index_limit=vector_index_limit(2 * limit),
+            min_score=min_score,
+            database_=DEFAULT_DATABASE,
+            routing_='r',
+        )
+
+        return records
+
+    fulltext_records, similarity_records = await semaphore_gather(
+        run_search(fulltext_search_query, fulltext_nodes),
+        run_search(similarity_search_query, embedding_nodes),
+    )
+
+    # candidates are kept per search node so that no EntityNode instance is shared between lists
+    node_uuid_maps: dict[str, dict[str, EntityNode]] = {node.uuid: {} for node in nodes}
+    results: dict[str, list[list[str]]] = {node.uuid: [[], []] for node in nodes}
+    for i, records in enumerate([fulltext_records, similarity_records]):
+        for record in records:
+            node = get_entity_node_from_record(record)
+            if node.summary is None:
+                node.summary = ''
+            node_uuid_maps[record['search_node_uuid']][node.uuid] = node
+            results[record['search_node_uuid']][i].append(node.uuid)
+
+    relevant_nodes_lists: list[list[EntityNode]] = [
+        [node_uuid_maps[node.uuid][uuid] for uuid in rrf(results[node.uuid])] for node in nodes
+    ]
+
+    end = time()
+    logger.debug(f'Found relevant nodes for {len(nodes)} nodes in {(end - start) * 1000} ms')
+
+    return relevant_nodes_lists
+
+
 async def get_relevant_edges(
     driver: AsyncDriver,
     edges: list[EntityEdge],
@@ -740,6 +1475,126 @@ async def get_relevant_edges(
     return relevant_edges
 
 
+async def get_relevant_edges_bulk(
+    driver: AsyncDriver,
+    edges: list[EntityEdge],
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> tuple[list[list[EntityEdge]], list[list[EntityEdge]]]:
+    """
+    Retrieve the resolution candidates for each of the provided EntityEdges in a single query.
+
+    For every edge three buckets of similar edges are fetched from its group: edges between the
+    same two nodes (related), edges leaving its source node and edges entering its target node.
+
+    Returns
+    -------
+    tuple[list[list[EntityEdge]], list[list[EntityEdge]]]
+        The related edges and the existing (source or target adjacent, deduplicated) edges for
+        each input edge, in the same order as the input edges.
+    """
+    if len(edges) == 0:
+        return [], []
+
+    start = time()
+
+    search_edges = [
+        {
+            'uuid': edge.uuid,
+            'group_id': edge.group_id,
+            'source_node_uuid': edge.source_node_uuid,
+            'target_node_uuid': edge.target_node_uuid,
+            'fact_embedding': edge.fact_embedding,
+        }
+        for edge in edges
+        if edge.fact_embedding is not None
+    ]
+
+    query: LiteralString = """
+        UNWIND $edges AS edge
+        CALL {
+            WITH edge
+            MATCH (n:Entity)-[r:RELATES_TO]->(m:Entity)
+            WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid]
+                AND m.uuid IN [edge.source_node_uuid, edge.target_node_uuid]
+                AND r.group_id = edge.group_id
+            WITH DISTINCT r, n, m, vector.similarity.cosine(r.fact_embedding, edge.fact_embedding) AS score
+            WHERE score > $min_score
+            RETURN 'related' AS bucket, r, n, m, score
+            ORDER BY score DESC
+            LIMIT $limit
+            UNION ALL
+            WITH edge
+            MATCH (n:Entity {uuid: edge.source_node_uuid})-[r:RELATES_TO]->(m:Entity)
+            WHERE r.group_id = edge.group_id
+            WITH r, n, m, vector.similarity.cosine(r.fact_embedding, edge.fact_embedding) AS score
+            WHERE score > $min_score
+            RETURN 'source' AS bucket, r, n, m, score
+            ORDER BY score DESC
+            LIMIT $limit
+            UNION ALL
+            WITH edge
+            MATCH (n:Entity)-[r:RELATES_TO]->(m:Entity {uuid: edge.target_node_uuid})
+            WHERE r.group_id = edge.group_id
+            WITH r, n, m, vector.similarity.cosine(r.fact_embedding, edge.fact_embedding) AS score
+            WHERE score > $min_score
+            RETURN 'target' AS bucket, r, n, m, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        RETURN
+            edge.uuid AS search_edge_uuid,
+            bucket,
+            r.uuid AS uuid,
+            r.group_id AS group_id,
+            n.uuid AS source_node_uuid,
+            m.uuid AS target_node_uuid,
+            r.created_at AS created_at,
+            r.name AS name,
+            r.fact AS fact,
+            r.fact_embedding AS fact_embedding,
+            r.episodes AS episodes,
+            r.expired_at AS expired_at,
+            r.valid_at AS valid_at,
+            r.invalid_at AS invalid_at
+        ORDER BY search_edge_uuid, bucket, score DESC
+        """
+
+    records: list[Any] = []
+    if len(search_edges) > 0:
+        records, _, _ = await driver.execute_query(
+            query,
+            edges=search_edges,
+            limit=limit,
+            min_score=min_score,
+            database_=DEFAULT_DATABASE,
+            routing_='r',
+        )
+
+    related_edges_map: dict[str, list[EntityEdge]] = {edge.uuid: [] for edge in edges}
+    existing_edges_map: dict[str, list[EntityEdge]] = {edge.uuid: [] for edge in edges}
+    existing_edge_uuids: dict[str, set[str]] = {edge.uuid: set() for edge in edges}
+    for record in records:
+        search_edge_uuid = record['search_edge_uuid']
+        if record['bucket'] == 'related':
+            related_edges_map[search_edge_uuid].append(get_entity_edge_from_record(record))
+            continue
+
+        # an edge between the source and target nodes is returned by both adjacency buckets
+        if record['uuid'] in existing_edge_uuids[search_edge_uuid]:
+            continue
+        existing_edge_uuids[search_edge_uuid].add(record['uuid'])
+        existing_edges_map[search_edge_uuid].append(get_entity_edge_from_record(record))
+
+    end = time()
+    logger.debug(f'Found relevant edges for {len(edges)} edges in {(end - start) * 1000} ms')
+
+    return (
+        [related_edges_map[edge.uuid] for edge in edges],
+        [existing_edges_map[edge.uuid] for edge in edges],
+    )
+
+
 # takes in a list of rankings of uuids
 def rrf(results: list[list[str]], rank_const=1) -> list[str]:
     scores: dict[str, float] = defaultdict(float)
@@ -756,34 +1611,52 @@ def rrf(results: list[list[str]], rank_const=1) -> list[str]:
 
 
 async def node_distance_reranker(
-    driver: AsyncDriver, node_uuids: list[str], center_node_uuid: str
+    driver: AsyncDriver,
+    node_uuids: list[str],
+    center_node_uuid: str,
+    max_depth: int = MAX_SEARCH_DEPTH,
 ) -> list[str]:
+    """
+    Rank nodes by their hop distance from the center node.
+
+    Distances are found by a single breadth first search from the center node, expanding one
+    hop per query and stopping once every node is found or max_depth hops were expanded. Nodes
+    further than max_depth hops away, or not connected to the center node, rank last in their
+    original order.
+    """
     # filter out node_uuid center node node uuid
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
-    # Find the shortest path to center node
     query = Query("""
-        UNWIND $node_uuids AS node_uuid
-        MATCH p = SHORTEST 1 (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-+(n:Entity {uuid: node_uuid})
-        RETURN length(p) AS score, node_uuid AS uuid
+        UNWIND $frontier_uuids AS frontier_uuid
+        MATCH (:Entity {uuid: frontier_uuid})-[:RELATES_TO]-(n:Entity)
+        RETURN DISTINCT n.uuid AS uuid
         """)
 
-    path_results, _, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        database_=DEFAULT_DATABASE,
-    )
+    unscored_uuids = set(filtered_uuids)
+    visited_uuids = {center_node_uuid}
+    frontier_uuids = [center_node_uuid]
+    depth = 0
+    while frontier_uuids and unscored_uuids and depth < max_depth:
+        depth += 1
+        records, _, _ = await driver.execute_query(
+            query,
+            frontier_uuids=frontier_uuids,
+            database_=DEFAULT_DATABASE,
+            routing_='r',
+        )
 
-    for result in path_results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+        frontier_uuids = [
+            record['uuid'] for record in records if record['uuid'] not in visited_uuids
+        ]
+        visited_uuids.update(frontier_uuids)
+        for uuid in unscored_uuids.intersection(frontier_uuids):
+            scores[uuid] = depth
+        unscored_uuids.difference_update(frontier_uuids)
 
-    for uuid in filtered_uuids:
-        if uuid not in scores:
-            scores[uuid] = float('inf')
+    for uuid in unscored_uuids:
+        scores[uuid] = float('inf')
 
     # rerank on shortest distance
     filtered_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
@@ -826,13 +1699,49 @@ def maximal_marginal_relevance(
     query_vector: list[float],
     candidates: list[tuple[str, list[float]]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
-):
-    candidates_with_mmr: list[tuple[str, float]] = []
-    for candidate in candidates:
-        max_sim = max([np.dot(normalize_l2(candidate[1]), normalize_l2(c[1])) for c in candidates])
-        mmr = mmr_lambda * np.dot(candidate[1], query_vector) - (1 - mmr_lambda) * max_sim
-        candidates_with_mmr.append((candidate[0], mmr))
+    limit: int | None = None,
+) -> list[str]:
+    """
+    Greedily select the candidates most relevant to the query and least similar to the
+    candidates already selected, returning up to limit uuids in selection order.
 
-    candidates_with_mmr.sort(reverse=True, key=lambda c: c[1])
+    Candidates are deduplicated by uuid. Embeddings that do not match the dimension of the query
+    vector are treated as zero vectors.
+    """
+    candidate_embeddings: dict[str, list[float]] = {}
+    for uuid, embedding in candidates:
+        candidate_embeddings.setdefault(uuid, embedding)
+    if len(candidate_embeddings) == 0:
+        return []
 
-    return list(set([candidate[0] for candidate in candidates_with_mmr]))
+    uuids = list(candidate_embeddings.keys())
+    query = np.asarray(query_vector, dtype=np.float32)
+    embeddings = np.zeros((len(uuids), len(query)), dtype=np.float32)
+    for i, embedding in enumerate(candidate_embeddings.values()):
+        if len(embedding) == len(query):
+            embeddings[i] = embedding
+
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms != 0)
+    query_norm = np.linalg.norm(query)
+    if query_norm != 0:
+        query = query / query_norm
+
+    relevance = embeddings @ query
+
+    # only the similarities to selected candidates are needed, so they are computed as each
+    # candidate is selected rather than as a full candidate by candidate matrix
+    num_selected = len(uuids) if limit is None else min(limit, len(uuids))
+    selected = [int(np.argmax(relevance))]
+    max_similarity = embeddings @ embeddings[selected[0]]
+    remaining = np.ones(len(uuids), dtype=bool)
+    remaining[selected[0]] = False
+    while len(selected) < num_selected:
+        scores = mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity
+        scores[~remaining] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        remaining[best] = False
+        np.maximum(max_similarity, embeddings @ embeddings[best], out=max_similarity)
+
+    return [uuids[i] for i in selected]
@@ -0,0 +1,201 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import closing
+from enum import Enum
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from graphiti_core.edges import EntityEdge, EpisodicEdge
+from graphiti_core.errors import CheckpointMismatchError
+from graphiti_core.nodes import EntityNode, EpisodicNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = './bulk_checkpoints.sqlite'
+
+M = TypeVar('M', bound=BaseModel)
+
+
+class BulkIngestionStage(str, Enum):
+    """Stages of add_episode_bulk, in the order they complete for a window."""
+
+    episodes_created = 'episodes_created'
+    extracted = 'extracted'
+    nodes_deduped = 'nodes_deduped'
+    edges_dated = 'edges_dated'
+    edges_deduped = 'edges_deduped'
+    persisted = 'persisted'
+
+
+class CreatedEpisodes(BaseModel):
+    episodes: list[EpisodicNode]
+
+
+class ExtractedNodesAndEdges(BaseModel):
+    nodes: list[EntityNode]
+    edges: list[EntityEdge]
+    episodic_edges: list[EpisodicEdge]
+
+
+class DedupedNodes(BaseModel):
+    nodes: list[EntityNode]
+    uuid_map: dict[str, str]
+
+
+class ResolvedEdges(BaseModel):
+    edges: list[EntityEdge]
+
+
+class PersistedWindow(BaseModel):
+    episode_count: int
+
+
+class BulkCheckpointStore:
+    """
+    SQLite store of the completed stages of checkpointed bulk ingestion jobs.
+
+    Each stage stores its output, so a restarted job loads the output of every completed stage
+    instead of repeating the LLM calls that produced it. Blocking SQLite access is run in a
+    worker thread.
+    """
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        self.path = path
+        self._initialized = False
+
+    def window(self, job_id: str, window: int) -> 'BulkWindowCheckpoint':
+        return BulkWindowCheckpoint(self, job_id, window)
+
+    async def completed_stages(self, job_id: str, window: int) -> list[BulkIngestionStage]:
+        rows = await self._execute(
+            'SELECT stage FROM stages WHERE job_id = ? AND window_index = ?', (job_id, window)
+        )
+        stages = {row[0] for row in rows}
+        return [stage for stage in BulkIngestionStage if stage.value in stages]
+
+    async def delete_job(self, job_id: str):
+        await self._execute('DELETE FROM stages WHERE job_id = ?', (job_id,))
+        await self._execute('DELETE FROM windows WHERE job_id = ?', (job_id,))
+
+    async def get_stage(self, job_id: str, window: int, stage: BulkIngestionStage) -> str | None:
+        rows = await self._execute(
+            'SELECT payload FROM stages WHERE job_id = ? AND window_index = ? AND stage = ?',
+            (job_id, window, stage.value),
+        )
+        return rows[0][0] if rows else None
+
+    async def set_stage(self, job_id: str, window: int, stage: BulkIngestionStage, payload: str):
+        await self._execute(
+            'INSERT OR REPLACE INTO stages (job_id, window_index, stage, payload) VALUES (?, ?, ?, ?)',
+            (job_id, window, stage.value, payload),
+        )
+
+    async def check_fingerprint(self, job_id: str, window: int, fingerprint: str):
+        """Record the fingerprint of a new window, or verify it matches the recorded one."""
+        rows = await self._execute(
+            'SELECT fingerprint FROM windows WHERE job_id = ? AND window_index = ?',
+            (job_id, window),
+        )
+        if not rows:
+            await self._execute(
+                'INSERT INTO windows (job_id, window_index, fingerprint) VALUES (?, ?, ?)',
+                (job_id, window, fingerprint),
+            )
+        elif rows[0][0] != fingerprint:
+            raise CheckpointMismatchError(job_id, window)
+
+    async def _execute(self, query: str, parameters: tuple) -> list[tuple]:
+        return await asyncio.to_thread(self._execute_sync, query, parameters)
+
+    def _execute_sync(self, query: str, parameters: tuple) -> list[tuple]:
+        with closing(sqlite3.connect(self.path)) as connection:
+            if not self._initialized:
+                connection.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS windows (
+                        job_id TEXT NOT NULL,
+                        window_index INTEGER NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        PRIMARY KEY (job_id, window_index)
+                    );
+                    CREATE TABLE IF NOT EXISTS stages (
+                        job_id TEXT NOT NULL,
+                        window_index INTEGER NOT NULL,
+                        stage TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        PRIMARY KEY (job_id, window_index, stage)
+                    );
+                    """
+                )
+                self._initialized = True
+
+            with connection:
+                return connection.execute(query, parameters).fetchall()
+
+
+class BulkWindowCheckpoint:
+    """The checkpoint of a single window of episodes of a bulk ingestion job."""
+
+    def __init__(self, store: BulkCheckpointStore, job_id: str, window: int):
+        self.store = store
+        self.job_id = job_id
+        self.window = window
+
+    async def start(self, fingerprint: str):
+        await self.store.check_fingerprint(self.job_id, self.window, fingerprint)
+
+    async def load(self, stage: BulkIngestionStage, model: type[M]) -> M | None:
+        payload = await self.store.get_stage(self.job_id, self.window, stage)
+        if payload is None:
+            return None
+
+        logger.info(f'Resuming job {self.job_id} window {self.window} from stage {stage.value}')
+        return model.model_validate_json(payload)
+
+    async def save(self, stage: BulkIngestionStage, output: BaseModel):
+        await self.store.set_stage(self.job_id, self.window, stage, output.model_dump_json())
+
+
+def get_window_fingerprint(episodes: Sequence[BaseModel], group_id: str) -> str:
+    content = group_id + '\n' + '\n'.join(episode.model_dump_json() for episode in episodes)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+async def run_checkpointed_stage(
+    checkpoint: BulkWindowCheckpoint | None,
+    stage: BulkIngestionStage,
+    model: type[M],
+    run: Callable[[], Awaitable[M]],
+) -> M:
+    """Load the output of a completed stage, or run the stage and record its output."""
+    if checkpoint is not None:
+        output = await checkpoint.load(stage, model)
+        if output is not None:
+            return output
+
+    output = await run()
+
+    if checkpoint is not None:
+        await checkpoint.save(stage, output)
+
+    return output
@@ -18,28 +18,30 @@ import logging
 import typing
 from collections import defaultdict
 from datetime import datetime
-from math import ceil
 
+import numpy as np
 from neo4j import AsyncDriver, AsyncManagedTransaction
-from numpy import dot, sqrt
 from pydantic import BaseModel
-from typing_extensions import Any
+from typing_extensions import Any, LiteralString
 
-from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge
-from graphiti_core.helpers import semaphore_gather
+from graphiti_core.edges import CommunityEdge, Edge, EntityEdge, EpisodicEdge
+from graphiti_core.helpers import BULK_WRITE_BATCH_SIZE, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.models.edges.edge_db_queries import (
+    COMMUNITY_EDGE_SAVE_BULK,
     ENTITY_EDGE_SAVE_BULK,
     EPISODIC_EDGE_SAVE_BULK,
 )
 from graphiti_core.models.nodes.node_db_queries import (
+    COMMUNITY_NODE_SAVE_BULK,
     ENTITY_NODE_SAVE_BULK,
     EPISODIC_NODE_SAVE_BULK,
 )
-from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import get_relevant_edges, get_relevant_nodes
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.episode_window_cache import EpisodeWindowCache
 from graphiti_core.utils.maintenance.edge_operations import (
     build_episodic_edges,
     dedupe_edge_list,
@@ -48,7 +50,7 @@ from graphiti_core.utils.maintenance.edge_operations import (
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
-    retrieve_episodes,
+    retrieve_episodes_bulk,
 )
 from graphiti_core.utils.maintenance.node_operations import (
     dedupe_extracted_nodes,
@@ -60,6 +62,10 @@ from graphiti_core.utils.maintenance.temporal_operations import extract_edge_dat
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 10
+# Number of episodes processed together by Graphiti.add_episode_bulk_stream
+BULK_EPISODE_WINDOW_SIZE = 50
+# Number of nearest neighbours per node considered when drafting nodes into dedupe chunks
+SIMILAR_NODES_TOP_K = 5
 
 
 class RawEpisode(BaseModel):
@@ -71,16 +77,34 @@ class RawEpisode(BaseModel):
 
 
 async def retrieve_previous_episodes_bulk(
-    driver: AsyncDriver, episodes: list[EpisodicNode]
+    driver: AsyncDriver,
+    episodes: list[EpisodicNode],
+    episode_window_cache: EpisodeWindowCache | None = None,
 ) -> list[tuple[EpisodicNode, list[EpisodicNode]]]:
-    previous_episodes_list = await semaphore_gather(
-        *[
-            retrieve_episodes(
-                driver, episode.valid_at, last_n=EPISODE_WINDOW_LEN, group_ids=[episode.group_id]
-            )
-            for episode in episodes
+    # Episodes are saved before their context is retrieved, so each one is left out of its own window
+    if episode_window_cache is not None:
+        # One read per group fills the windows, after which every episode is answered from memory
+        await episode_window_cache.load(driver, [episode.group_id for episode in episodes])
+        windows = await semaphore_gather(
+            *[
+                episode_window_cache.retrieve_episodes(
+                    driver, episode.valid_at, EPISODE_WINDOW_LEN + 1, episode.group_id
+                )
+                for episode in episodes
+            ]
+        )
+        previous_episodes_list = [
+            [e for e in window if e.uuid != episode.uuid][-EPISODE_WINDOW_LEN:]
+            for episode, window in zip(episodes, windows)
         ]
-    )
+    else:
+        previous_episodes_list = await retrieve_episodes_bulk(
+            driver,
+            [(episode.group_id, episode.valid_at) for episode in episodes],
+            last_n=EPISODE_WINDOW_LEN,
+            exclude_uuids=[episode.uuid for episode in episodes],
+        )
+
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]] = [
         (episode, previous_episodes_list[i]) for i, episode in enumerate(episodes)
     ]
@@ -94,10 +118,16 @@ async def add_nodes_and_edges_bulk(
     episodic_edges: list[EpisodicEdge],
     entity_nodes: list[EntityNode],
     entity_edges: list[EntityEdge],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
 ):
     async with driver.session() as session:
         await session.execute_write(
-            add_nodes_and_edges_bulk_tx, episodic_nodes, episodic_edges, entity_nodes, entity_edges
+            add_nodes_and_edges_bulk_tx,
+            episodic_nodes,
+            episodic_edges,
+            entity_nodes,
+            entity_edges,
+            batch_size,
         )
 
 
@@ -107,6 +137,7 @@ async def add_nodes_and_edges_bulk_tx(
     episodic_edges: list[EpisodicEdge],
     entity_nodes: list[EntityNode],
     entity_edges: list[EntityEdge],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
 ):
     episodes = [dict(episode) for episode in episodic_nodes]
     for episode in episodes:
@@ -126,10 +157,76 @@ async def add_nodes_and_edges_bulk_tx(
         entity_data['labels'] = list(set(node.labels + ['Entity']))
         nodes.append(entity_data)
 
-    await tx.run(EPISODIC_NODE_SAVE_BULK, episodes=episodes)
-    await tx.run(ENTITY_NODE_SAVE_BULK, nodes=nodes)
-    await tx.run(EPISODIC_EDGE_SAVE_BULK, episodic_edges=[dict(edge) for edge in episodic_edges])
-    await tx.run(ENTITY_EDGE_SAVE_BULK, entity_edges=[dict(edge) for edge in entity_edges])
+    # Nodes are written before the edges that match on them
+    await run_bulk_query(tx, EPISODIC_NODE_SAVE_BULK, 'episodes', episodes, batch_size)
+    await run_bulk_query(tx, ENTITY_NODE_SAVE_BULK, 'nodes', nodes, batch_size)
+    await run_bulk_query(
+        tx,
+        EPISODIC_EDGE_SAVE_BULK,
+        'episodic_edges',
+        [dict(edge) for edge in episodic_edges],
+        batch_size,
+    )
+    await run_bulk_query(
+        tx,
+        ENTITY_EDGE_SAVE_BULK,
+        'entity_edges',
+        [dict(edge) for edge in entity_edges],
+        batch_size,
+    )
+
+
+async def add_communities_bulk(
+    driver: AsyncDriver,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
+):
+    async with driver.session() as session:
+        await session.execute_write(
+            add_communities_bulk_tx, community_nodes, community_edges, batch_size
+        )
+
+
+async def add_communities_bulk_tx(
+    tx: AsyncManagedTransaction,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
+):
+    communities = [
+        {
+            'uuid': node.uuid,
+            'name': node.name,
+            'name_embedding': node.name_embedding,
+            'group_id': node.group_id,
+            'summary': node.summary,
+            'created_at': node.created_at,
+        }
+        for node in community_nodes
+    ]
+
+    await run_bulk_query(tx, COMMUNITY_NODE_SAVE_BULK, 'communities', communities, batch_size)
+    await run_bulk_query(
+        tx,
+        COMMUNITY_EDGE_SAVE_BULK,
+        'community_edges',
+        [dict(edge) for edge in community_edges],
+        batch_size,
+    )
+
+
+async def run_bulk_query(
+    tx: AsyncManagedTransaction,
+    query: LiteralString,
+    parameter: str,
+    rows: list[dict[str, Any]],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
+):
+    # Each UNWIND statement gets at most batch_size rows, all statements share the transaction
+    for i in range(0, len(rows), batch_size):
+        result = await tx.run(query, {parameter: rows[i : i + batch_size]})
+        await result.consume()
 
 
 async def extract_nodes_and_edges_bulk(
@@ -185,7 +282,10 @@ async def dedupe_nodes_bulk(
 
     compressed_nodes, compressed_map = await compress_nodes(llm_client, nodes, uuid_map)
 
-    node_chunks = [nodes[i : i + CHUNK_SIZE] for i in range(0, len(nodes), CHUNK_SIZE)]
+    # Only the nodes that survived compression are resolved against the graph
+    node_chunks = [
+        compressed_nodes[i : i + CHUNK_SIZE] for i in range(0, len(compressed_nodes), CHUNK_SIZE)
+    ]
 
     existing_nodes_chunks: list[list[EntityNode]] = list(
         await semaphore_gather(
@@ -208,7 +308,7 @@ async def dedupe_nodes_bulk(
         partial_uuid_map = result[1]
         compressed_map.update(partial_uuid_map)
 
-    return final_nodes, compressed_map
+    return final_nodes, compress_uuid_map(compressed_map)
 
 
 async def dedupe_edges_bulk(
@@ -253,6 +353,87 @@ def node_name_match(nodes: list[EntityNode]) -> tuple[list[EntityNode], dict[str
     return [node for node in name_map.values()], uuid_map
 
 
+def similar_node_pairs(
+    nodes: list[EntityNode], top_k: int = SIMILAR_NODES_TOP_K, block_size: int = 1024
+) -> list[tuple[int, int, float]]:
+    """
+    Return (i, j, score) for the top_k most similar nodes of every node by name embedding dot
+    product, sorted from the most to the least similar pair.
+    """
+    if len(nodes) < 2:
+        return []
+
+    dim = max((len(node.name_embedding or []) for node in nodes), default=0)
+    if dim == 0:
+        return []
+
+    # Nodes without an embedding get a zero vector and so are never more similar than any other
+    embeddings = np.zeros((len(nodes), dim), dtype=np.float32)
+    for i, node in enumerate(nodes):
+        if node.name_embedding:
+            embeddings[i] = node.name_embedding
+
+    k = min(top_k, len(nodes) - 1)
+    pairs: list[tuple[int, int, float]] = []
+    # Score in row blocks so that memory stays bounded by block_size * len(nodes)
+    for start in range(0, len(nodes), block_size):
+        scores = embeddings[start : start + block_size] @ embeddings.T
+        rows = np.arange(scores.shape[0])
+        scores[rows, rows + start] = -np.inf
+        neighbors = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        neighbor_scores = scores[rows[:, None], neighbors]
+        for row, (row_neighbors, row_scores) in enumerate(zip(neighbors, neighbor_scores)):
+            pairs.extend(
+                (start + row, int(j), float(score)) for j, score in zip(row_neighbors, row_scores)
+            )
+
+    pairs.sort(key=lambda pair: pair[2], reverse=True)
+    return pairs
+
+
+def cluster_similar_nodes(nodes: list[EntityNode], chunk_size: int) -> list[list[EntityNode]]:
+    """
+    Group nodes into chunks of at most chunk_size so that similar nodes share a chunk.
+
+    The most similar pairs are merged first with a size-capped union-find, then the clusters are
+    packed into chunks, largest first.
+    """
+    parent = list(range(len(nodes)))
+    size = [1] * len(nodes)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in similar_node_pairs(nodes):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j or size[root_i] + size[root_j] > chunk_size:
+            continue
+        if size[root_i] < size[root_j]:
+            root_i, root_j = root_j, root_i
+        parent[root_j] = root_i
+        size[root_i] += size[root_j]
+
+    clusters: dict[int, list[EntityNode]] = defaultdict(list)
+    for i, node in enumerate(nodes):
+        clusters[find(i)].append(node)
+
+    node_chunks: list[list[EntityNode]] = []
+    chunk: list[EntityNode] = []
+    for cluster in sorted(clusters.values(), key=len, reverse=True):
+        if len(chunk) + len(cluster) > chunk_size:
+            node_chunks.append(chunk)
+            chunk = []
+        chunk.extend(cluster)
+
+    if chunk:
+        node_chunks.append(chunk)
+
+    return node_chunks
+
+
 async def compress_nodes(
     llm_client: LLMClient, nodes: list[EntityNode], uuid_map: dict[str, str]
 ) -> tuple[list[EntityNode], dict[str, str]]:
@@ -263,51 +444,10 @@ async def compress_nodes(
     # Our approach involves us deduplicating chunks of nodes in parallel.
     # We want n chunks of size n so that n ** 2 == len(nodes).
     # We want chunk sizes to be at least 10 for optimizing LLM processing time
-    chunk_size = max(int(sqrt(len(nodes))), CHUNK_SIZE)
-
-    # First calculate similarity scores between nodes
-    similarity_scores: list[tuple[int, int, float]] = [
-        (i, j, dot(n.name_embedding or [], m.name_embedding or []))
-        for i, n in enumerate(nodes)
-        for j, m in enumerate(nodes[:i])
-    ]
-
-    # We now sort by semantic similarity
-    similarity_scores.sort(key=lambda score_tuple: score_tuple[2])
-
-    # initialize our chunks based on chunk size
-    node_chunks: list[list[EntityNode]] = [[] for _ in range(ceil(len(nodes) / chunk_size))]
+    chunk_size = max(int(np.sqrt(len(nodes))), CHUNK_SIZE)
 
     # Draft the most similar nodes into the same chunk
-    while len(similarity_scores) > 0:
-        i, j, _ = similarity_scores.pop()
-        # determine if any of the nodes have already been drafted into a chunk
-        n = nodes[i]
-        m = nodes[j]
-        # make sure the shortest chunks get preference
-        node_chunks.sort(reverse=True, key=lambda chunk: len(chunk))
-
-        n_chunk = max([i if n in chunk else -1 for i, chunk in enumerate(node_chunks)])
-        m_chunk = max([i if m in chunk else -1 for i, chunk in enumerate(node_chunks)])
-
-        # both nodes already in a chunk
-        if n_chunk > -1 and m_chunk > -1:
-            continue
-
-        # n has a chunk and that chunk is not full
-        elif n_chunk > -1 and len(node_chunks[n_chunk]) < chunk_size:
-            # put m in the same chunk as n
-            node_chunks[n_chunk].append(m)
-
-        # m has a chunk and that chunk is not full
-        elif m_chunk > -1 and len(node_chunks[m_chunk]) < chunk_size:
-            # put n in the same chunk as m
-            node_chunks[m_chunk].append(n)
-
-        # neither node has a chunk or the chunk is full
-        else:
-            # add both nodes to the shortest chunk
-            node_chunks[-1].extend([n, m])
+    node_chunks = cluster_similar_nodes(nodes, chunk_size)
 
     results = await semaphore_gather(
         *[dedupe_node_list(llm_client, chunk) for chunk in node_chunks]
@@ -319,12 +459,7 @@ async def compress_nodes(
         compressed_nodes += node_chunk
         extended_map.update(uuid_map_chunk)
 
-    # Check if we have removed all duplicates
-    if len(compressed_nodes) == len(nodes):
-        compressed_uuid_map = compress_uuid_map(extended_map)
-        return compressed_nodes, compressed_uuid_map
-
-    return await compress_nodes(llm_client, compressed_nodes, extended_map)
+    return compressed_nodes, compress_uuid_map(extended_map)
 
 
 async def compress_edges(llm_client: LLMClient, edges: list[EntityEdge]) -> list[EntityEdge]:
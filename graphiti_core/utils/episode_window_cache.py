@@ -0,0 +1,187 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from neo4j import AsyncDriver
+from pydantic import BaseModel
+
+from graphiti_core.helpers import LRUCache
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    retrieve_episodes,
+    retrieve_episodes_bulk,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EPISODE_WINDOW_CACHE_SIZE = 50
+DEFAULT_EPISODE_WINDOW_CACHE_GROUPS = 1024
+
+# Upper bound used to load the most recent episodes of a group regardless of their valid_at
+MAX_REFERENCE_TIME = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def episode_sort_key(episode: EpisodicNode) -> datetime:
+    # Treat naive timestamps as UTC so that user provided and stored episodes compare
+    valid_at = episode.valid_at
+    return valid_at if valid_at.tzinfo is not None else valid_at.replace(tzinfo=timezone.utc)
+
+
+class EpisodeWindowCacheStats(BaseModel):
+    groups: int
+    episodes: int
+    hits: int
+    misses: int
+
+
+@dataclass
+class _EpisodeWindow:
+    # Most recent episodes of the group, sorted by valid_at
+    episodes: list[EpisodicNode] = field(default_factory=list)
+    # True when the window holds every episode of the group
+    complete: bool = False
+
+
+class EpisodeWindowCache:
+    """
+    In-memory cache of the most recent episodes of each group, holding the windows of at most
+    max_groups recently used groups.
+
+    A group's window is loaded from the graph the first time the group is read and is kept up to
+    date by adding every episode this process saves. Reads for a reference time are answered from
+    the window whenever it provably holds the requested episodes, otherwise they go to the graph.
+
+    The cache assumes that the episodes of a group are only written through the Graphiti instances
+    sharing it; invalidate the group after changing its episodes in any other way.
+    """
+
+    def __init__(
+        self,
+        max_episodes: int = DEFAULT_EPISODE_WINDOW_CACHE_SIZE,
+        max_groups: int = DEFAULT_EPISODE_WINDOW_CACHE_GROUPS,
+    ):
+        self.max_episodes = max_episodes
+        self.max_groups = max_groups
+        self.hits = 0
+        self.misses = 0
+        self._windows = LRUCache(max_size=max_groups)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def __contains__(self, group_id: str) -> bool:
+        return self._windows.get(group_id) is not None
+
+    def get(
+        self, group_id: str, reference_time: datetime, last_n: int
+    ) -> list[EpisodicNode] | None:
+        """
+        Return the last_n episodes of the group with valid_at <= reference_time, in chronological
+        order, or None if the cached window cannot answer the query.
+        """
+        window: _EpisodeWindow | None = self._windows.get(group_id)
+        if window is None:
+            self.misses += 1
+            return None
+
+        if reference_time.tzinfo is None:
+            reference_time = reference_time.replace(tzinfo=timezone.utc)
+
+        episodes = [
+            episode for episode in window.episodes if episode_sort_key(episode) <= reference_time
+        ]
+        if len(episodes) < last_n and not window.complete:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return episodes[-last_n:] if last_n > 0 else []
+
+    def set_window(self, group_id: str, episodes: list[EpisodicNode], complete: bool):
+        window = _EpisodeWindow(episodes=sorted(episodes, key=episode_sort_key), complete=complete)
+        self._trim(window)
+        self._windows.set(group_id, window)
+
+    def add_episodes(self, episodes: list[EpisodicNode]):
+        """Add saved episodes to the windows of their groups. Groups that are not cached are skipped."""
+        for episode in episodes:
+            window: _EpisodeWindow | None = self._windows.get(episode.group_id)
+            if window is None:
+                continue
+
+            window.episodes = [e for e in window.episodes if e.uuid != episode.uuid]
+            # Older episodes than the window holds would leave a gap unless the window is complete
+            if (
+                not window.complete
+                and window.episodes
+                and episode_sort_key(episode) < episode_sort_key(window.episodes[0])
+            ):
+                continue
+
+            insort(window.episodes, episode.model_copy(), key=episode_sort_key)
+            self._trim(window)
+
+    def invalidate(self, group_id: str | None = None):
+        """Drop the window of a group, or of every group if no group_id is given."""
+        if group_id is None:
+            self._windows.clear()
+        else:
+            self._windows.delete(group_id)
+
+    async def load(self, driver: AsyncDriver, group_ids: list[str]):
+        """Load the windows of the groups that are not cached yet."""
+        missing_group_ids = [
+            group_id for group_id in dict.fromkeys(group_ids) if group_id not in self
+        ]
+        if len(missing_group_ids) == 0:
+            return
+
+        episodes_lists = await retrieve_episodes_bulk(
+            driver,
+            [(group_id, MAX_REFERENCE_TIME) for group_id in missing_group_ids],
+            last_n=self.max_episodes,
+        )
+        for group_id, episodes in zip(missing_group_ids, episodes_lists):
+            self.set_window(group_id, episodes, complete=len(episodes) < self.max_episodes)
+
+    async def retrieve_episodes(
+        self, driver: AsyncDriver, reference_time: datetime, last_n: int, group_id: str
+    ) -> list[EpisodicNode]:
+        """Retrieve the last n episodes of a group, reading the graph only on a cache miss."""
+        await self.load(driver, [group_id])
+        episodes = self.get(group_id, reference_time, last_n)
+        if episodes is not None:
+            return episodes
+
+        logger.debug(f'Episode window of group {group_id} cannot answer query, reading the graph')
+        return await retrieve_episodes(driver, reference_time, last_n, [group_id])
+
+    def stats(self) -> EpisodeWindowCacheStats:
+        return EpisodeWindowCacheStats(
+            groups=len(self._windows),
+            episodes=sum(len(window.episodes) for window in self._windows.values()),
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def _trim(self, window: _EpisodeWindow):
+        if len(window.episodes) > self.max_episodes:
+            window.episodes = window.episodes[-self.max_episodes :]
+            window.complete = False
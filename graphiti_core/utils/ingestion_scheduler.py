@@ -0,0 +1,180 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from pydantic import BaseModel
+
+from graphiti_core.helpers import SEMAPHORE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+class GroupIngestionStats(BaseModel):
+    group_id: str
+    queue_depth: int
+    lag_seconds: float
+    processed: int
+    failed: int
+
+
+class IngestionSchedulerStats(BaseModel):
+    queue_depth: int
+    running: int
+    active_groups: int
+    groups: list[GroupIngestionStats]
+
+
+@dataclass
+class _IngestionJob:
+    job: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=monotonic)
+
+
+@dataclass
+class _GroupQueue:
+    jobs: deque[_IngestionJob] = field(default_factory=deque)
+    task: asyncio.Task | None = None
+    processed: int = 0
+    failed: int = 0
+
+
+class IngestionScheduler:
+    """
+    Runs ingestion jobs (e.g. add_episode calls) for many groups at once.
+
+    Jobs submitted for the same group_id run strictly one at a time in submission order, as
+    add_episode requires. Different groups run concurrently, with at most max_concurrency jobs
+    running across all groups. Each group with pending work has one worker task, which exits
+    once its queue is drained, so idle groups cost nothing.
+    """
+
+    def __init__(self, max_concurrency: int = SEMAPHORE_LIMIT):
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._groups: dict[str, _GroupQueue] = {}
+        self._running = 0
+
+    def submit(self, group_id: str, job: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """
+        Queue job to run after every job previously submitted for group_id.
+
+        Returns a future with the result of the job. Failures are logged and set on the
+        future, and never stop the group's queue.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # failures are logged by the worker, so don't warn if the caller never awaits the future
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        group = self._groups.setdefault(group_id, _GroupQueue())
+        group.jobs.append(_IngestionJob(job, future))
+        if group.task is None or group.task.done():
+            group.task = asyncio.create_task(self._process_group(group_id, group))
+
+        return future
+
+    async def _process_group(self, group_id: str, group: _GroupQueue):
+        while group.jobs:
+            # the job stays at the head of the queue while running so that lag includes it
+            ingestion_job = group.jobs[0]
+            try:
+                async with self._semaphore:
+                    self._running += 1
+                    try:
+                        result = await ingestion_job.job()
+                    finally:
+                        self._running -= 1
+                group.processed += 1
+                if not ingestion_job.future.done():
+                    ingestion_job.future.set_result(result)
+            except asyncio.CancelledError:
+                ingestion_job.future.cancel()
+                raise
+            except Exception as e:
+                group.failed += 1
+                logger.error(f'Ingestion job for group {group_id} failed: {e}')
+                if not ingestion_job.future.done():
+                    ingestion_job.future.set_exception(e)
+            finally:
+                group.jobs.popleft()
+
+        if self._groups.get(group_id) is group:
+            del self._groups[group_id]
+
+    async def join(self):
+        """Wait until every submitted job has finished."""
+        while self._groups:
+            await asyncio.gather(
+                *[group.task for group in list(self._groups.values()) if group.task is not None],
+                return_exceptions=True,
+            )
+
+    async def stop(self):
+        """Cancel running jobs and drop every pending job."""
+        groups = list(self._groups.values())
+        self._groups.clear()
+        for group in groups:
+            if group.task is not None:
+                group.task.cancel()
+        await asyncio.gather(
+            *[group.task for group in groups if group.task is not None], return_exceptions=True
+        )
+        for group in groups:
+            for ingestion_job in group.jobs:
+                ingestion_job.future.cancel()
+            group.jobs.clear()
+
+    def queue_depth(self, group_id: str | None = None) -> int:
+        """Number of jobs that have not finished, for one group or across all groups."""
+        if group_id is not None:
+            group = self._groups.get(group_id)
+            return len(group.jobs) if group is not None else 0
+
+        return sum(len(group.jobs) for group in self._groups.values())
+
+    def group_lag(self, group_id: str) -> float:
+        """Seconds since the oldest unfinished job of the group was submitted."""
+        group = self._groups.get(group_id)
+        if group is None or not group.jobs:
+            return 0.0
+
+        return monotonic() - group.jobs[0].enqueued_at
+
+    def stats(self) -> IngestionSchedulerStats:
+        groups = [
+            GroupIngestionStats(
+                group_id=group_id,
+                queue_depth=len(group.jobs),
+                lag_seconds=self.group_lag(group_id),
+                processed=group.processed,
+                failed=group.failed,
+            )
+            for group_id, group in self._groups.items()
+        ]
+
+        return IngestionSchedulerStats(
+            queue_depth=self.queue_depth(),
+            running=self._running,
+            active_groups=len(groups),
+            groups=groups,
+        )
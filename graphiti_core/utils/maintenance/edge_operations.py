@@ -18,22 +18,46 @@ import logging
 from datetime import datetime
 from time import time
 
+from pydantic import BaseModel, Field
+
 from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.llm_client.utils import chunk_by_token_budget
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, UniqueFacts
+from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, EdgeDuplicates, UniqueFacts
 from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.temporal_operations import (
+    build_candidate_context,
+    candidate_token_counts,
     extract_edge_dates,
+    extract_edge_dates_batch,
     get_edge_contradictions,
+    get_edge_contradictions_batch,
 )
 
 logger = logging.getLogger(__name__)
 
 
+class EdgeResolutionPolicy(BaseModel):
+    """
+    Controls how extracted edges are resolved against the graph.
+
+    In batch mode duplicates, dates and contradictions of all facts of an episode are resolved
+    with one call per prompt, split into several calls when a prompt would exceed max_prompt_tokens.
+    """
+
+    batch: bool = Field(
+        default=False,
+        description='resolve all facts of an episode together instead of three calls per fact',
+    )
+    max_prompt_tokens: int = Field(
+        default=12000, description='estimated token budget of a single batched prompt'
+    )
+
+
 def build_episodic_edges(
     entity_nodes: list[EntityNode],
     episode: EpisodicNode,
@@ -199,7 +223,19 @@ async def resolve_extracted_edges(
     existing_edges_lists: list[list[EntityEdge]],
     current_episode: EpisodicNode,
     previous_episodes: list[EpisodicNode],
+    policy: EdgeResolutionPolicy | None = None,
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    if policy is not None and policy.batch:
+        return await resolve_extracted_edges_batch(
+            llm_client,
+            extracted_edges,
+            related_edges_lists,
+            existing_edges_lists,
+            current_episode,
+            previous_episodes,
+            policy.max_prompt_tokens,
+        )
+
     # resolve edges with related edges in the graph, extract temporal information, and find invalidation candidates
     results: list[tuple[EntityEdge, list[EntityEdge]]] = list(
         await semaphore_gather(
@@ -231,6 +267,45 @@ async def resolve_extracted_edges(
     return resolved_edges, invalidated_edges
 
 
+async def resolve_extracted_edges_batch(
+    llm_client: LLMClient,
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+    current_episode: EpisodicNode,
+    previous_episodes: list[EpisodicNode],
+    max_prompt_tokens: int,
+) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    start = time()
+
+    resolved_edges_list, edge_dates, invalidation_candidates_lists = await semaphore_gather(
+        dedupe_extracted_edges_batch(
+            llm_client, extracted_edges, related_edges_lists, max_prompt_tokens
+        ),
+        extract_edge_dates_batch(
+            llm_client, extracted_edges, current_episode, previous_episodes, max_prompt_tokens
+        ),
+        get_edge_contradictions_batch(
+            llm_client, extracted_edges, existing_edges_lists, max_prompt_tokens
+        ),
+    )
+
+    resolved_edges: list[EntityEdge] = []
+    invalidated_edges: list[EntityEdge] = []
+    for resolved_edge, (valid_at, invalid_at), invalidation_candidates in zip(
+        resolved_edges_list, edge_dates, invalidation_candidates_lists
+    ):
+        resolved_edges.append(resolved_edge)
+        invalidated_edges.extend(
+            resolve_edge_dates(resolved_edge, valid_at, invalid_at, invalidation_candidates)
+        )
+
+    end = time()
+    logger.debug(f'Resolved {len(extracted_edges)} edges in batch, in {(end - start) * 1000} ms')
+
+    return resolved_edges, invalidated_edges
+
+
 def resolve_edge_contradictions(
     resolved_edge: EntityEdge, invalidation_candidates: list[EntityEdge]
 ) -> list[EntityEdge]:
@@ -275,6 +350,20 @@ async def resolve_extracted_edge(
         get_edge_contradictions(llm_client, extracted_edge, existing_edges),
     )
 
+    invalidated_edges = resolve_edge_dates(
+        resolved_edge, valid_at, invalid_at, invalidation_candidates
+    )
+
+    return resolved_edge, invalidated_edges
+
+
+def resolve_edge_dates(
+    resolved_edge: EntityEdge,
+    valid_at: datetime | None,
+    invalid_at: datetime | None,
+    invalidation_candidates: list[EntityEdge],
+) -> list[EntityEdge]:
+    # Apply the extracted dates, expire the resolved edge if needed and return the edges it invalidates
     now = utc_now()
 
     resolved_edge.valid_at = valid_at if valid_at else resolved_edge.valid_at
@@ -300,9 +389,7 @@ async def resolve_extracted_edge(
                 break
 
     # Determine which contradictory edges need to be expired
-    invalidated_edges = resolve_edge_contradictions(resolved_edge, invalidation_candidates)
-
-    return resolved_edge, invalidated_edges
+    return resolve_edge_contradictions(resolved_edge, invalidation_candidates)
 
 
 async def dedupe_extracted_edge(
@@ -348,6 +435,68 @@ async def dedupe_extracted_edge(
     return edge
 
 
+async def dedupe_extracted_edges_batch(
+    llm_client: LLMClient,
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    max_prompt_tokens: int,
+) -> list[EntityEdge]:
+    start = time()
+
+    resolved_edges = list(extracted_edges)
+    # Edges without related edges cannot be duplicates, so they are never sent to the LLM
+    candidate_ids = [i for i, related_edges in enumerate(related_edges_lists) if related_edges]
+    if not candidate_ids:
+        return resolved_edges
+
+    chunks = chunk_by_token_budget(
+        candidate_token_counts(
+            [extracted_edges[i] for i in candidate_ids],
+            [related_edges_lists[i] for i in candidate_ids],
+        ),
+        max_prompt_tokens,
+    )
+
+    async def dedupe_chunk(chunk: list[int]):
+        ids = [candidate_ids[i] for i in chunk]
+        related_context, candidate_idxs, candidate_maps = build_candidate_context(
+            [related_edges_lists[i] for i in ids]
+        )
+        context = {
+            'related_edges': related_context,
+            'extracted_edges': [
+                {
+                    'id': i,
+                    'name': extracted_edges[i].name,
+                    'fact': extracted_edges[i].fact,
+                    'candidate_idxs': idxs,
+                }
+                for i, idxs in zip(ids, candidate_idxs)
+            ],
+        }
+        llm_response = await llm_client.generate_response(
+            prompt_library.dedupe_edges.edges(context), response_model=EdgeDuplicates
+        )
+
+        candidate_map_by_id = dict(zip(ids, candidate_maps))
+        for duplicate in llm_response.get('duplicate_facts', []):
+            candidate_map = candidate_map_by_id.get(duplicate.get('id'))
+            if candidate_map is None:
+                continue
+            duplicate_edge = candidate_map.get(duplicate.get('duplicate_idx', -1))
+            if duplicate_edge is not None:
+                resolved_edges[duplicate['id']] = duplicate_edge
+
+    await semaphore_gather(*[dedupe_chunk(chunk) for chunk in chunks])
+
+    end = time()
+    logger.debug(
+        f'Deduped {len(candidate_ids)} edges in {len(chunks)} calls, in {(end - start) * 1000} ms'
+    )
+
+    return resolved_edges
+
+
 async def dedupe_edge_list(
     llm_client: LLMClient,
     edges: list[EntityEdge],
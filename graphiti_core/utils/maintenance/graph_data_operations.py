@@ -20,6 +20,7 @@ from datetime import datetime, timezone
 from neo4j import AsyncDriver
 from typing_extensions import LiteralString
 
+from graphiti_core.embedder.client import EMBEDDING_DIM
 from graphiti_core.helpers import DEFAULT_DATABASE, semaphore_gather
 from graphiti_core.nodes import EpisodeType, EpisodicNode
 
@@ -28,7 +29,9 @@ EPISODE_WINDOW_LEN = 3
 logger = logging.getLogger(__name__)
 
 
-async def build_indices_and_constraints(driver: AsyncDriver, delete_existing: bool = False):
+async def build_indices_and_constraints(
+    driver: AsyncDriver, delete_existing: bool = False, embedding_dim: int = EMBEDDING_DIM
+):
     if delete_existing:
         records, _, _ = await driver.execute_query(
             """
@@ -63,6 +66,8 @@ async def build_indices_and_constraints(driver: AsyncDriver, delete_existing: bo
         'CREATE INDEX created_at_entity_index IF NOT EXISTS FOR (n:Entity) ON (n.created_at)',
         'CREATE INDEX created_at_episodic_index IF NOT EXISTS FOR (n:Episodic) ON (n.created_at)',
         'CREATE INDEX valid_at_episodic_index IF NOT EXISTS FOR (n:Episodic) ON (n.valid_at)',
+        'CREATE INDEX episode_group_valid_at IF NOT EXISTS FOR (n:Episodic) ON (n.group_id, n.valid_at)',
+        'CREATE INDEX episode_content_hash IF NOT EXISTS FOR (n:Episodic) ON (n.content_hash)',
         'CREATE INDEX name_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.name)',
         'CREATE INDEX created_at_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.created_at)',
         'CREATE INDEX expired_at_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.expired_at)',
@@ -79,7 +84,22 @@ async def build_indices_and_constraints(driver: AsyncDriver, delete_existing: bo
         FOR ()-[e:RELATES_TO]-() ON EACH [e.name, e.fact, e.group_id]""",
     ]
 
-    index_queries: list[LiteralString] = range_indices + fulltext_indices
+    # Vector index dimensions must match the embedder output, so the options map is built here
+    vector_index_options = (
+        'OPTIONS {indexConfig: {`vector.dimensions`: '
+        + str(int(embedding_dim))
+        + ", `vector.similarity_function`: 'cosine'}}"
+    )
+    vector_indices: list[LiteralString] = [
+        'CREATE VECTOR INDEX fact_embedding IF NOT EXISTS '  # type: ignore
+        'FOR ()-[e:RELATES_TO]-() ON (e.fact_embedding) ' + vector_index_options,
+        'CREATE VECTOR INDEX entity_name_embedding IF NOT EXISTS '  # type: ignore
+        'FOR (n:Entity) ON (n.name_embedding) ' + vector_index_options,
+        'CREATE VECTOR INDEX community_name_embedding IF NOT EXISTS '  # type: ignore
+        'FOR (n:Community) ON (n.name_embedding) ' + vector_index_options,
+    ]
+
+    index_queries: list[LiteralString] = range_indices + fulltext_indices + vector_indices
 
     await semaphore_gather(
         *[
@@ -121,10 +141,16 @@ async def retrieve_episodes(
     Returns:
         list[EpisodicNode]: A list of EpisodicNode objects representing the retrieved episodes.
     """
-    result = await driver.execute_query(
+    # Separate queries keep the group filter sargable, so the (group_id, valid_at) index serves
+    # both the filter and the ordering and only last_n rows are read
+    group_filter: LiteralString = 'AND e.group_id IN $group_ids' if group_ids is not None else ''
+    query: LiteralString = (
         """
-        MATCH (e:Episodic) WHERE e.valid_at <= $reference_time 
-        AND ($group_ids IS NULL) OR e.group_id in $group_ids
+        MATCH (e:Episodic)
+        WHERE e.valid_at <= $reference_time
+        """
+        + group_filter
+        + """
         RETURN e.content AS content,
             e.created_at AS created_at,
             e.valid_at AS valid_at,
@@ -133,27 +159,108 @@ async def retrieve_episodes(
             e.name AS name,
             e.source_description AS source_description,
             e.source AS source
-        ORDER BY e.created_at DESC
+        ORDER BY e.valid_at DESC, e.created_at DESC
         LIMIT $num_episodes
-        """,
+        """
+    )
+    records, _, _ = await driver.execute_query(
+        query,
         reference_time=reference_time,
         num_episodes=last_n,
         group_ids=group_ids,
-        _database=DEFAULT_DATABASE,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
     )
-    episodes = [
-        EpisodicNode(
-            content=record['content'],
-            created_at=datetime.fromtimestamp(
-                record['created_at'].to_native().timestamp(), timezone.utc
-            ),
-            valid_at=(record['valid_at'].to_native()),
-            uuid=record['uuid'],
-            group_id=record['group_id'],
-            source=EpisodeType.from_str(record['source']),
-            name=record['name'],
-            source_description=record['source_description'],
-        )
-        for record in result.records
-    ]
+    episodes = [get_episodic_node_from_window_record(record) for record in records]
     return list(reversed(episodes))  # Return in chronological order
+
+
+async def retrieve_episodes_bulk(
+    driver: AsyncDriver,
+    windows: list[tuple[str, datetime]],
+    last_n: int = EPISODE_WINDOW_LEN,
+    exclude_uuids: list[str | None] | None = None,
+) -> list[list[EpisodicNode]]:
+    """
+    Retrieve the last n episodes for many (group_id, reference_time) windows in a single query.
+
+    Args:
+        driver (AsyncDriver): The Neo4j driver instance.
+        windows (list[tuple[str, datetime]]): The group id and reference time of each window.
+        last_n (int, optional): The number of most recent episodes to retrieve for each window.
+        exclude_uuids (list[str | None], optional): An episode uuid to leave out of each window,
+                                                    typically the episode the window is built for.
+
+    Returns:
+        list[list[EpisodicNode]]: The episodes of each window in chronological order, in the order
+                                  of the windows.
+    """
+    if len(windows) == 0:
+        return []
+
+    if exclude_uuids is None:
+        exclude_uuids = [None] * len(windows)
+
+    queries = [
+        {
+            'index': i,
+            'group_id': group_id,
+            'reference_time': reference_time,
+            'exclude_uuid': exclude_uuid,
+        }
+        for i, ((group_id, reference_time), exclude_uuid) in enumerate(zip(windows, exclude_uuids))
+    ]
+
+    records, _, _ = await driver.execute_query(
+        """
+        UNWIND $queries AS query
+        CALL {
+            WITH query
+            MATCH (e:Episodic)
+            WHERE e.group_id = query.group_id
+                AND e.valid_at <= query.reference_time
+                AND (query.exclude_uuid IS NULL OR e.uuid <> query.exclude_uuid)
+            RETURN e
+            ORDER BY e.valid_at DESC, e.created_at DESC
+            LIMIT $num_episodes
+        }
+        RETURN query.index AS index,
+            e.content AS content,
+            e.created_at AS created_at,
+            e.valid_at AS valid_at,
+            e.uuid AS uuid,
+            e.group_id AS group_id,
+            e.name AS name,
+            e.source_description AS source_description,
+            e.source AS source
+        """,
+        queries=queries,
+        num_episodes=last_n,
+        database_=DEFAULT_DATABASE,
+        routing_='r',
+    )
+
+    episodes_lists: list[list[EpisodicNode]] = [[] for _ in windows]
+    for record in records:
+        episodes_lists[record['index']].append(get_episodic_node_from_window_record(record))
+
+    # Return each window in chronological order
+    return [
+        sorted(episodes, key=lambda episode: (episode.valid_at, episode.created_at))
+        for episodes in episodes_lists
+    ]
+
+
+def get_episodic_node_from_window_record(record) -> EpisodicNode:
+    return EpisodicNode(
+        content=record['content'],
+        created_at=datetime.fromtimestamp(
+            record['created_at'].to_native().timestamp(), timezone.utc
+        ),
+        valid_at=(record['valid_at'].to_native()),
+        uuid=record['uuid'],
+        group_id=record['group_id'],
+        source=EpisodeType.from_str(record['source']),
+        name=record['name'],
+        source_description=record['source_description'],
+    )
@@ -17,26 +17,136 @@ limitations under the License.
 import logging
 from contextlib import suppress
 from time import time
+from typing import Any
 
+import numpy as np
 import pydantic
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_nodes import NodeDuplicate
+from graphiti_core.prompts.dedupe_nodes import NodeDuplicate, NodeResolutions
 from graphiti_core.prompts.extract_nodes import (
     EntityClassification,
     ExtractedNodes,
     MissedEntities,
 )
-from graphiti_core.prompts.summarize_nodes import Summary
+from graphiti_core.prompts.summarize_nodes import EntitySummary, Summary
 from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
 
+class NodeResolutionPolicy(BaseModel):
+    """
+    Rules for resolving extracted nodes against their candidates without the dedupe prompt.
+
+    Similarities are cosine similarities between name embeddings. A threshold set to None
+    disables the corresponding rule. Summaries and attributes are still generated by the LLM.
+    """
+
+    match_normalized_names: bool = Field(
+        default=True,
+        description='resolve to a candidate whose name matches ignoring case and spacing',
+    )
+    high_similarity_threshold: float | None = Field(
+        default=0.98, description='resolve to the top candidate at or above this similarity'
+    )
+    distinct_similarity_floor: float | None = Field(
+        default=0.3,
+        description='treat the node as new when every candidate is below this similarity',
+    )
+    batch: bool = Field(
+        default=False,
+        description='resolve all nodes of an episode with one dedupe call and one summary call per entity type',
+    )
+    batch_size: int = Field(
+        default=50, description='maximum number of nodes sent in a single batched dedupe call'
+    )
+
+
+class NodeResolutionStats(BaseModel):
+    """Number of node resolution decisions taken by each path."""
+
+    no_candidates: int = 0
+    name_match: int = 0
+    high_similarity: int = 0
+    distinct: int = 0
+    llm: int = 0
+
+
+def normalize_node_name(name: str) -> str:
+    # Punctuation is kept, it tells apart names such as C, C# and C++
+    return ' '.join(name.casefold().split())
+
+
+def resolve_node_without_llm(
+    extracted_node: EntityNode,
+    existing_nodes: list[EntityNode],
+    policy: NodeResolutionPolicy,
+    stats: NodeResolutionStats | None = None,
+) -> tuple[bool, EntityNode | None]:
+    """
+    Apply the resolution policy to the candidates of an extracted node.
+
+    Returns whether a decision was made, and the existing node it duplicates (None if new).
+    """
+    if stats is None:
+        stats = NodeResolutionStats()
+
+    if len(existing_nodes) == 0:
+        stats.no_candidates += 1
+        return True, None
+
+    similarities: list[float | None] = [None] * len(existing_nodes)
+    if extracted_node.name_embedding is not None:
+        query = np.array(extracted_node.name_embedding)
+        query_norm = np.linalg.norm(query)
+        for i, node in enumerate(existing_nodes):
+            if node.name_embedding is None or query_norm == 0:
+                continue
+            candidate = np.array(node.name_embedding)
+            candidate_norm = np.linalg.norm(candidate)
+            if candidate_norm == 0:
+                continue
+            similarities[i] = float(np.dot(query, candidate) / (query_norm * candidate_norm))
+
+    def similarity_rank(i: int) -> float:
+        similarity = similarities[i]
+        return similarity if similarity is not None else -1.0
+
+    ranked_indices = sorted(range(len(existing_nodes)), key=similarity_rank, reverse=True)
+
+    if policy.match_normalized_names:
+        name = normalize_node_name(extracted_node.name)
+        for i in ranked_indices:
+            if name != '' and normalize_node_name(existing_nodes[i].name) == name:
+                stats.name_match += 1
+                return True, existing_nodes[i]
+
+    top_similarity = similarities[ranked_indices[0]]
+    if (
+        policy.high_similarity_threshold is not None
+        and top_similarity is not None
+        and top_similarity >= policy.high_similarity_threshold
+    ):
+        stats.high_similarity += 1
+        return True, existing_nodes[ranked_indices[0]]
+
+    # every candidate must have a known similarity for the node to be obviously distinct
+    if policy.distinct_similarity_floor is not None and all(
+        similarity is not None and similarity < policy.distinct_similarity_floor
+        for similarity in similarities
+    ):
+        stats.distinct += 1
+        return True, None
+
+    stats.llm += 1
+    return False, None
+
+
 async def extract_message_nodes(
     llm_client: LLMClient,
     episode: EpisodicNode,
@@ -269,7 +379,21 @@ async def resolve_extracted_nodes(
     episode: EpisodicNode | None = None,
     previous_episodes: list[EpisodicNode] | None = None,
     entity_types: dict[str, BaseModel] | None = None,
+    policy: NodeResolutionPolicy | None = None,
+    stats: NodeResolutionStats | None = None,
 ) -> tuple[list[EntityNode], dict[str, str]]:
+    if policy is not None and policy.batch:
+        return await resolve_extracted_nodes_batch(
+            llm_client,
+            extracted_nodes,
+            existing_nodes_lists,
+            episode,
+            previous_episodes,
+            entity_types,
+            policy,
+            stats,
+        )
+
     uuid_map: dict[str, str] = {}
     resolved_nodes: list[EntityNode] = []
     results: list[tuple[EntityNode, dict[str, str]]] = list(
@@ -282,6 +406,8 @@ async def resolve_extracted_nodes(
                     episode,
                     previous_episodes,
                     entity_types,
+                    policy,
+                    stats,
                 )
                 for extracted_node, existing_nodes in zip(extracted_nodes, existing_nodes_lists)
             ]
@@ -295,6 +421,267 @@ async def resolve_extracted_nodes(
     return resolved_nodes, uuid_map
 
 
+def get_entity_type_classes(
+    node: EntityNode, entity_types: dict[str, BaseModel] | None
+) -> tuple[BaseModel, ...]:
+    if entity_types is None:
+        return tuple()
+
+    return tuple(
+        entity_types[label] for label in node.labels if entity_types.get(label) is not None
+    )
+
+
+def parse_node_attributes(node_attributes_response: dict[str, Any]) -> dict[str, Any]:
+    node_attributes = {
+        key: value if (value != 'None' or key == 'summary') else None
+        for key, value in node_attributes_response.items()
+    }
+
+    with suppress(KeyError):
+        del node_attributes['summary']
+
+    return node_attributes
+
+
+async def dedupe_extracted_nodes_batch(
+    llm_client: LLMClient,
+    extracted_nodes: list[EntityNode],
+    existing_nodes: list[EntityNode],
+    episode: EpisodicNode | None = None,
+    previous_episodes: list[EpisodicNode] | None = None,
+) -> list[tuple[EntityNode | None, str]]:
+    """
+    Resolve extracted nodes against the union of their candidates with a single LLM call.
+
+    Returns, for each extracted node, the existing node it duplicates (or None) and its name.
+    """
+    if len(existing_nodes) == 0:
+        return [(None, node.name) for node in extracted_nodes]
+
+    context = {
+        'extracted_nodes': [
+            {'id': i, 'name': node.name, 'entity_types': node.labels}
+            for i, node in enumerate(extracted_nodes)
+        ],
+        'existing_nodes': [
+            {'idx': i, 'name': node.name, 'entity_types': node.labels, **node.attributes}
+            for i, node in enumerate(existing_nodes)
+        ],
+        'episode_content': episode.content if episode is not None else '',
+        'previous_episodes': [ep.content for ep in previous_episodes]
+        if previous_episodes is not None
+        else [],
+    }
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.dedupe_nodes.nodes(context), response_model=NodeResolutions
+    )
+
+    resolutions: list[tuple[EntityNode | None, str]] = [
+        (None, node.name) for node in extracted_nodes
+    ]
+    for resolution in llm_response.get('entity_resolutions', []):
+        node_id: int = resolution.get('id', -1)
+        duplicate_idx: int = resolution.get('duplicate_idx', -1)
+        if not 0 <= node_id < len(extracted_nodes):
+            logger.warning(f'Invalid entity id in node resolution: {node_id}')
+            continue
+        if 0 <= duplicate_idx < len(existing_nodes):
+            resolutions[node_id] = (
+                existing_nodes[duplicate_idx],
+                resolution.get('name') or existing_nodes[duplicate_idx].name,
+            )
+
+    return resolutions
+
+
+async def summarize_nodes_batch(
+    llm_client: LLMClient,
+    nodes: list[EntityNode],
+    node_contexts: list[str],
+    episode: EpisodicNode | None = None,
+    previous_episodes: list[EpisodicNode] | None = None,
+    entity_types: dict[str, BaseModel] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Generate summaries and attributes for all nodes, with one LLM call per set of entity types.
+
+    node_contexts holds what is already known about each node (e.g. the summary of the existing
+    node it duplicates), which the new summary is combined with.
+    """
+    nodes_by_types: dict[tuple[str, ...], list[int]] = {}
+    for i, node in enumerate(nodes):
+        type_names = tuple(
+            label for label in node.labels if entity_types is not None and label in entity_types
+        )
+        nodes_by_types.setdefault(type_names, []).append(i)
+
+    async def summarize_group(indices: list[int]) -> list[tuple[int, dict[str, Any]]]:
+        entity_type_classes = get_entity_type_classes(nodes[indices[0]], entity_types)
+        entity_attributes_model = pydantic.create_model(  # type: ignore
+            'EntityAttributes',
+            __base__=entity_type_classes + (EntitySummary,),  # type: ignore
+        )
+        entity_summaries_model = pydantic.create_model(
+            'EntitySummaries',
+            summaries=(list[entity_attributes_model], ...),  # type: ignore
+        )
+
+        context = {
+            'nodes': [
+                {'id': i, 'name': nodes[i].name, 'entity_context': node_contexts[i]}
+                for i in indices
+            ],
+            'attributes': [
+                field_name
+                for entity_type in entity_type_classes
+                for field_name in entity_type.model_fields
+            ],
+            'episode_content': episode.content if episode is not None else '',
+            'previous_episodes': [ep.content for ep in previous_episodes]
+            if previous_episodes is not None
+            else [],
+        }
+
+        llm_response = await llm_client.generate_response(
+            prompt_library.summarize_nodes.summarize_context_batch(context),
+            response_model=entity_summaries_model,
+        )
+
+        return [
+            (summary['id'], summary)
+            for summary in llm_response.get('summaries', [])
+            if summary.get('id') in indices
+        ]
+
+    results = await semaphore_gather(
+        *[summarize_group(indices) for indices in nodes_by_types.values()]
+    )
+
+    node_attributes_responses: list[dict[str, Any]] = [{} for _ in nodes]
+    for result in results:
+        for i, node_attributes_response in result:
+            node_attributes_responses[i] = {
+                key: value for key, value in node_attributes_response.items() if key != 'id'
+            }
+
+    return node_attributes_responses
+
+
+async def resolve_extracted_nodes_batch(
+    llm_client: LLMClient,
+    extracted_nodes: list[EntityNode],
+    existing_nodes_lists: list[list[EntityNode]],
+    episode: EpisodicNode | None = None,
+    previous_episodes: list[EpisodicNode] | None = None,
+    entity_types: dict[str, BaseModel] | None = None,
+    policy: NodeResolutionPolicy | None = None,
+    stats: NodeResolutionStats | None = None,
+) -> tuple[list[EntityNode], dict[str, str]]:
+    """
+    Batched equivalent of resolve_extracted_nodes.
+
+    Nodes not settled by the resolution policy are deduplicated together against the union of
+    their candidates, then summaries and attributes for every node are generated in one call per
+    entity type. Summaries of duplicates are built from the existing summary, so no separate
+    summarize_pair call is needed.
+    """
+    start = time()
+    if policy is None:
+        policy = NodeResolutionPolicy(batch=True)
+
+    resolutions: list[tuple[EntityNode | None, str]] = [
+        (None, node.name) for node in extracted_nodes
+    ]
+    unresolved_indices: list[int] = []
+    for i, (extracted_node, existing_nodes) in enumerate(
+        zip(extracted_nodes, existing_nodes_lists, strict=True)
+    ):
+        resolved, duplicate_node = resolve_node_without_llm(
+            extracted_node, existing_nodes, policy, stats
+        )
+        if not resolved:
+            unresolved_indices.append(i)
+        elif duplicate_node is not None:
+            resolutions[i] = (duplicate_node, duplicate_node.name)
+
+    index_chunks = [
+        unresolved_indices[i : i + policy.batch_size]
+        for i in range(0, len(unresolved_indices), policy.batch_size)
+    ]
+
+    def candidates(indices: list[int]) -> list[EntityNode]:
+        candidate_map: dict[str, EntityNode] = {}
+        for i in indices:
+            for node in existing_nodes_lists[i]:
+                candidate_map.setdefault(node.uuid, node)
+        return list(candidate_map.values())
+
+    chunk_resolutions = await semaphore_gather(
+        *[
+            dedupe_extracted_nodes_batch(
+                llm_client,
+                [extracted_nodes[i] for i in indices],
+                candidates(indices),
+                episode,
+                previous_episodes,
+            )
+            for indices in index_chunks
+        ]
+    )
+    for indices, chunk_resolution in zip(index_chunks, chunk_resolutions, strict=True):
+        for i, resolution in zip(indices, chunk_resolution, strict=True):
+            resolutions[i] = resolution
+
+    node_attributes_responses = await summarize_nodes_batch(
+        llm_client,
+        extracted_nodes,
+        [
+            duplicate_node.summary if duplicate_node is not None else extracted_node.summary
+            for extracted_node, (duplicate_node, _) in zip(
+                extracted_nodes, resolutions, strict=True
+            )
+        ],
+        episode,
+        previous_episodes,
+        entity_types,
+    )
+
+    resolved_nodes: list[EntityNode] = []
+    uuid_map: dict[str, str] = {}
+    for extracted_node, (duplicate_node, name), node_attributes_response in zip(
+        extracted_nodes, resolutions, node_attributes_responses, strict=True
+    ):
+        summary: str | None = node_attributes_response.get('summary')
+        extracted_node.summary = summary or extracted_node.summary
+        extracted_node.attributes.update(parse_node_attributes(node_attributes_response))
+
+        if duplicate_node is None:
+            resolved_nodes.append(extracted_node)
+            continue
+
+        node = duplicate_node
+        node.name = name
+        node.summary = summary or duplicate_node.summary
+
+        new_attributes = extracted_node.attributes
+        for attribute_name, attribute_value in duplicate_node.attributes.items():
+            if new_attributes.get(attribute_name) is None:
+                new_attributes[attribute_name] = attribute_value
+        node.attributes = new_attributes
+
+        uuid_map[extracted_node.uuid] = duplicate_node.uuid
+        resolved_nodes.append(node)
+
+    end = time()
+    logger.debug(
+        f'Resolved {len(extracted_nodes)} nodes in batch: {uuid_map} in {(end - start) * 1000} ms'
+    )
+
+    return resolved_nodes, uuid_map
+
+
 async def resolve_extracted_node(
     llm_client: LLMClient,
     extracted_node: EntityNode,
@@ -302,6 +689,8 @@ async def resolve_extracted_node(
     episode: EpisodicNode | None = None,
     previous_episodes: list[EpisodicNode] | None = None,
     entity_types: dict[str, BaseModel] | None = None,
+    policy: NodeResolutionPolicy | None = None,
+    stats: NodeResolutionStats | None = None,
 ) -> tuple[EntityNode, dict[str, str]]:
     start = time()
 
@@ -336,14 +725,7 @@ async def resolve_extracted_node(
         'attributes': [],
     }
 
-    entity_type_classes: tuple[BaseModel, ...] = tuple()
-    if entity_types is not None:  # type: ignore
-        entity_type_classes = entity_type_classes + tuple(
-            filter(
-                lambda x: x is not None,  # type: ignore
-                [entity_types.get(entity_type) for entity_type in extracted_node.labels],  # type: ignore
-            )
-        )
+    entity_type_classes = get_entity_type_classes(extracted_node, entity_types)
 
     for entity_type in entity_type_classes:
         for field_name in entity_type.model_fields:
@@ -354,10 +736,23 @@ async def resolve_extracted_node(
         __base__=entity_type_classes + (Summary,),  # type: ignore
     )
 
+    resolved, duplicate_node = (
+        resolve_node_without_llm(extracted_node, existing_nodes, policy, stats)
+        if policy is not None
+        else (False, None)
+    )
+
+    async def dedupe_node() -> dict:
+        if not resolved:
+            return await llm_client.generate_response(
+                prompt_library.dedupe_nodes.node(context), response_model=NodeDuplicate
+            )
+        if duplicate_node is None:
+            return {'is_duplicate': False}
+        return {'is_duplicate': True, 'uuid': duplicate_node.uuid, 'name': duplicate_node.name}
+
     llm_response, node_attributes_response = await semaphore_gather(
-        llm_client.generate_response(
-            prompt_library.dedupe_nodes.node(context), response_model=NodeDuplicate
-        ),
+        dedupe_node(),
         llm_client.generate_response(
             prompt_library.summarize_nodes.summarize_context(summary_context),
             response_model=entity_attributes_model,
@@ -365,15 +760,7 @@ async def resolve_extracted_node(
     )
 
     extracted_node.summary = node_attributes_response.get('summary', '')
-    node_attributes = {
-        key: value if (value != 'None' or key == 'summary') else None
-        for key, value in node_attributes_response.items()
-    }
-
-    with suppress(KeyError):
-        del node_attributes['summary']
-
-    extracted_node.attributes.update(node_attributes)
+    extracted_node.attributes.update(parse_node_attributes(node_attributes_response))
 
     is_duplicate: bool = llm_response.get('is_duplicate', False)
     uuid: str | None = llm_response.get('uuid', None)
@@ -19,11 +19,13 @@ from datetime import datetime
 from time import time
 
 from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import semaphore_gather
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.llm_client.utils import chunk_by_token_budget, estimate_token_count
 from graphiti_core.nodes import EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.extract_edge_dates import EdgeDates
-from graphiti_core.prompts.invalidate_edges import InvalidatedEdges
+from graphiti_core.prompts.extract_edge_dates import EdgeDates, FactDatesList
+from graphiti_core.prompts.invalidate_edges import ContradictedFactsList, InvalidatedEdges
 from graphiti_core.utils.datetime_utils import ensure_utc
 
 logger = logging.getLogger(__name__)
@@ -45,8 +47,12 @@ async def extract_edge_dates(
         prompt_library.extract_edge_dates.v1(context), response_model=EdgeDates
     )
 
-    valid_at = llm_response.get('valid_at')
-    invalid_at = llm_response.get('invalid_at')
+    return parse_edge_dates(llm_response)
+
+
+def parse_edge_dates(edge_dates: dict) -> tuple[datetime | None, datetime | None]:
+    valid_at = edge_dates.get('valid_at')
+    invalid_at = edge_dates.get('invalid_at')
 
     valid_at_datetime = None
     invalid_at_datetime = None
@@ -101,3 +107,136 @@ async def get_edge_contradictions(
     )
 
     return contradicted_edges
+
+
+def build_candidate_context(
+    candidate_lists: list[list[EntityEdge]],
+) -> tuple[list[dict], list[list[int]], list[dict[int, EntityEdge]]]:
+    """
+    Number the candidate edges of several facts once, so that candidates shared by many facts
+    are only sent to the LLM once. Returns the candidate context, the candidate idxs of each fact
+    and, for each fact, a map from idx to that fact's own candidate edge.
+    """
+    idx_by_uuid: dict[str, int] = {}
+    candidates_context: list[dict] = []
+    candidate_idxs: list[list[int]] = []
+    candidate_maps: list[dict[int, EntityEdge]] = []
+    for candidates in candidate_lists:
+        candidate_map: dict[int, EntityEdge] = {}
+        for candidate in candidates:
+            if candidate.uuid not in idx_by_uuid:
+                idx_by_uuid[candidate.uuid] = len(candidates_context)
+                candidates_context.append(
+                    {'idx': len(candidates_context), 'name': candidate.name, 'fact': candidate.fact}
+                )
+            candidate_map[idx_by_uuid[candidate.uuid]] = candidate
+        candidate_idxs.append(list(candidate_map.keys()))
+        candidate_maps.append(candidate_map)
+
+    return candidates_context, candidate_idxs, candidate_maps
+
+
+def candidate_token_counts(
+    edges: list[EntityEdge], candidate_lists: list[list[EntityEdge]]
+) -> list[int]:
+    return [
+        estimate_token_count(edge.fact)
+        + sum(estimate_token_count(candidate.fact) for candidate in candidates)
+        for edge, candidates in zip(edges, candidate_lists)
+    ]
+
+
+async def extract_edge_dates_batch(
+    llm_client: LLMClient,
+    edges: list[EntityEdge],
+    current_episode: EpisodicNode,
+    previous_episodes: list[EpisodicNode],
+    max_prompt_tokens: int,
+) -> list[tuple[datetime | None, datetime | None]]:
+    """Extract the dates of many facts of the same episode, sending the episode text once per call."""
+    base_tokens = estimate_token_count(current_episode.content) + sum(
+        estimate_token_count(ep.content) for ep in previous_episodes
+    )
+    chunks = chunk_by_token_budget(
+        [estimate_token_count(edge.fact) for edge in edges], max_prompt_tokens, base_tokens
+    )
+
+    async def extract_chunk_dates(chunk: list[int]) -> dict[int, dict]:
+        context = {
+            'edge_facts': [{'id': i, 'fact': edges[i].fact} for i in chunk],
+            'current_episode': current_episode.content,
+            'previous_episodes': [ep.content for ep in previous_episodes],
+            'reference_timestamp': current_episode.valid_at.isoformat(),
+        }
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_edge_dates.batch(context), response_model=FactDatesList
+        )
+        return {
+            fact_dates['id']: fact_dates
+            for fact_dates in llm_response.get('fact_dates', [])
+            if fact_dates.get('id') in chunk
+        }
+
+    dates_by_id: dict[int, dict] = {}
+    for chunk_dates in await semaphore_gather(*[extract_chunk_dates(chunk) for chunk in chunks]):
+        dates_by_id.update(chunk_dates)
+
+    return [parse_edge_dates(dates_by_id.get(i, {})) for i in range(len(edges))]
+
+
+async def get_edge_contradictions_batch(
+    llm_client: LLMClient,
+    new_edges: list[EntityEdge],
+    existing_edges_lists: list[list[EntityEdge]],
+    max_prompt_tokens: int,
+) -> list[list[EntityEdge]]:
+    """Find the contradicted existing edges of many new edges, skipping edges without candidates."""
+    start = time()
+
+    contradicted_edges_lists: list[list[EntityEdge]] = [[] for _ in new_edges]
+    candidate_ids = [i for i, existing_edges in enumerate(existing_edges_lists) if existing_edges]
+    if not candidate_ids:
+        return contradicted_edges_lists
+
+    chunks = chunk_by_token_budget(
+        candidate_token_counts(
+            [new_edges[i] for i in candidate_ids], [existing_edges_lists[i] for i in candidate_ids]
+        ),
+        max_prompt_tokens,
+    )
+
+    async def get_chunk_contradictions(chunk: list[int]):
+        ids = [candidate_ids[i] for i in chunk]
+        existing_context, candidate_idxs, candidate_maps = build_candidate_context(
+            [existing_edges_lists[i] for i in ids]
+        )
+        context = {
+            'existing_edges': existing_context,
+            'new_edges': [
+                {'id': i, 'fact': new_edges[i].fact, 'candidate_idxs': idxs}
+                for i, idxs in zip(ids, candidate_idxs)
+            ],
+        }
+        llm_response = await llm_client.generate_response(
+            prompt_library.invalidate_edges.batch(context), response_model=ContradictedFactsList
+        )
+
+        candidate_map_by_id = dict(zip(ids, candidate_maps))
+        for contradiction in llm_response.get('contradictions', []):
+            candidate_map = candidate_map_by_id.get(contradiction.get('id'))
+            if candidate_map is None:
+                continue
+            contradicted_edges_lists[contradiction['id']] = [
+                candidate_map[idx]
+                for idx in contradiction.get('contradicted_idxs', [])
+                if idx in candidate_map
+            ]
+
+    await semaphore_gather(*[get_chunk_contradictions(chunk) for chunk in chunks])
+
+    end = time()
+    logger.debug(
+        f'Found invalidated edge candidates for {len(new_edges)} edges in {len(chunks)} calls, in {(end - start) * 1000} ms'
+    )
+
+    return contradicted_edges_lists
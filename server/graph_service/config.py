@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     neo4j_uri: str
     neo4j_user: str
     neo4j_password: str
+    # Only enable these caches when a single server process writes to the graph, as they are
+    # invalidated in-process and other writers make them stale
+    episode_window_cache_enabled: bool = Field(False)
+    search_result_cache_enabled: bool = Field(False)
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
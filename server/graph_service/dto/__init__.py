@@ -4,6 +4,8 @@ from .retrieve import (
     FactResult,
     GetMemoryRequest,
     GetMemoryResponse,
+    SearchBatchQuery,
+    SearchBatchResults,
     SearchQuery,
     SearchResults,
 )
@@ -14,6 +16,8 @@ __all__ = [
     'AddMessagesRequest',
     'AddEntityNodeRequest',
     'SearchResults',
+    'SearchBatchQuery',
+    'SearchBatchResults',
     'FactResult',
     'Result',
     'GetMemoryRequest',
@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field
 
 from graph_service.dto.common import Message
 
+MAX_SEARCH_BATCH_QUERIES = 1000
+
 
 class SearchQuery(BaseModel):
     group_ids: list[str] | None = Field(
@@ -13,6 +15,20 @@ class SearchQuery(BaseModel):
     max_facts: int = Field(default=10, description='The maximum number of facts to retrieve')
 
 
+class SearchBatchQuery(BaseModel):
+    group_ids: list[str] | None = Field(
+        None, description='The group ids for the memories to search'
+    )
+    queries: list[str] = Field(
+        ...,
+        max_length=MAX_SEARCH_BATCH_QUERIES,
+        description='The queries to search for',
+    )
+    max_facts: int = Field(
+        default=10, description='The maximum number of facts to retrieve per query'
+    )
+
+
 class FactResult(BaseModel):
     uuid: str
     name: str
@@ -30,6 +46,12 @@ class SearchResults(BaseModel):
     facts: list[FactResult]
 
 
+class SearchBatchResults(BaseModel):
+    results: list[SearchResults] = Field(
+        ..., description='The search results of each query, in the order of the queries'
+    )
+
+
 class GetMemoryRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the memory to get')
     max_facts: int = Field(default=10, description='The maximum number of facts to retrieve')
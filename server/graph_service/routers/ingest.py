@@ -1,48 +1,21 @@
-import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 
 from fastapi import APIRouter, FastAPI, status
 from graphiti_core.nodes import EpisodeType  # type: ignore
+from graphiti_core.utils.ingestion_scheduler import IngestionScheduler  # type: ignore
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # type: ignore
 
 from graph_service.dto import AddEntityNodeRequest, AddMessagesRequest, Message, Result
 from graph_service.zep_graphiti import ZepGraphitiDep
 
-
-class AsyncWorker:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-        self.task = None
-
-    async def worker(self):
-        while True:
-            try:
-                print(f'Got a job: (size of remaining queue: {self.queue.qsize()})')
-                job = await self.queue.get()
-                await job()
-            except asyncio.CancelledError:
-                break
-
-    async def start(self):
-        self.task = asyncio.create_task(self.worker())
-
-    async def stop(self):
-        if self.task:
-            self.task.cancel()
-            await self.task
-        while not self.queue.empty():
-            self.queue.get_nowait()
-
-
-async_worker = AsyncWorker()
+ingestion_scheduler = IngestionScheduler()
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await async_worker.start()
     yield
-    await async_worker.stop()
+    await ingestion_scheduler.stop()
 
 
 router = APIRouter(lifespan=lifespan)
@@ -62,10 +35,12 @@ async def add_messages(
             reference_time=m.timestamp,
             source=EpisodeType.message,
             source_description=m.source_description,
+            skip_if_duplicate=True,
         )
 
+    # messages of a group are ingested in order, different groups are ingested concurrently
     for m in request.messages:
-        await async_worker.queue.put(partial(add_messages_task, m))
+        ingestion_scheduler.submit(request.group_id, partial(add_messages_task, m))
 
     return Result(message='Messages added to processing queue', success=True)
 
@@ -107,5 +82,8 @@ async def clear(
     graphiti: ZepGraphitiDep,
 ):
     await clear_data(graphiti.driver)
+    if graphiti.episode_window_cache is not None:
+        graphiti.episode_window_cache.invalidate()
+    graphiti.invalidate_search_results()
     await graphiti.build_indices_and_constraints()
     return Result(message='Graph cleared', success=True)
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, status
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF  # type: ignore
 
 from graph_service.dto import (
     GetMemoryRequest,
     GetMemoryResponse,
     Message,
+    SearchBatchQuery,
+    SearchBatchResults,
     SearchQuery,
     SearchResults,
 )
@@ -27,6 +30,21 @@ async def search(query: SearchQuery, graphiti: ZepGraphitiDep):
     )
 
 
+@router.post('/search-batch', status_code=status.HTTP_200_OK)
+async def search_batch(query: SearchBatchQuery, graphiti: ZepGraphitiDep):
+    search_results = await graphiti.search_batch(
+        queries=query.queries,
+        config=EDGE_HYBRID_SEARCH_RRF.model_copy(update={'limit': query.max_facts}),
+        group_ids=query.group_ids,
+    )
+    return SearchBatchResults(
+        results=[
+            SearchResults(facts=[get_fact_result_from_edge(edge) for edge in result.edges])
+            for result in search_results
+        ]
+    )
+
+
 @router.get('/entity-edge/{uuid}', status_code=status.HTTP_200_OK)
 async def get_entity_edge(uuid: str, graphiti: ZepGraphitiDep):
     entity_edge = await graphiti.get_entity_edge(uuid)
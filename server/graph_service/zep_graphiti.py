@@ -7,16 +7,42 @@ from graphiti_core.edges import EntityEdge  # type: ignore
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
 from graphiti_core.llm_client import LLMClient  # type: ignore
 from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
+from graphiti_core.search.query_embedding_cache import QueryEmbeddingCache  # type: ignore
+from graphiti_core.search.search_result_cache import SearchResultCache  # type: ignore
+from graphiti_core.utils.episode_window_cache import EpisodeWindowCache  # type: ignore
 
 from graph_service.config import ZepEnvDep
 from graph_service.dto import FactResult
 
 logger = logging.getLogger(__name__)
 
+# Shared by the per-request clients so that episode windows, query embeddings and search results
+# outlive a single request. The episode window and search result caches are only used when enabled
+# in the settings.
+episode_window_cache = EpisodeWindowCache()
+query_embedding_cache = QueryEmbeddingCache()
+search_result_cache = SearchResultCache()
+
 
 class ZepGraphiti(Graphiti):
-    def __init__(self, uri: str, user: str, password: str, llm_client: LLMClient | None = None):
-        super().__init__(uri, user, password, llm_client)
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        llm_client: LLMClient | None = None,
+        episode_window_cache: EpisodeWindowCache | None = None,
+        search_result_cache: SearchResultCache | None = None,
+    ):
+        super().__init__(
+            uri,
+            user,
+            password,
+            llm_client,
+            episode_window_cache=episode_window_cache,
+            query_embedding_cache=query_embedding_cache,
+            search_result_cache=search_result_cache,
+        )
 
     async def save_entity_node(self, name: str, uuid: str, group_id: str, summary: str = ''):
         # Ensure summary is never None
@@ -30,6 +56,7 @@ class ZepGraphiti(Graphiti):
         )
         await new_node.generate_name_embedding(self.embedder)
         await new_node.save(self.driver)
+        self.invalidate_search_results([group_id])
         return new_node
 
     async def get_entity_edge(self, uuid: str):
@@ -59,10 +86,15 @@ class ZepGraphiti(Graphiti):
         for episode in episodes:
             await episode.delete(self.driver)
 
+        if self.episode_window_cache is not None:
+            self.episode_window_cache.invalidate(group_id)
+        self.invalidate_search_results([group_id])
+
     async def delete_entity_edge(self, uuid: str):
         try:
             edge = await EntityEdge.get_by_uuid(self.driver, uuid)
             await edge.delete(self.driver)
+            self.invalidate_search_results([edge.group_id])
         except EdgeNotFoundError as e:
             raise HTTPException(status_code=404, detail=e.message) from e
 
@@ -70,6 +102,9 @@ class ZepGraphiti(Graphiti):
         try:
             episode = await EpisodicNode.get_by_uuid(self.driver, uuid)
             await episode.delete(self.driver)
+            if self.episode_window_cache is not None:
+                self.episode_window_cache.invalidate(episode.group_id)
+            self.invalidate_search_results([episode.group_id])
         except NodeNotFoundError as e:
             raise HTTPException(status_code=404, detail=e.message) from e
 
@@ -79,6 +114,10 @@ async def get_graphiti(settings: ZepEnvDep):
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
+        episode_window_cache=(
+            episode_window_cache if settings.episode_window_cache_enabled else None
+        ),
+        search_result_cache=search_result_cache if settings.search_result_cache_enabled else None,
     )
     if settings.openai_base_url is not None:
         client.llm_client.config.base_url = settings.openai_base_url
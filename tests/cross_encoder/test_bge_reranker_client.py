@@ -14,6 +14,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+
 import pytest
 
 from graphiti_core.cross_encoder.bge_reranker_client import BGERerankerClient
@@ -81,3 +83,21 @@ async def test_rank_single_passage(client):
     # Check if the passage is correct and the score is a float
     assert ranked_passages[0][0] == passages[0]
     assert isinstance(ranked_passages[0][1], float)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_concurrent_ranks_are_batched(client):
+    passages = [
+        'Paris is the capital and most populous city of France.',
+        'Berlin is the capital and largest city of Germany.',
+    ]
+    queries = ['What is the capital of France?', 'What is the capital of Germany?']
+
+    single_results = [await client.rank(query, passages) for query in queries]
+    concurrent_results = await asyncio.gather(*[client.rank(query, passages) for query in queries])
+
+    for single, concurrent in zip(single_results, concurrent_results, strict=True):
+        assert [passage for passage, _ in single] == [passage for passage, _ in concurrent]
+        for (_, single_score), (_, concurrent_score) in zip(single, concurrent, strict=True):
+            assert concurrent_score == pytest.approx(single_score, abs=1e-4)
@@ -0,0 +1,101 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.cross_encoder.openai_reranker_client import (
+    OpenAIRerankerClient,
+    PassageRelevance,
+    PassageRelevances,
+)
+
+
+def make_logprob_response(token: str | None, probability: float = 1.0):
+    if token is None:
+        return SimpleNamespace(choices=[SimpleNamespace(logprobs=None)])
+
+    top_logprob = SimpleNamespace(token=token, logprob=math.log(probability))
+    content = [SimpleNamespace(top_logprobs=[top_logprob])]
+    return SimpleNamespace(choices=[SimpleNamespace(logprobs=SimpleNamespace(content=content))])
+
+
+def make_rating_response(relevances: dict[int, int]):
+    parsed = PassageRelevances(
+        passages=[
+            PassageRelevance(passage_id=passage_id, relevance=relevance)
+            for passage_id, relevance in relevances.items()
+        ]
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+
+
+@pytest.mark.asyncio
+async def test_scores_stay_aligned_when_logprobs_are_missing():
+    openai_client = MagicMock()
+    responses = {
+        'Paris': make_logprob_response(None),
+        'London': make_logprob_response('True', 0.9),
+        'Berlin': make_logprob_response('False', 0.8),
+    }
+    openai_client.chat.completions.create = AsyncMock(
+        side_effect=lambda **kwargs: responses[
+            next(p for p in responses if p in kwargs['messages'][1].content)
+        ]
+    )
+    reranker = OpenAIRerankerClient(client=openai_client)
+
+    results = await reranker.rank('query', ['Paris', 'London', 'Berlin'])
+
+    # Paris has no logprobs, its score must not be taken from another response
+    assert [passage for passage, _ in results] == ['London', 'Berlin', 'Paris']
+    assert results[0][1] == pytest.approx(0.9)
+    assert results[1][1] == pytest.approx(0.2)
+    assert results[2][1] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_batched_rank_rates_passages_per_request():
+    openai_client = MagicMock()
+    openai_client.beta.chat.completions.parse = AsyncMock(
+        side_effect=[make_rating_response({0: 3, 1: 10}), make_rating_response({})]
+    )
+    reranker = OpenAIRerankerClient(client=openai_client, batch_size=2)
+
+    results = await reranker.rank('query', ['a', 'b', 'c', 'a'])
+
+    assert openai_client.beta.chat.completions.parse.await_count == 2
+    assert results == [('b', 1.0), ('a', 0.3), ('c', 0.0)]
+
+
+@pytest.mark.asyncio
+async def test_cached_scores_are_not_requested_again():
+    openai_client = MagicMock()
+    openai_client.beta.chat.completions.parse = AsyncMock(
+        side_effect=[make_rating_response({0: 5, 1: 7}), make_rating_response({0: 9})]
+    )
+    reranker = OpenAIRerankerClient(client=openai_client, batch_size=10)
+
+    await reranker.rank('query', ['a', 'b'])
+    results = await reranker.rank('query', ['a', 'b', 'c'])
+
+    assert results == [('c', 0.9), ('b', 0.7), ('a', 0.5)]
+    second_prompt = openai_client.beta.chat.completions.parse.call_args.kwargs['messages'][1]
+    assert '<PASSAGE id="0">\nc\n</PASSAGE>' in second_prompt.content
+    assert reranker.score_cache.hits == 2
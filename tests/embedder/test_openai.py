@@ -0,0 +1,93 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.edges import EntityEdge, create_entity_edge_embeddings
+from graphiti_core.embedder import openai as openai_embedder
+from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+from graphiti_core.nodes import EntityNode, create_entity_node_embeddings
+
+
+def make_embedder() -> tuple[OpenAIEmbedder, AsyncMock]:
+    async def create(input, model):
+        # return the embeddings out of order to check they are re-aligned by index
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i), 0.0])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(side_effect=create)
+    embedder = OpenAIEmbedder(OpenAIEmbedderConfig(embedding_dim=2, api_key='test'), client=client)
+    return embedder, client.embeddings.create
+
+
+@pytest.mark.asyncio
+async def test_create_batch_preserves_order():
+    embedder, create = make_embedder()
+
+    embeddings = await embedder.create_batch(['a', 'bb', 'ccc'])
+
+    assert embeddings == [[1.0, 0.0], [2.0, 1.0], [3.0, 2.0]]
+    assert create.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_batch_chunks_requests(monkeypatch):
+    monkeypatch.setattr(openai_embedder, 'EMBEDDING_BATCH_SIZE', 2)
+    embedder, create = make_embedder()
+
+    embeddings = await embedder.create_batch(['a', 'bb', 'ccc', 'dddd', 'eeeee'])
+
+    assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert create.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_create_batch_empty():
+    embedder, create = make_embedder()
+
+    assert await embedder.create_batch([]) == []
+    create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_embedding_helpers():
+    embedder, create = make_embedder()
+    nodes = [EntityNode(name=name, group_id='1') for name in ['Alice', 'Bob']]
+    edges = [
+        EntityEdge(
+            source_node_uuid=nodes[0].uuid,
+            target_node_uuid=nodes[1].uuid,
+            name='KNOWS',
+            fact='Alice\nknows Bob',
+            group_id='1',
+            created_at=nodes[0].created_at,
+        )
+    ]
+
+    await create_entity_node_embeddings(embedder, nodes)
+    await create_entity_edge_embeddings(embedder, edges)
+
+    assert [node.name_embedding for node in nodes] == [[5.0, 0.0], [3.0, 1.0]]
+    assert edges[0].fact_embedding == [15.0, 0.0]
+    assert create.call_count == 2
+    assert create.call_args_list[1].kwargs['input'] == ['Alice knows Bob']
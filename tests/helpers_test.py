@@ -16,7 +16,7 @@ limitations under the License.
 
 import pytest
 
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.helpers import iterate_in_windows, lucene_sanitize
 
 
 def test_lucene_sanitize():
@@ -34,5 +34,19 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+@pytest.mark.asyncio
+async def test_iterate_in_windows():
+    async def generate(n: int):
+        for i in range(n):
+            yield i
+
+    assert [window async for window in iterate_in_windows(range(5), 2)] == [[0, 1], [2, 3], [4]]
+    assert [window async for window in iterate_in_windows(generate(4), 2)] == [[0, 1], [2, 3]]
+    assert [window async for window in iterate_in_windows([], 2)] == []
+
+    with pytest.raises(ValueError):
+        await anext(iterate_in_windows([1], 0))
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
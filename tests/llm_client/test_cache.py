@@ -0,0 +1,124 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.cache import (
+    DiskLLMCache,
+    InMemoryLLMCache,
+    TieredLLMCache,
+    get_cache_key,
+)
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
+
+
+class CountingLLMClient(LLMClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    async def _generate_response(self, messages, response_model=None, max_tokens=0):
+        self.calls += 1
+        return {'content': messages[-1].content}
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class OtherAnswer(BaseModel):
+    other: str
+
+
+def make_messages(content: str, prompt_name: str | None = 'extract_nodes.extract_message'):
+    return [
+        Message(role='system', content='system', prompt_name=prompt_name),
+        Message(role='user', content=content, prompt_name=prompt_name),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_for_input_changed_by_cleaning():
+    cache = InMemoryLLMCache()
+    client = CountingLLMClient(LLMConfig(), cache=cache)
+
+    await client.generate_response(make_messages('Hello\x00World'))
+    await client.generate_response(make_messages('Hello\x00World'))
+
+    assert client.calls == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_a_copy():
+    client = CountingLLMClient(LLMConfig(), cache=InMemoryLLMCache())
+
+    response = await client.generate_response(make_messages('Hello'))
+    response['content'] = 'mutated'
+
+    assert (await client.generate_response(make_messages('Hello')))['content'] != 'mutated'
+
+
+def test_cache_key_includes_prompt_and_schema():
+    key = get_cache_key('model', 0, 100, make_messages('Hello'), Answer)
+
+    assert key == get_cache_key('model', 0, 100, make_messages('Hello'), Answer)
+    assert key != get_cache_key('model', 0, 100, make_messages('Hello'), OtherAnswer)
+    assert key != get_cache_key(
+        'model', 0, 100, make_messages('Hello', 'dedupe_nodes.node'), Answer
+    )
+    assert key != get_cache_key('other', 0, 100, make_messages('Hello'), Answer)
+    assert key != get_cache_key('model', 0, 200, make_messages('Hello'), Answer)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryLLMCache(max_size=2)
+
+    await cache.set('a', {'v': 1})
+    await cache.set('b', {'v': 2})
+    await cache.get('a')
+    await cache.set('c', {'v': 3})
+
+    assert await cache.get('a') == {'v': 1}
+    assert await cache.get('b') is None
+    assert await cache.get('c') == {'v': 3}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_ttl():
+    cache = InMemoryLLMCache(ttl=0)
+
+    await cache.set('a', {'v': 1})
+
+    assert await cache.get('a') is None
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_backfills_memory_tier(tmp_path):
+    disk = DiskLLMCache(str(tmp_path))
+    await disk.set('a', {'v': 1})
+
+    memory = InMemoryLLMCache()
+    cache = TieredLLMCache([memory, disk])
+
+    assert await cache.get('a') == {'v': 1}
+    assert await memory.get('a') == {'v': 1}
+    assert disk.stats() == {'hits': 1, 'misses': 0}
+    assert cache.stats() == {'hits': 1, 'misses': 0}
@@ -0,0 +1,144 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.errors import RateLimitError
+from graphiti_core.llm_client.rate_limiter import AdaptiveRateLimiter, get_shared_rate_limiter
+from graphiti_core.prompts.models import Message
+
+
+@pytest.mark.asyncio
+async def test_limits_in_flight_requests():
+    limiter = AdaptiveRateLimiter(max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request():
+        nonlocal in_flight, max_in_flight
+        async with limiter.limit():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*[request() for _ in range(10)])
+
+    assert max_in_flight == 2
+    assert limiter.state().in_flight == 0
+    assert limiter.state().successes == 10
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_halves_concurrency_once_per_burst():
+    limiter = AdaptiveRateLimiter(max_concurrency=8)
+
+    async def rate_limited():
+        async with limiter.limit():
+            raise RateLimitError()
+
+    for _ in range(3):
+        with pytest.raises(RateLimitError):
+            await rate_limited()
+
+    state = limiter.state()
+    assert state.concurrency_limit == 4
+    assert state.rate_limit_errors == 3
+    assert state.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_successes_increase_concurrency_additively():
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=2)
+
+    for _ in range(4):
+        limiter._on_success(1.0)
+
+    assert limiter.state().concurrency_limit == 3
+
+
+def test_degraded_latency_holds_concurrency():
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=2)
+
+    limiter._on_success(1.0)
+    for _ in range(10):
+        limiter._on_success(10.0)
+
+    assert limiter.state().concurrency_limit == 2
+
+
+def test_concurrency_recovers_once_latency_settles_at_a_new_level():
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=2)
+
+    limiter._on_success(1.0)
+    # slower requests, e.g. longer prompts, become the new baseline instead of holding forever
+    for _ in range(500):
+        limiter._on_success(5.0)
+
+    assert limiter.state().concurrency_limit == 8
+
+
+@pytest.mark.asyncio
+async def test_token_budget_is_consumed():
+    limiter = AdaptiveRateLimiter(tokens_per_minute=6000)
+
+    async with limiter.limit(estimated_tokens=1000):
+        pass
+
+    available_tokens = limiter.state().available_tokens
+    assert available_tokens is not None
+    assert 5000 <= available_tokens < 5100
+
+
+class RateLimitedLLMClient(LLMClient):
+    async def _generate_response(self, messages, response_model=None, max_tokens=0):
+        assert self.rate_limiter.state().in_flight == 1
+        return {'content': 'test'}
+
+
+@pytest.mark.asyncio
+async def test_llm_client_requests_go_through_shared_limiter():
+    config = LLMConfig(model='rate-limited-test-model', max_concurrency=3)
+    client = RateLimitedLLMClient(config)
+
+    assert client.rate_limiter is RateLimitedLLMClient(config).rate_limiter
+    assert client.rate_limiter.max_concurrency == 3
+
+    await client.generate_response([Message(role='user', content='Hello')])
+
+    assert client.rate_limiter.state().successes == 1
+
+
+def test_clients_with_different_api_keys_do_not_share_a_limiter():
+    first = RateLimitedLLMClient(LLMConfig(model='api-key-test-model', api_key='first'))
+    second = RateLimitedLLMClient(LLMConfig(model='api-key-test-model', api_key='second'))
+
+    assert first.rate_limiter is not second.rate_limiter
+
+
+def test_shared_limiter_uses_strictest_configured_limits():
+    limiter = get_shared_rate_limiter('strictest-limits-test', max_concurrency=8)
+
+    assert get_shared_rate_limiter('strictest-limits-test', 4, 6000) is limiter
+    assert get_shared_rate_limiter('strictest-limits-test', 16) is limiter
+
+    assert limiter.max_concurrency == 4
+    assert limiter.concurrency_limit == 4
+    assert limiter.tokens_per_minute == 6000
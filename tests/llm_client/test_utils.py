@@ -0,0 +1,25 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from graphiti_core.llm_client.utils import chunk_by_token_budget
+
+
+def test_chunk_by_token_budget():
+    assert chunk_by_token_budget([], 10) == []
+    assert chunk_by_token_budget([4, 4, 4], 10) == [[0, 1], [2]]
+    assert chunk_by_token_budget([4, 4, 4], 10, base_tokens=4) == [[0], [1], [2]]
+    # An item larger than the budget still gets a chunk of its own
+    assert chunk_by_token_budget([20, 1], 10) == [[0], [1]]
@@ -0,0 +1,53 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from graphiti_core.nodes import EpisodeType, get_episode_content_hash
+
+REFERENCE_TIME = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def test_episode_content_hash_is_stable_across_timezones():
+    content_hash = get_episode_content_hash('group', 'hello', EpisodeType.message, REFERENCE_TIME)
+
+    # naive reference times are treated as UTC
+    assert content_hash == get_episode_content_hash(
+        'group', 'hello', EpisodeType.message, datetime(2024, 1, 1, 12)
+    )
+    assert content_hash == get_episode_content_hash(
+        'group',
+        'hello',
+        EpisodeType.message,
+        REFERENCE_TIME.astimezone(timezone(timedelta(hours=2))),
+    )
+
+
+def test_episode_content_hash_changes_with_episode():
+    content_hash = get_episode_content_hash('group', 'hello', EpisodeType.message, REFERENCE_TIME)
+
+    assert content_hash != get_episode_content_hash(
+        'other', 'hello', EpisodeType.message, REFERENCE_TIME
+    )
+    assert content_hash != get_episode_content_hash(
+        'group', 'hello!', EpisodeType.message, REFERENCE_TIME
+    )
+    assert content_hash != get_episode_content_hash(
+        'group', 'hello', EpisodeType.text, REFERENCE_TIME
+    )
+    assert content_hash != get_episode_content_hash(
+        'group', 'hello', EpisodeType.message, REFERENCE_TIME + timedelta(seconds=1)
+    )
@@ -6,7 +6,11 @@ from pytest import MonkeyPatch
 
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EpisodicNode
-from graphiti_core.utils.maintenance.edge_operations import resolve_extracted_edge
+from graphiti_core.utils.maintenance.edge_operations import (
+    EdgeResolutionPolicy,
+    resolve_extracted_edge,
+    resolve_extracted_edges,
+)
 
 
 @pytest.fixture
@@ -237,6 +241,100 @@ async def test_resolve_extracted_edge_with_invalidation(
     assert invalidated_edges[0].expired_at is not None
 
 
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_batch(
+    mock_extracted_edge,
+    mock_related_edges,
+    mock_existing_edges,
+    mock_current_episode,
+    mock_previous_episodes,
+):
+    second_edge = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='second_edge',
+        group_id='group_1',
+        fact='Second fact',
+        episodes=['episode_1'],
+        created_at=datetime.now(timezone.utc),
+    )
+    valid_at = datetime.now(timezone.utc)
+    calls: list[str] = []
+
+    async def generate_response(messages, response_model=None, max_tokens=None):
+        prompt_name = messages[0].prompt_name
+        calls.append(prompt_name)
+        if prompt_name == 'dedupe_edges.edges':
+            return {
+                'duplicate_facts': [{'id': 0, 'duplicate_idx': 0}, {'id': 1, 'duplicate_idx': -1}]
+            }
+        if prompt_name == 'extract_edge_dates.batch':
+            return {
+                'fact_dates': [
+                    {'id': 1, 'valid_at': valid_at.isoformat(), 'invalid_at': None},
+                ]
+            }
+        if prompt_name == 'invalidate_edges.batch':
+            return {'contradictions': [{'id': 1, 'contradicted_idxs': [0]}]}
+        raise AssertionError(f'unexpected prompt {prompt_name}')
+
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(side_effect=generate_response)
+
+    resolved_edges, invalidated_edges = await resolve_extracted_edges(
+        llm_client,
+        [mock_extracted_edge, second_edge],
+        [mock_related_edges, mock_related_edges],
+        [mock_existing_edges, mock_existing_edges],
+        mock_current_episode,
+        mock_previous_episodes,
+        EdgeResolutionPolicy(batch=True),
+    )
+
+    assert sorted(calls) == [
+        'dedupe_edges.edges',
+        'extract_edge_dates.batch',
+        'invalidate_edges.batch',
+    ]
+    assert resolved_edges[0].uuid == mock_related_edges[0].uuid
+    assert resolved_edges[1].uuid == second_edge.uuid
+    assert resolved_edges[1].valid_at == valid_at
+    assert [edge.uuid for edge in invalidated_edges] == [mock_existing_edges[0].uuid]
+    assert invalidated_edges[0].invalid_at == valid_at
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_batch_splits_on_token_budget(
+    mock_extracted_edge,
+    mock_current_episode,
+):
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(
+        return_value={'duplicate_facts': [], 'fact_dates': [], 'contradictions': []}
+    )
+
+    extracted_edges = [mock_extracted_edge.model_copy(update={'fact': 'x' * 400}) for _ in range(3)]
+    no_candidates: list[list[EntityEdge]] = [[] for _ in extracted_edges]
+
+    resolved_edges, invalidated_edges = await resolve_extracted_edges(
+        llm_client,
+        extracted_edges,
+        no_candidates,
+        no_candidates,
+        mock_current_episode,
+        [],
+        EdgeResolutionPolicy(batch=True, max_prompt_tokens=250),
+    )
+
+    # Facts without candidates skip the dedupe and invalidation prompts; dates take two calls
+    prompt_names = [
+        call.args[0][0].prompt_name for call in llm_client.generate_response.call_args_list
+    ]
+    assert prompt_names == ['extract_edge_dates.batch', 'extract_edge_dates.batch']
+    assert resolved_edges == extracted_edges
+    assert invalidated_edges == []
+
+
 # Run the tests
 if __name__ == '__main__':
     pytest.main([__file__])
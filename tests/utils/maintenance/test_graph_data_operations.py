@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j.time import DateTime
+
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    retrieve_episodes,
+    retrieve_episodes_bulk,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_record(index: int, uuid: str, group_id: str, hours: int) -> dict:
+    timestamp = DateTime.from_native(START + timedelta(hours=hours))
+    return {
+        'index': index,
+        'content': f'content {uuid}',
+        'created_at': timestamp,
+        'valid_at': timestamp,
+        'uuid': uuid,
+        'group_id': group_id,
+        'name': uuid,
+        'source_description': 'test',
+        'source': 'message',
+    }
+
+
+@pytest.mark.asyncio
+async def test_retrieve_episodes_scopes_groups_and_orders_by_valid_at():
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(
+        return_value=(
+            [make_record(0, 'b', 'group', 2), make_record(0, 'a', 'group', 1)],
+            None,
+            None,
+        )
+    )
+
+    episodes = await retrieve_episodes(driver, START + timedelta(days=1), 2, ['group'])
+
+    query = driver.execute_query.call_args.args[0]
+    assert 'e.group_id IN $group_ids' in query
+    assert 'ORDER BY e.valid_at DESC' in query
+    assert [episode.uuid for episode in episodes] == ['a', 'b']
+
+    await retrieve_episodes(driver, START + timedelta(days=1), 2)
+    assert '$group_ids' not in driver.execute_query.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_episodes_bulk_groups_records_by_window():
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(
+        return_value=(
+            [
+                make_record(1, 'd', 'other', 4),
+                make_record(0, 'b', 'group', 2),
+                make_record(0, 'a', 'group', 1),
+            ],
+            None,
+            None,
+        )
+    )
+
+    windows = [('group', START + timedelta(hours=3)), ('other', START + timedelta(hours=5))]
+    episodes_lists = await retrieve_episodes_bulk(
+        driver, windows, last_n=2, exclude_uuids=['c', 'e']
+    )
+
+    assert [[episode.uuid for episode in episodes] for episodes in episodes_lists] == [
+        ['a', 'b'],
+        ['d'],
+    ]
+    queries = driver.execute_query.call_args.kwargs['queries']
+    assert [query['exclude_uuid'] for query in queries] == ['c', 'e']
+    assert driver.execute_query.call_args.kwargs['num_episodes'] == 2
+
+    assert await retrieve_episodes_bulk(driver, []) == []
+    driver.execute_query.assert_awaited_once()
@@ -0,0 +1,170 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.maintenance.node_operations import (
+    NodeResolutionPolicy,
+    NodeResolutionStats,
+    resolve_extracted_node,
+    resolve_extracted_nodes,
+    resolve_node_without_llm,
+)
+
+
+def make_node(name: str, embedding: list[float] | None = None, uuid: str | None = None):
+    node = EntityNode(name=name, group_id='group_1', name_embedding=embedding, summary='')
+    if uuid is not None:
+        node.uuid = uuid
+    return node
+
+
+def test_no_candidates_is_new_node():
+    stats = NodeResolutionStats()
+
+    resolved, duplicate = resolve_node_without_llm(
+        make_node('Alice'), [], NodeResolutionPolicy(), stats
+    )
+
+    assert resolved and duplicate is None
+    assert stats.no_candidates == 1
+
+
+def test_normalized_name_match():
+    stats = NodeResolutionStats()
+    existing = make_node(' alice  smith', [0.0, 1.0])
+
+    resolved, duplicate = resolve_node_without_llm(
+        make_node('Alice Smith', [1.0, 0.0]), [existing], NodeResolutionPolicy(), stats
+    )
+
+    assert resolved and duplicate is existing
+    assert stats.name_match == 1
+
+
+@pytest.mark.parametrize('name', ['C++', 'C#', '.NET'])
+def test_punctuation_is_significant_in_name_match(name: str):
+    stats = NodeResolutionStats()
+    existing = make_node(name.strip('.+#'), [0.0, 1.0])
+
+    resolved, duplicate = resolve_node_without_llm(
+        make_node(name, [1.0, 0.0]), [existing], NodeResolutionPolicy(), stats
+    )
+
+    assert duplicate is None
+    assert stats.name_match == 0
+
+
+def test_high_similarity_match():
+    stats = NodeResolutionStats()
+    existing = [make_node('Bob', [0.0, 1.0]), make_node('Alice S.', [1.0, 0.01])]
+
+    resolved, duplicate = resolve_node_without_llm(
+        make_node('Alice Smith', [1.0, 0.0]), existing, NodeResolutionPolicy(), stats
+    )
+
+    assert resolved and duplicate is existing[1]
+    assert stats.high_similarity == 1
+
+
+def test_distinct_candidates():
+    stats = NodeResolutionStats()
+
+    resolved, duplicate = resolve_node_without_llm(
+        make_node('Alice', [1.0, 0.0]),
+        [make_node('Bob', [0.0, 1.0])],
+        NodeResolutionPolicy(),
+        stats,
+    )
+
+    assert resolved and duplicate is None
+    assert stats.distinct == 1
+
+
+def test_ambiguous_candidates_use_llm():
+    stats = NodeResolutionStats()
+    candidates = [make_node('Al', [0.7, 0.7]), make_node('Bob')]
+
+    resolved, _ = resolve_node_without_llm(
+        make_node('Alice', [1.0, 0.0]), candidates, NodeResolutionPolicy(), stats
+    )
+
+    assert not resolved
+    assert stats.llm == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_node_skips_dedupe_prompt():
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(return_value={'summary': 'A person'})
+    existing = make_node('Alice', [1.0, 0.0], uuid='existing')
+
+    node, uuid_map = await resolve_extracted_node(
+        llm_client,
+        make_node('alice', [1.0, 0.0], uuid='extracted'),
+        [existing],
+        policy=NodeResolutionPolicy(),
+    )
+
+    assert node is existing
+    assert uuid_map == {'extracted': 'existing'}
+    # summarize_context and summarize_pair, but no dedupe_nodes prompt
+    prompt_names = [
+        call.args[0][0].prompt_name for call in llm_client.generate_response.call_args_list
+    ]
+    assert prompt_names == [
+        'summarize_nodes.summarize_context',
+        'summarize_nodes.summarize_pair',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_nodes_batch():
+    existing_alice = make_node('Alice Smith', [0.7, 0.7], uuid='existing_alice')
+    existing_alice.summary = 'Alice works at Acme'
+    extracted = [
+        make_node('Alice', [1.0, 0.0], uuid='alice'),
+        make_node('Bob', [0.0, 1.0], uuid='bob'),
+        make_node('Carol', [1.0, 0.0], uuid='carol'),
+    ]
+
+    async def generate_response(messages, response_model=None):
+        prompt_name = messages[0].prompt_name
+        if prompt_name == 'dedupe_nodes.nodes':
+            assert 'Bob' not in messages[1].content
+            return {
+                'entity_resolutions': [
+                    {'id': 0, 'duplicate_idx': 0, 'name': 'Alice Smith'},
+                    {'id': 1, 'duplicate_idx': -1, 'name': 'Carol'},
+                ]
+            }
+        assert prompt_name == 'summarize_nodes.summarize_context_batch'
+        assert 'Alice works at Acme' in messages[1].content
+        return {
+            'summaries': [
+                {'id': 0, 'summary': 'Alice works at Acme and likes tea'},
+                {'id': 1, 'summary': 'Bob is new'},
+                {'id': 2, 'summary': 'Carol is new'},
+            ]
+        }
+
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    stats = NodeResolutionStats()
+
+    nodes, uuid_map = await resolve_extracted_nodes(
+        llm_client,
+        extracted,
+        # Bob has no candidates, so only Alice and Carol go to the dedupe prompt
+        [[existing_alice], [], [existing_alice]],
+        policy=NodeResolutionPolicy(batch=True),
+        stats=stats,
+    )
+
+    assert llm_client.generate_response.call_count == 2
+    assert [node.uuid for node in nodes] == ['existing_alice', 'bob', 'carol']
+    assert uuid_map == {'alice': 'existing_alice'}
+    assert nodes[0].summary == 'Alice works at Acme and likes tea'
+    assert nodes[1].summary == 'Bob is new'
+    assert stats.no_candidates == 1
+    assert stats.llm == 2
@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.embedder import OpenAIEmbedder, OpenAIEmbedderConfig
+from graphiti_core.search.query_embedding_cache import QueryEmbeddingCache
+
+
+def make_embedder(model: str = 'model') -> OpenAIEmbedder:
+    embedder = OpenAIEmbedder(OpenAIEmbedderConfig(embedding_model=model), client=MagicMock())
+    embedder.create = AsyncMock(return_value=[0.1, 0.2])
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_embedded_once():
+    cache = QueryEmbeddingCache()
+    embedder = make_embedder()
+
+    first = await cache.create(embedder, 'who is  Alice?')
+    second = await cache.create(embedder, ' who is\nAlice? ')
+
+    assert first == second == [0.1, 0.2]
+    embedder.create.assert_awaited_once_with(input_data=['who is Alice?'])
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses, stats.hit_rate) == (1, 1, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_keyed_by_model():
+    cache = QueryEmbeddingCache()
+    embedder = make_embedder('small')
+    other_embedder = make_embedder('large')
+
+    await cache.create(embedder, 'Alice')
+    await cache.create(other_embedder, 'Alice')
+
+    other_embedder.create.assert_awaited_once()
+    assert len(cache) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryEmbeddingCache(max_size=2)
+    embedder = make_embedder()
+
+    cache.set(embedder, 'a', [1.0])
+    cache.set(embedder, 'b', [2.0])
+    cache.get(embedder, 'a')
+    cache.set(embedder, 'c', [3.0])
+
+    assert cache.get(embedder, 'a') == [1.0]
+    assert cache.get(embedder, 'b') is None
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_not_returned():
+    cache = QueryEmbeddingCache(ttl=60)
+    embedder = make_embedder()
+
+    with patch('graphiti_core.helpers.monotonic', return_value=0):
+        cache.set(embedder, 'a', [1.0])
+    with patch('graphiti_core.helpers.monotonic', return_value=61):
+        assert cache.get(embedder, 'a') is None
+
+    assert len(cache) == 0
@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.search.query_embedding_cache import QueryEmbeddingCache
+from graphiti_core.search.search import search, search_batch
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+
+
+def make_edge_record(uuid: str, search_index: int = 0) -> dict:
+    created_at = MagicMock()
+    created_at.to_native.return_value = datetime.now(timezone.utc)
+    return {
+        'search_index': search_index,
+        'uuid': uuid,
+        'group_id': '1',
+        'source_node_uuid': 'a',
+        'target_node_uuid': 'b',
+        'created_at': created_at,
+        'name': 'KNOWS',
+        'fact': f'fact {uuid}',
+        'fact_embedding': [0.1, 0.2],
+        'episodes': [],
+        'expired_at': None,
+        'valid_at': None,
+        'invalid_at': None,
+    }
+
+
+def make_edge(uuid: str) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        source_node_uuid='a',
+        target_node_uuid='b',
+        name='KNOWS',
+        fact=f'fact {uuid}',
+        group_id='1',
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_batch_retrieves_all_queries_at_once():
+    embedder = MagicMock()
+    embedder.create_batch = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_bulk',
+            AsyncMock(return_value=[[make_edge('1'), make_edge('2')], [make_edge('3')]]),
+        ) as fulltext_mock,
+        patch(
+            'graphiti_core.search.search.edge_similarity_search_bulk',
+            AsyncMock(return_value=[[make_edge('2')], []]),
+        ) as similarity_mock,
+    ):
+        results = await search_batch(
+            MagicMock(),
+            embedder,
+            MagicMock(),
+            ['alice', '', 'bob'],
+            ['1'],
+            EDGE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+        )
+
+    embedder.create_batch.assert_awaited_once_with(['alice', 'bob'])
+    fulltext_mock.assert_awaited_once()
+    similarity_mock.assert_awaited_once()
+    assert fulltext_mock.call_args.args[1] == ['alice', 'bob']
+    assert similarity_mock.call_args.args[1] == [[0.1, 0.2], [0.3, 0.4]]
+    # results are reranked per query and empty queries get empty results
+    assert [[edge.uuid for edge in result.edges] for result in results] == [['2', '1'], [], ['3']]
+
+
+@pytest.mark.asyncio
+async def test_search_batch_only_embeds_uncached_queries():
+    cache = QueryEmbeddingCache()
+    embedder = MagicMock()
+    embedder.create_batch = AsyncMock(return_value=[[0.3, 0.4]])
+    cache.set(embedder, 'alice', [0.1, 0.2])
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_bulk',
+            AsyncMock(return_value=[[], [], []]),
+        ),
+        patch(
+            'graphiti_core.search.search.edge_similarity_search_bulk',
+            AsyncMock(return_value=[[], [], []]),
+        ) as similarity_mock,
+    ):
+        await search_batch(
+            MagicMock(),
+            embedder,
+            MagicMock(),
+            ['alice', 'bob', ' bob'],
+            None,
+            EDGE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            query_embedding_cache=cache,
+        )
+
+    embedder.create_batch.assert_awaited_once_with(['bob'])
+    assert similarity_mock.call_args.args[1] == [[0.1, 0.2], [0.3, 0.4], [0.3, 0.4]]
+
+
+@pytest.mark.asyncio
+async def test_search_batch_agrees_with_search():
+    queries: list[str] = []
+
+    async def execute_query(cypher_query, *args, **kwargs):
+        # the single query fulltext search wraps its Cypher in a neo4j Query
+        query = getattr(cypher_query, 'text', cypher_query)
+        queries.append(query)
+        if 'db.index.fulltext' in query:
+            return [make_edge_record('1'), make_edge_record('2')], None, None
+        return [make_edge_record('3'), make_edge_record('1')], None, None
+
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(side_effect=execute_query)
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.1, 0.2])
+    embedder.create_batch = AsyncMock(return_value=[[0.1, 0.2]])
+
+    single = await search(
+        driver, embedder, MagicMock(), 'alice', ['1'], EDGE_HYBRID_SEARCH_RRF, SearchFilters()
+    )
+    batch = await search_batch(
+        driver, embedder, MagicMock(), ['alice'], ['1'], EDGE_HYBRID_SEARCH_RRF, SearchFilters()
+    )
+
+    assert [edge.uuid for edge in batch[0].edges] == [edge.uuid for edge in single.edges]
+    # both fulltext searches filter the relationships returned by the index in the same way
+    fulltext_queries = [query for query in queries if 'db.index.fulltext' in query]
+    assert len(fulltext_queries) == 2
+    for query in fulltext_queries:
+        assert (
+            "WHERE type(r) = 'RELATES_TO' AND ($group_ids IS NULL OR r.group_id IN $group_ids)"
+            in query
+        )
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeReranker,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_planner import (
+    needs_query_vector,
+    plan_edge_retrievers,
+    plan_node_retrievers,
+)
+
+
+def test_plan_fetches_limit_for_single_unfused_retriever():
+    config = EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25])
+
+    assert plan_edge_retrievers(config, 10) == {EdgeSearchMethod.bm25: 10}
+
+    config.reranker = EdgeReranker.mmr
+    assert plan_edge_retrievers(config, 10) == {EdgeSearchMethod.bm25: 20}
+
+
+def test_plan_fetches_extra_candidates_for_fused_retrievers():
+    config = NodeSearchConfig(
+        search_methods=[NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity],
+        reranker=NodeReranker.cross_encoder,
+    )
+
+    assert plan_node_retrievers(config, 5) == {
+        NodeSearchMethod.bm25: 10,
+        NodeSearchMethod.cosine_similarity: 10,
+    }
+
+
+def test_needs_query_vector():
+    bm25_config = SearchConfig(
+        edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]),
+        node_config=NodeSearchConfig(search_methods=[NodeSearchMethod.bm25]),
+    )
+    assert not needs_query_vector(bm25_config)
+    assert not needs_query_vector(SearchConfig())
+
+    bm25_config.node_config.reranker = NodeReranker.mmr
+    assert needs_query_vector(bm25_config)
+
+    assert needs_query_vector(
+        SearchConfig(
+            edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.cosine_similarity])
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_bm25_search_runs_only_fulltext_retriever():
+    embedder = MagicMock()
+    embedder.create = AsyncMock()
+    edge = EntityEdge(
+        source_node_uuid='a',
+        target_node_uuid='b',
+        name='KNOWS',
+        fact='a knows b',
+        group_id='group',
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+    config = SearchConfig(edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]))
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search', AsyncMock(return_value=[edge])
+        ) as fulltext_mock,
+        patch('graphiti_core.search.search.edge_similarity_search') as similarity_mock,
+        patch('graphiti_core.search.search.edge_bfs_search') as bfs_mock,
+    ):
+        results = await search(
+            MagicMock(), embedder, MagicMock(), 'a', ['group'], config, SearchFilters()
+        )
+
+    assert results.edges == [edge]
+    embedder.create.assert_not_awaited()
+    similarity_mock.assert_not_called()
+    bfs_mock.assert_not_called()
+    assert fulltext_mock.call_args.args[-1] == config.limit
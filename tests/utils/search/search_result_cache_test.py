@@ -0,0 +1,110 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_result_cache import SearchResultCache, get_search_key
+
+
+def make_results() -> SearchResults:
+    return SearchResults(edges=[], nodes=[], communities=[])
+
+
+def cache_results(
+    cache: SearchResultCache, query: str, group_ids: list[str] | None
+) -> tuple[str, SearchResults]:
+    key = get_search_key(query, group_ids, SearchConfig(), SearchFilters())
+    results = make_results()
+    cache.set(key, group_ids, cache.get_version(group_ids), results)
+    return key, results
+
+
+def test_writes_invalidate_only_their_groups():
+    cache = SearchResultCache()
+    key, results = cache_results(cache, 'query', ['a', 'b'])
+    other_key, other_results = cache_results(cache, 'query', ['c'])
+    all_groups_key, _ = cache_results(cache, 'query', None)
+
+    assert cache.get(key) is results
+    cache.invalidate(['b'])
+
+    assert cache.get(key) is None
+    assert cache.get(other_key) is other_results
+    # a search across all groups is invalidated by a write to any group
+    assert cache.get(all_groups_key) is None
+
+    cache.invalidate()
+    assert cache.get(other_key) is None
+    assert cache.stats().hits == 2
+
+
+def test_reads_do_not_track_unwritten_groups():
+    cache = SearchResultCache()
+    cache_results(cache, 'query', ['a', 'b'])
+    cache.invalidate(['c'])
+
+    assert cache.get_version(['a']) == (0, 0)
+    assert cache._group_versions == {'c': 1}
+
+
+def test_results_of_search_racing_a_write_are_discarded():
+    cache = SearchResultCache()
+    key = get_search_key('query', ['a'], SearchConfig(), SearchFilters())
+
+    version = cache.get_version(['a'])
+    cache.invalidate(['a'])
+    cache.set(key, ['a'], version, make_results())
+
+    assert cache.get(key) is None
+
+
+def test_search_key_depends_on_config_and_filters():
+    key = get_search_key('query', ['b', 'a'], SearchConfig(), SearchFilters())
+
+    assert key == get_search_key('query', ['a', 'b'], SearchConfig(), SearchFilters())
+    assert key != get_search_key('query', ['a', 'b'], SearchConfig(limit=5), SearchFilters())
+    assert key != get_search_key(
+        'query', ['a', 'b'], SearchConfig(), SearchFilters(node_labels=['Person'])
+    )
+    assert key != get_search_key('query', ['a', 'b'], SearchConfig(), SearchFilters(), 'center')
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_answered_from_cache():
+    cache = SearchResultCache()
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.1, 0.2])
+
+    with (
+        patch('graphiti_core.search.search.edge_fulltext_search', AsyncMock(return_value=[])),
+        patch(
+            'graphiti_core.search.search.edge_similarity_search', AsyncMock(return_value=[])
+        ) as similarity_mock,
+    ):
+        first = await search(
+            MagicMock(),
+            embedder,
+            MagicMock(),
+            'query',
+            ['group'],
+            EDGE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            search_result_cache=cache,
+        )
+        second = await search(
+            MagicMock(),
+            embedder,
+            MagicMock(),
+            'query',
+            ['group'],
+            EDGE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            search_result_cache=cache,
+        )
+
+    assert second is first
+    embedder.create.assert_awaited_once()
+    similarity_mock.assert_awaited_once()
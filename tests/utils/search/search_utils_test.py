@@ -1,10 +1,21 @@
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    edge_fulltext_search_bulk,
+    edge_similarity_search,
+    get_relevant_edges_bulk,
+    get_relevant_nodes_bulk,
+    hybrid_node_search,
+    maximal_marginal_relevance,
+    node_distance_reranker,
+    node_similarity_search,
+)
 
 
 @pytest.mark.asyncio
@@ -166,3 +177,245 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+@pytest.mark.asyncio
+async def test_node_similarity_search_uses_vector_index():
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await node_similarity_search(mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], limit=5)
+
+    query = mock_driver.execute_query.call_args.args[0]
+    kwargs = mock_driver.execute_query.call_args.kwargs
+    assert 'db.index.vector.queryNodes("entity_name_embedding"' in query
+    assert kwargs['limit'] == 5
+    assert kwargs['index_limit'] >= 5
+
+
+@pytest.mark.asyncio
+async def test_node_similarity_search_exact():
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await node_similarity_search(
+        mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], limit=5, exact=True
+    )
+
+    query = mock_driver.execute_query.call_args.args[0]
+    assert 'db.index.vector' not in query
+    assert 'vector.similarity.cosine' in query
+
+
+@pytest.mark.asyncio
+async def test_edge_similarity_search_with_node_constraint_is_exact():
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await edge_similarity_search(mock_driver, [0.1, 0.2, 0.3], None, None, SearchFilters())
+    query = mock_driver.execute_query.call_args.args[0]
+    assert 'db.index.vector.queryRelationships("fact_embedding"' in query
+
+    await edge_similarity_search(mock_driver, [0.1, 0.2, 0.3], 'a', 'b', SearchFilters())
+    query = mock_driver.execute_query.call_args.args[0]
+    assert 'db.index.vector' not in query
+
+
+def make_node_record(search_node_uuid: str, uuid: str, name: str) -> dict:
+    created_at = MagicMock()
+    created_at.to_native.return_value = datetime.now(timezone.utc)
+    return {
+        'search_node_uuid': search_node_uuid,
+        'uuid': uuid,
+        'group_id': '1',
+        'name': name,
+        'name_embedding': [0.1, 0.2, 0.3],
+        'created_at': created_at,
+        'summary': None,
+        'labels': ['Entity'],
+        'attributes': {
+            'uuid': uuid,
+            'name': name,
+            'group_id': '1',
+            'name_embedding': [0.1, 0.2, 0.3],
+            'summary': None,
+            'created_at': created_at,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_nodes_bulk():
+    alice = EntityNode(uuid='a', name='Alice', group_id='1', name_embedding=[0.1, 0.2, 0.3])
+    bob = EntityNode(uuid='b', name='Bob', group_id='1')
+
+    async def execute_query(query, params, **kwargs):
+        if 'db.index.fulltext' in query:
+            assert [n['uuid'] for n in kwargs['search_nodes']] == ['a', 'b']
+            return (
+                [
+                    make_node_record('a', '1', 'Alice'),
+                    make_node_record('b', '2', 'Bob'),
+                    make_node_record('b', '3', 'Bobby'),
+                ],
+                None,
+                None,
+            )
+        # only nodes with an embedding take part in the similarity search
+        assert [n['uuid'] for n in kwargs['search_nodes']] == ['a']
+        return [make_node_record('a', '4', 'Alicia'), make_node_record('a', '1', 'Alice')], None, None
+
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.side_effect = execute_query
+
+    results = await get_relevant_nodes_bulk(mock_driver, SearchFilters(), [alice, bob])
+
+    assert mock_driver.execute_query.call_count == 2
+    assert [node.uuid for node in results[0]] == ['1', '4']
+    assert [node.uuid for node in results[1]] == ['2', '3']
+    assert all(node.summary == '' for result in results for node in result)
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_nodes_bulk_empty():
+    mock_driver = AsyncMock()
+
+    assert await get_relevant_nodes_bulk(mock_driver, SearchFilters(), []) == []
+    mock_driver.execute_query.assert_not_called()
+
+
+def make_edge_record(search_edge_uuid: str, bucket: str, uuid: str) -> dict:
+    created_at = MagicMock()
+    created_at.to_native.return_value = datetime.now(timezone.utc)
+    return {
+        'search_edge_uuid': search_edge_uuid,
+        'bucket': bucket,
+        'uuid': uuid,
+        'group_id': '1',
+        'source_node_uuid': 'a',
+        'target_node_uuid': 'b',
+        'created_at': created_at,
+        'name': 'KNOWS',
+        'fact': 'Alice knows Bob',
+        'fact_embedding': [0.1, 0.2, 0.3],
+        'episodes': [],
+        'expired_at': None,
+        'valid_at': None,
+        'invalid_at': None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_edges_bulk():
+    edges = [
+        EntityEdge(
+            uuid=uuid,
+            source_node_uuid='a',
+            target_node_uuid='b',
+            name='KNOWS',
+            fact='Alice knows Bob',
+            fact_embedding=embedding,
+            group_id='1',
+            created_at=datetime.now(timezone.utc),
+        )
+        for uuid, embedding in [('x', [0.1, 0.2, 0.3]), ('y', None)]
+    ]
+
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.return_value = (
+        [
+            make_edge_record('x', 'related', '1'),
+            make_edge_record('x', 'source', '1'),
+            make_edge_record('x', 'source', '2'),
+            make_edge_record('x', 'target', '1'),
+            make_edge_record('x', 'target', '3'),
+        ],
+        None,
+        None,
+    )
+
+    related_edges, existing_edges = await get_relevant_edges_bulk(mock_driver, edges)
+
+    assert mock_driver.execute_query.call_count == 1
+    assert [e['uuid'] for e in mock_driver.execute_query.call_args.kwargs['edges']] == ['x']
+    assert [[edge.uuid for edge in lst] for lst in related_edges] == [['1'], []]
+    assert [[edge.uuid for edge in lst] for lst in existing_edges] == [['1', '2', '3'], []]
+    # each bucket gets its own instance so resolving one never mutates the other
+    assert related_edges[0][0] is not existing_edges[0][0]
+
+
+def test_maximal_marginal_relevance_penalizes_redundant_candidates():
+    query_vector = [1.0, 0.0, 0.0]
+    candidates = [
+        ('relevant', [1.0, 0.1, 0.0]),
+        ('duplicate', [1.0, 0.1, 0.0]),
+        ('diverse', [0.7, 0.0, 0.7]),
+        # candidates returned by several retrievers are only ranked once
+        ('relevant', [1.0, 0.1, 0.0]),
+    ]
+
+    assert maximal_marginal_relevance(query_vector, candidates, mmr_lambda=0.5) == [
+        'relevant',
+        'diverse',
+        'duplicate',
+    ]
+    assert maximal_marginal_relevance(query_vector, candidates, mmr_lambda=1.0, limit=2) == [
+        'relevant',
+        'duplicate',
+    ]
+    assert maximal_marginal_relevance(query_vector, []) == []
+
+
+def test_maximal_marginal_relevance_handles_missing_embeddings():
+    candidates = [('missing', [0.0] * 1024), ('embedded', [0.0, 1.0])]
+
+    assert maximal_marginal_relevance([0.0, 1.0], candidates, limit=1) == ['embedded']
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_ranks_unreachable_nodes_last():
+    # center - a - b - c, d is not connected
+    adjacency = {
+        'center': ['a'],
+        'a': ['center', 'b'],
+        'b': ['a', 'c'],
+        'c': ['b'],
+    }
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.side_effect = lambda query, frontier_uuids, **kwargs: (
+        [{'uuid': uuid} for frontier in frontier_uuids for uuid in adjacency.get(frontier, [])],
+        None,
+        None,
+    )
+
+    reranked_uuids = await node_distance_reranker(
+        mock_driver, ['d', 'c', 'b', 'center', 'a'], 'center', max_depth=2
+    )
+
+    # c is beyond max_depth, so it ranks with the unreachable d in its original order
+    assert reranked_uuids == ['center', 'a', 'b', 'd', 'c']
+    assert mock_driver.execute_query.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_edge_fulltext_search_bulk_groups_results_by_query():
+    mock_driver = AsyncMock()
+    mock_driver.execute_query.return_value = (
+        [
+            {**make_edge_record('x', 'related', '1'), 'search_index': 0},
+            {**make_edge_record('x', 'related', '2'), 'search_index': 2},
+            {**make_edge_record('x', 'related', '3'), 'search_index': 2},
+        ],
+        None,
+        None,
+    )
+
+    results = await edge_fulltext_search_bulk(
+        mock_driver, ['alice', ' '.join(['word'] * 40), 'bob'], SearchFilters(), ['1']
+    )
+
+    assert mock_driver.execute_query.call_count == 1
+    # queries too long for the fulltext index are not sent to the database
+    search_queries = mock_driver.execute_query.call_args.kwargs['search_queries']
+    assert [search_query['index'] for search_query in search_queries] == [0, 2]
+    assert [[edge.uuid for edge in edges] for edges in results] == [['1'], [], ['2', '3']]
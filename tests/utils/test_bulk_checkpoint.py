@@ -0,0 +1,106 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.errors import CheckpointMismatchError
+from graphiti_core.nodes import EntityNode, EpisodeType
+from graphiti_core.utils.bulk_checkpoint import (
+    BulkCheckpointStore,
+    BulkIngestionStage,
+    DedupedNodes,
+    ResolvedEdges,
+    get_window_fingerprint,
+    run_checkpointed_stage,
+)
+from graphiti_core.utils.bulk_utils import RawEpisode
+
+
+def make_raw_episode(content: str) -> RawEpisode:
+    return RawEpisode(
+        name='episode',
+        content=content,
+        source_description='test',
+        source=EpisodeType.message,
+        reference_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_completed_stage_is_loaded_instead_of_rerun(tmp_path):
+    store = BulkCheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+    node = EntityNode(name='Alice', group_id='group', name_embedding=[0.1, 0.2], labels=['Entity'])
+    output = DedupedNodes(nodes=[node], uuid_map={'duplicate': node.uuid})
+    run = AsyncMock(return_value=output)
+
+    first = await run_checkpointed_stage(
+        store.window('job', 0), BulkIngestionStage.nodes_deduped, DedupedNodes, run
+    )
+    # a restarted job gets a new checkpoint object for the same window
+    resumed = await run_checkpointed_stage(
+        store.window('job', 0), BulkIngestionStage.nodes_deduped, DedupedNodes, run
+    )
+
+    assert first is output
+    run.assert_awaited_once()
+    assert resumed.nodes[0].uuid == node.uuid
+    assert resumed.nodes[0].name_embedding == [0.1, 0.2]
+    assert resumed.nodes[0].created_at == node.created_at
+    assert resumed.uuid_map == {'duplicate': node.uuid}
+    assert await store.completed_stages('job', 0) == [BulkIngestionStage.nodes_deduped]
+    assert await store.completed_stages('job', 1) == []
+
+
+@pytest.mark.asyncio
+async def test_stages_are_scoped_to_job_and_window(tmp_path):
+    store = BulkCheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+    edge = EntityEdge(
+        source_node_uuid='a',
+        target_node_uuid='b',
+        name='KNOWS',
+        fact='a knows b',
+        group_id='group',
+        episodes=['episode'],
+        created_at=datetime.now(timezone.utc),
+    )
+    await store.window('job', 0).save(BulkIngestionStage.edges_dated, ResolvedEdges(edges=[edge]))
+
+    assert await store.window('job', 1).load(BulkIngestionStage.edges_dated, ResolvedEdges) is None
+    assert (
+        await store.window('other', 0).load(BulkIngestionStage.edges_dated, ResolvedEdges) is None
+    )
+
+    await store.delete_job('job')
+    assert await store.window('job', 0).load(BulkIngestionStage.edges_dated, ResolvedEdges) is None
+
+
+@pytest.mark.asyncio
+async def test_resuming_with_different_episodes_raises(tmp_path):
+    store = BulkCheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+    episodes = [make_raw_episode('hello')]
+    checkpoint = store.window('job', 0)
+
+    await checkpoint.start(get_window_fingerprint(episodes, 'group'))
+    await checkpoint.start(get_window_fingerprint(episodes, 'group'))
+
+    with pytest.raises(CheckpointMismatchError):
+        await checkpoint.start(get_window_fingerprint([make_raw_episode('changed')], 'group'))
+    with pytest.raises(CheckpointMismatchError):
+        await checkpoint.start(get_window_fingerprint(episodes, 'other group'))
@@ -0,0 +1,123 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.edges import CommunityEdge
+from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.utils.bulk_utils import (
+    add_communities_bulk_tx,
+    cluster_similar_nodes,
+    compress_nodes,
+    similar_node_pairs,
+)
+
+
+def make_node(name: str, embedding: list[float] | None) -> EntityNode:
+    return EntityNode(name=name, group_id='group', name_embedding=embedding)
+
+
+def make_clustered_nodes(clusters: int, per_cluster: int, dim: int = 16) -> list[EntityNode]:
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(clusters, dim))
+    nodes = []
+    for c in range(clusters):
+        for i in range(per_cluster):
+            embedding = centers[c] + rng.normal(scale=0.01, size=dim)
+            nodes.append(make_node(f'{c}-{i}', (embedding / np.linalg.norm(embedding)).tolist()))
+
+    rng.shuffle(nodes)
+    return nodes
+
+
+def test_similar_node_pairs_returns_nearest_neighbours():
+    nodes = [
+        make_node('a', [1.0, 0.0]),
+        make_node('b', [0.9, 0.1]),
+        make_node('c', [0.0, 1.0]),
+        make_node('d', None),
+    ]
+
+    pairs = similar_node_pairs(nodes, top_k=1)
+
+    assert len(pairs) == 4
+    assert pairs[0][:2] in [(0, 1), (1, 0)]
+    assert all(i != j for i, j, _ in pairs)
+    assert [score for _, _, score in pairs] == sorted(
+        [score for _, _, score in pairs], reverse=True
+    )
+    assert similar_node_pairs(nodes[:1]) == []
+
+
+def test_cluster_similar_nodes_keeps_clusters_together():
+    nodes = make_clustered_nodes(clusters=6, per_cluster=5)
+
+    chunks = cluster_similar_nodes(nodes, chunk_size=10)
+
+    assert sorted(node.uuid for chunk in chunks for node in chunk) == sorted(
+        node.uuid for node in nodes
+    )
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert len(chunks) == 3
+    for chunk in chunks:
+        cluster_ids = {node.name.split('-')[0] for node in chunk}
+        assert all(sum(node.name.startswith(f'{c}-') for node in chunk) == 5 for c in cluster_ids)
+
+
+@pytest.mark.asyncio
+async def test_compress_nodes_keeps_single_node(monkeypatch):
+    node = make_node('a', [1.0, 0.0])
+    dedupe_mock = AsyncMock(side_effect=lambda llm_client, chunk: (chunk, {}))
+    monkeypatch.setattr('graphiti_core.utils.bulk_utils.dedupe_node_list', dedupe_mock)
+
+    compressed_nodes, uuid_map = await compress_nodes(MagicMock(), [node], {})
+
+    assert compressed_nodes == [node]
+    assert uuid_map == {}
+    dedupe_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_add_communities_bulk_tx_writes_in_batches():
+    tx = MagicMock()
+    tx.run = AsyncMock()
+    communities = [
+        CommunityNode(name=f'community {i}', group_id='group', summary='', name_embedding=[1.0])
+        for i in range(5)
+    ]
+    edges = [
+        CommunityEdge(
+            source_node_uuid=community.uuid,
+            target_node_uuid='entity',
+            group_id='group',
+            created_at=community.created_at,
+        )
+        for community in communities
+    ]
+
+    await add_communities_bulk_tx(tx, communities, edges, batch_size=2)
+
+    calls = tx.run.call_args_list
+    assert len(calls) == 6
+    # all community nodes are written before the edges that match on them
+    assert [list(call.args[1].keys())[0] for call in calls] == ['communities'] * 3 + [
+        'community_edges'
+    ] * 3
+    assert [len(list(call.args[1].values())[0]) for call in calls] == [2, 2, 1, 2, 2, 1]
+    assert calls[0].args[1]['communities'][0]['uuid'] == communities[0].uuid
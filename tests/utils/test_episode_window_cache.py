@@ -0,0 +1,123 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.utils.episode_window_cache import EpisodeWindowCache
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_episode(i: int, group_id: str = 'group') -> EpisodicNode:
+    return EpisodicNode(
+        name=f'episode {i}',
+        group_id=group_id,
+        source=EpisodeType.message,
+        source_description='test',
+        content=f'content {i}',
+        valid_at=START + timedelta(hours=i),
+    )
+
+
+def test_get_misses_uncached_group():
+    cache = EpisodeWindowCache()
+
+    assert cache.get('group', START, 3) is None
+    assert cache.stats().misses == 1
+
+
+def test_complete_window_answers_any_query():
+    cache = EpisodeWindowCache(max_episodes=10)
+    episodes = [make_episode(i) for i in range(3)]
+    cache.set_window('group', list(reversed(episodes)), complete=True)
+
+    result = cache.get('group', START + timedelta(hours=1), 5)
+
+    assert [e.uuid for e in result] == [episodes[0].uuid, episodes[1].uuid]
+    # naive reference times are treated as UTC
+    assert len(cache.get('group', datetime(2025, 1, 1), 2)) == 2
+
+
+def test_incomplete_window_misses_when_too_few_episodes():
+    cache = EpisodeWindowCache(max_episodes=3)
+    episodes = [make_episode(i) for i in range(5, 8)]
+    cache.set_window('group', episodes, complete=False)
+
+    assert [e.uuid for e in cache.get('group', START + timedelta(days=1), 2)] == [
+        episodes[1].uuid,
+        episodes[2].uuid,
+    ]
+    # older episodes may exist in the graph, so the window cannot answer this query
+    assert cache.get('group', START + timedelta(hours=5), 2) is None
+
+
+def test_add_episodes_keeps_window_sorted_and_bounded():
+    cache = EpisodeWindowCache(max_episodes=3)
+    cache.set_window('group', [make_episode(1), make_episode(3)], complete=True)
+
+    new_episodes = [make_episode(2), make_episode(4), make_episode(5, group_id='other')]
+    cache.add_episodes(new_episodes)
+
+    result = cache.get('group', START + timedelta(days=1), 3)
+    assert [e.valid_at for e in result] == [START + timedelta(hours=i) for i in (2, 3, 4)]
+    assert 'other' not in cache
+
+    # the oldest episode was trimmed, so the window no longer holds the whole group
+    assert cache.get('group', START + timedelta(days=1), 4) is None
+    # an episode older than an incomplete window would leave a gap and is skipped
+    cache.add_episodes([make_episode(0)])
+    assert cache.stats().episodes == 3
+
+
+@pytest.mark.asyncio
+async def test_retrieve_episodes_loads_group_once(monkeypatch):
+    episodes = [make_episode(i) for i in range(2)]
+    retrieve_mock = AsyncMock(return_value=[episodes])
+    monkeypatch.setattr(
+        'graphiti_core.utils.episode_window_cache.retrieve_episodes_bulk', retrieve_mock
+    )
+    cache = EpisodeWindowCache()
+    driver = MagicMock()
+
+    first = await cache.retrieve_episodes(driver, START + timedelta(days=1), 3, 'group')
+    new_episode = make_episode(2)
+    cache.add_episodes([new_episode])
+    second = await cache.retrieve_episodes(driver, START + timedelta(days=1), 3, 'group')
+
+    assert len(first) == 2
+    assert second[-1].uuid == new_episode.uuid
+    retrieve_mock.assert_awaited_once()
+
+    cache.invalidate('group')
+    await cache.retrieve_episodes(driver, START + timedelta(days=1), 3, 'group')
+    assert retrieve_mock.await_count == 2
+
+
+def test_least_recently_used_groups_are_evicted():
+    cache = EpisodeWindowCache(max_groups=2)
+    for group_id in ['a', 'b']:
+        cache.set_window(group_id, [make_episode(0, group_id)], complete=True)
+
+    cache.get('a', START, 1)
+    cache.set_window('c', [make_episode(0, 'c')], complete=True)
+
+    assert len(cache) == 2
+    assert 'a' in cache
+    assert 'b' not in cache
@@ -0,0 +1,110 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.utils.ingestion_scheduler import IngestionScheduler
+
+
+@pytest.mark.asyncio
+async def test_jobs_within_a_group_run_in_order():
+    scheduler = IngestionScheduler(max_concurrency=4)
+    order: list[int] = []
+
+    def make_job(i: int):
+        async def job():
+            # later jobs finish faster, so only strict ordering keeps them in sequence
+            await asyncio.sleep(0.01 * (5 - i))
+            order.append(i)
+            return i
+
+        return job
+
+    futures = [scheduler.submit('group', make_job(i)) for i in range(5)]
+
+    assert await asyncio.gather(*futures) == [0, 1, 2, 3, 4]
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_groups_run_concurrently_under_global_limit():
+    scheduler = IngestionScheduler(max_concurrency=2)
+    running = 0
+    max_running = 0
+
+    async def job():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for group_id in ['a', 'b', 'c', 'd']:
+        scheduler.submit(group_id, job)
+        scheduler.submit(group_id, job)
+
+    stats = scheduler.stats()
+    assert stats.queue_depth == 8
+    assert stats.active_groups == 4
+
+    await scheduler.join()
+
+    assert max_running == 2
+    assert scheduler.queue_depth() == 0
+    assert scheduler.stats().active_groups == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_stop_the_group():
+    scheduler = IngestionScheduler()
+
+    async def failing_job():
+        raise ValueError('bad episode')
+
+    async def job():
+        return 'ok'
+
+    failed = scheduler.submit('group', failing_job)
+    succeeded = scheduler.submit('group', job)
+
+    with pytest.raises(ValueError):
+        await failed
+    assert await succeeded == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_group_lag_and_stop():
+    scheduler = IngestionScheduler()
+    started = asyncio.Event()
+
+    async def blocking_job():
+        started.set()
+        await asyncio.sleep(10)
+
+    running = scheduler.submit('group', blocking_job)
+    pending = scheduler.submit('group', blocking_job)
+    await started.wait()
+
+    assert scheduler.queue_depth('group') == 2
+    assert scheduler.group_lag('group') > 0
+
+    await scheduler.stop()
+
+    assert running.cancelled()
+    assert pending.cancelled()
+    assert scheduler.queue_depth() == 0